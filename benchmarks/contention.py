@@ -0,0 +1,39 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from tidipy import auto_compose, get_resolver, reset
+
+THREADS = [1, 2, 4, 8]
+NUMBER = 100_000
+
+
+class ConnectionPool:
+    pass
+
+
+def resolve_many(resolver) -> None:
+    for _ in range(NUMBER):
+        resolver(ConnectionPool)
+
+
+def measure(threads: int) -> float:
+    reset()
+    auto_compose(ConnectionPool)
+    resolver = get_resolver()
+    resolver(ConnectionPool)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        for future in [executor.submit(resolve_many, resolver) for _ in range(threads)]:
+            future.result()
+
+    return (time.perf_counter() - start) / (threads * NUMBER)
+
+
+def main():
+    for threads in THREADS:
+        print(f'{threads:>2} threads: {measure(threads) * 1e9:6.0f} ns per resolve of a built singleton')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+import sys
+import timeit
+
+from tidipy import auto_compose, ensure_scope, get_resolver, reset, set_observer, InMemoryAggregator
+from tidipy.resolve_from_dependency_bag import ResolveFromDependencyBag
+
+NUMBER = 200_000
+REPEAT = 15
+MAX_OVERHEAD = 1.15
+
+
+class Settings:
+    pass
+
+
+class Uninstrumented(ResolveFromDependencyBag):
+    def __call__(self, dependency_type, id=None):
+        result = self._dependency_bag.find(dependency_type, id, self)
+        if result is not None:
+            return result
+
+        if self._parent is None:
+            raise Exception(f'No candidate for type {dependency_type}')
+
+        return self._parent(dependency_type, id)
+
+
+def per_call(*functions) -> list[float]:
+    timings = [[] for _ in functions]
+    for _ in range(REPEAT):
+        for function, function_timings in zip(functions, timings):
+            function_timings.append(timeit.timeit(function, number=NUMBER))
+
+    return [min(function_timings) / NUMBER for function_timings in timings]
+
+
+def main():
+    reset()
+    auto_compose(Settings, scope_type='request')
+    ensure_scope('request', scope_type='request')
+    resolver = get_resolver('request')
+    baseline = Uninstrumented(
+        resolver._parent, resolver._dependency_bag, resolver._instrumentation, resolver._chain, resolver._scope
+    )
+    resolver(Settings)
+
+    bare, unobserved = per_call(lambda: baseline(Settings), lambda: resolver(Settings))
+    set_observer(InMemoryAggregator())
+    observed, = per_call(lambda: resolver(Settings))
+    reset()
+
+    print(f'{"uninstrumented":>18}: {bare * 1e9:6.0f} ns per resolve')
+    print(f'{"without observer":>18}: {unobserved * 1e9:6.0f} ns per resolve')
+    print(f'{"with aggregator":>18}: {observed * 1e9:6.0f} ns per resolve')
+
+    if unobserved > bare * MAX_OVERHEAD:
+        print(f'Resolving without an observer is {unobserved / bare:.2f}x uninstrumented, limit is {MAX_OVERHEAD}x')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+import timeit
+from uuid import uuid4
+
+from tidipy import auto_compose, ensure_scope, get_resolver, clear_scope, scope, reset
+
+NUMBER = 100_000
+
+
+class NameSayer:
+    pass
+
+
+def with_ids() -> None:
+    request_id = str(uuid4())
+    ensure_scope(request_id, scope_type='request')
+    get_resolver(request_id)(NameSayer)
+    clear_scope(request_id)
+
+
+def with_block() -> None:
+    with scope('request') as resolver:
+        resolver(NameSayer)
+
+
+def with_parent() -> None:
+    with scope('request', get_resolver()) as resolver:
+        resolver(NameSayer)
+
+
+def main():
+    reset()
+    auto_compose(NameSayer, scope_type='request')
+    for name, request in [('ensure/get/clear', with_ids), ('with scope()', with_block), ('with parent', with_parent)]:
+        seconds = timeit.timeit(request, number=NUMBER) / NUMBER
+        print(f'{name:>16}: {seconds * 1e6:5.2f} us per request scope')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,26 @@
+import timeit
+
+from tidipy import ensure_scope, get_resolver, clear_scope, reset
+
+LIVE_SCOPES = [10, 100, 1_000, 10_000, 100_000]
+NUMBER = 10_000
+
+
+def measure(live_scopes: int) -> float:
+    reset()
+    for i in range(live_scopes):
+        ensure_scope(f'request-{i}', scope_type='request')
+
+    target = f'request-{live_scopes - 1}'
+    seconds = timeit.timeit(lambda: get_resolver(target), number=NUMBER)
+    clear_scope('root')
+    return seconds / NUMBER
+
+
+def main():
+    for live_scopes in LIVE_SCOPES:
+        print(f'{live_scopes:>7} live scopes: {measure(live_scopes) * 1e9:8.0f} ns per get_resolver')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,262 @@
+import argparse
+import inspect
+import json
+import platform
+import subprocess
+import sys
+import timeit
+from datetime import datetime, timezone
+from itertools import count
+from typing import Callable, Optional
+
+from tidipy import auto_compose, ensure_scope, get_resolver, clear_scope, reset
+from tidipy import default_container
+from tidipy.scope_context import ScopeContext
+from tidipy.scope_type import CustomScope
+
+REPEAT = 5
+THRESHOLD = 1.2
+
+_ids = count()
+
+
+def per_call(function: Callable[[], object], number: int) -> float:
+    return min(timeit.repeat(function, number=number, repeat=REPEAT)) / number
+
+
+def per_batch(setup: Callable[[], list], function: Callable[[object], object]) -> float:
+    timings = []
+    for _ in range(REPEAT):
+        items = setup()
+        timings.append(timeit.timeit(lambda: [function(item) for item in items], number=1) / len(items))
+
+    return min(timings)
+
+
+def make_type(name: str, parameter_types: list[type]) -> type:
+    def __init__(self, *args):
+        self.args = args
+
+    return type(name, (), {
+        '__init__': __init__,
+        '__signature__': inspect.Signature([
+            inspect.Parameter(f'p{i}', inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=parameter_type)
+            for i, parameter_type in enumerate(parameter_types)
+        ])
+    })
+
+
+class Service:
+    pass
+
+
+def live_scopes(size: int) -> dict[str, float]:
+    reset()
+    auto_compose(Service, scope_type='request')
+    for i in range(size):
+        ensure_scope(f'live-{i}', scope_type='request')
+
+    target = f'live-{size - 1}'
+    resolver = get_resolver(target)
+    resolver(Service)
+
+    def new_ids() -> list[str]:
+        return [f'new-{next(_ids)}' for _ in range(1_000)]
+
+    def ensured_ids() -> list[str]:
+        ids = new_ids()
+        for scope_id in ids:
+            ensure_scope(scope_id, scope_type='request')
+        return ids
+
+    results = {
+        'ensure_scope': per_batch(new_ids, lambda scope_id: ensure_scope(scope_id, scope_type='request')),
+        'get_resolver': per_call(lambda: get_resolver(target), 10_000),
+        'resolve': per_call(lambda: resolver(Service), 10_000),
+        'clear_scope': per_batch(ensured_ids, clear_scope),
+    }
+    clear_scope('root')
+    return results
+
+
+def depth(size: int) -> dict[str, float]:
+    reset()
+    auto_compose(Service)
+    parent_id = 'root'
+    for level in range(size):
+        ensure_scope(f'level-{level}', scope_type=f'level-{level}', parent_id=parent_id)
+        parent_id = f'level-{level}'
+
+    resolver = get_resolver(parent_id)
+    resolver(Service)
+    results = {'resolve': per_call(lambda: resolver(Service), 10_000)}
+    clear_scope('root')
+    return results
+
+
+def composers(size: int) -> dict[str, float]:
+    reset()
+    types = [make_type(f'Dependency{i}', []) for i in range(size)]
+    for i, dependency_type in enumerate(types):
+        auto_compose(dependency_type, scope_type='request' if i % 2 == 0 else 'session')
+    target = types[0]
+    ensure_scope('request', scope_type='request')
+    resolver = get_resolver('request')
+    resolver(target)
+
+    templates = default_container().repository().get_templates()
+
+    def compile_template() -> None:
+        templates.invalidate()
+        templates.get(CustomScope('request'), ScopeContext.empty())
+
+    results = {
+        'resolve': per_call(lambda: resolver(target), 10_000),
+        'compile': per_call(compile_template, 10),
+    }
+    clear_scope('root')
+    return results
+
+
+def context_keys(size: int) -> dict[str, float]:
+    reset()
+    context = {f'key-{i}': f'value-{i}' for i in range(size)}
+    auto_compose(Service, scope_type='request', **dict(list(context.items())[:1]))
+    ensure_scope('warm', scope_type='request', context=context)
+
+    def churn() -> None:
+        scope_id = f'context-{next(_ids)}'
+        ensure_scope(scope_id, scope_type='request', context=context)
+        clear_scope(scope_id)
+
+    results = {'churn': per_call(churn, 1_000)}
+    clear_scope('root')
+    return results
+
+
+def graph(shape: tuple[int, int]) -> dict[str, float]:
+    width, size = shape
+    reset()
+    layer: list[type] = []
+    for level in range(size):
+        layer = [make_type(f'Node{level}x{i}', layer) for i in range(width)]
+        for node in layer:
+            auto_compose(node, scope_type='request')
+    top = make_type('Top', layer)
+    auto_compose(top, scope_type='request')
+
+    def build() -> None:
+        scope_id = f'graph-{next(_ids)}'
+        ensure_scope(scope_id, scope_type='request')
+        get_resolver(scope_id)(top)
+        clear_scope(scope_id)
+
+    results = {'build': per_call(build, 100)}
+    clear_scope('root')
+    return results
+
+
+BENCHMARKS: dict[str, tuple[Callable, list]] = {
+    'live_scopes': (live_scopes, [10, 100, 1_000, 10_000, 100_000]),
+    'depth': (depth, [1, 2, 4, 8, 16]),
+    'composers': (composers, [10, 100, 1_000, 10_000]),
+    'context_keys': (context_keys, [0, 1, 4, 16]),
+    'graph': (graph, [(1, 1), (4, 4), (16, 4), (4, 16)]),
+}
+
+
+def _format_parameter(parameter) -> str:
+    if isinstance(parameter, tuple):
+        return 'x'.join(str(value) for value in parameter)
+
+    return str(parameter)
+
+
+def _commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(selected: Optional[str]) -> dict:
+    results = {}
+    for name, (benchmark, parameters) in BENCHMARKS.items():
+        if selected is not None and selected not in name:
+            continue
+        for parameter in parameters:
+            for operation, seconds in benchmark(parameter).items():
+                key = f'{name}[{_format_parameter(parameter)}].{operation}'
+                results[key] = seconds
+                print(f'{key:<40} {seconds * 1e9:12.0f} ns')
+    reset()
+
+    return {
+        'meta': {
+            'commit': _commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'created': datetime.now(timezone.utc).isoformat(),
+        },
+        'results': results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> bool:
+    regressed = False
+    print(f'{"benchmark":<40} {"baseline":>12} {"current":>12} {"ratio":>7}')
+    for key, seconds in current['results'].items():
+        base = baseline['results'].get(key)
+        if base is None:
+            print(f'{key:<40} {"-":>12} {seconds * 1e9:12.0f} {"-":>7}')
+            continue
+        ratio = seconds / base
+        marker = ' regressed' if ratio > threshold else ''
+        regressed = regressed or ratio > threshold
+        print(f'{key:<40} {base * 1e9:12.0f} {seconds * 1e9:12.0f} {ratio:7.2f}{marker}')
+
+    return regressed
+
+
+def _load(path: str) -> dict:
+    with open(path) as file:
+        return json.load(file)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark suite for tidipy')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='run the benchmarks')
+    run_parser.add_argument('--filter', help='only run benchmarks whose name contains this')
+    run_parser.add_argument('--output', help='write the results as JSON to this path')
+    run_parser.add_argument('--compare', help='compare the results with this baseline JSON')
+    run_parser.add_argument('--threshold', type=float, default=THRESHOLD)
+
+    compare_parser = commands.add_parser('compare', help='compare two result files')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=THRESHOLD)
+
+    args = parser.parse_args()
+
+    if args.command == 'run':
+        current = run(args.filter)
+        if args.output is not None:
+            with open(args.output, 'w') as file:
+                json.dump(current, file, indent=2)
+        if args.compare is None:
+            return
+        baseline = _load(args.compare)
+    else:
+        baseline = _load(args.baseline)
+        current = _load(args.current)
+
+    if compare(baseline, current, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,9 +1,7 @@
-from uuid import uuid4
-
 from fastapi import FastAPI, Depends
 from starlette.requests import Request
 
-from tidipy import get_resolver, ensure_scope, clear_scope, auto_compose
+from tidipy import scope, auto_compose
 
 
 class NameSayer:
@@ -25,13 +23,9 @@ def di(dependency_type):
 
 @app.middleware("http")
 async def add_request_scope(request: Request, call_next):
-    request_id = str(uuid4())
-    ensure_scope(request_id, scope_type='request')
-    request.state.resolve = get_resolver(request_id)
-    try:
+    async with scope('request') as resolver:
+        request.state.resolve = resolver
         return await call_next(request)
-    finally:
-        clear_scope(request_id)
 
 
 @app.get('/say-my-name')
@@ -1,11 +1,9 @@
 from abc import ABC, abstractmethod
 from typing import Type
-from uuid import uuid4
-
 from fastapi import FastAPI
 from starlette.requests import Request
 
-from tidipy import get_resolver, ensure_scope, clear_scope, auto_compose
+from tidipy import scope, auto_compose
 
 
 class NameSayer:
@@ -44,13 +42,9 @@ app = FastAPI()
 
 @app.middleware("http")
 async def add_request_scope(request: Request, call_next):
-    request_id = str(uuid4())
-    ensure_scope(request_id, scope_type='request')
-    request.state.resolve = get_resolver(request_id)
-    try:
+    async with scope('request') as resolver:
+        request.state.resolve = resolver
         return await call_next(request)
-    finally:
-        clear_scope(request_id)
 
 app.add_api_route(
     path='/say-my-name',
@@ -0,0 +1,111 @@
+import asyncio
+
+from tidipy import composer, Resolver
+
+
+class Database:
+    connections = 0
+
+    def __init__(self):
+        Database.connections += 1
+
+
+class Builds:
+    running = 0
+    peak = 0
+
+
+async def _slow_build() -> None:
+    Builds.running += 1
+    Builds.peak = max(Builds.peak, Builds.running)
+    try:
+        await asyncio.sleep(0.05)
+    finally:
+        Builds.running -= 1
+
+
+class HttpClient:
+    pass
+
+
+class Secrets:
+    pass
+
+
+class Service:
+    def __init__(self, database: Database, http_client: HttpClient, secrets: Secrets):
+        self.database = database
+        self.http_client = http_client
+        self.secrets = secrets
+
+
+class Greeting:
+    def __init__(self, text: str):
+        self.text = text
+
+
+@composer(scope_type='tenant')
+async def database() -> Database:
+    await _slow_build()
+    return Database()
+
+
+@composer(scope_type='tenant')
+async def http_client() -> HttpClient:
+    await _slow_build()
+    return HttpClient()
+
+
+@composer(scope_type='tenant')
+async def secrets() -> Secrets:
+    await _slow_build()
+    return Secrets()
+
+
+@composer(scope_type='tenant')
+async def greeting(resolve: Resolver) -> Greeting:
+    await resolve.aresolve(Database)
+    return Greeting('hello')
+
+
+class Vault:
+    pass
+
+
+class Token:
+    pass
+
+
+class Nonce:
+    pass
+
+
+class Chicken:
+    pass
+
+
+class Egg:
+    pass
+
+
+@composer(scope_type='tenant')
+async def vault() -> Vault:
+    await asyncio.sleep(0.01)
+    raise ValueError('vault is sealed')
+
+
+@composer(scope_type='transient')
+async def nonce() -> Nonce:
+    return Nonce()
+
+
+@composer(scope_type='tenant')
+async def chicken(resolve: Resolver) -> Chicken:
+    await resolve.aresolve(Egg)
+    return Chicken()
+
+
+@composer(scope_type='tenant')
+async def egg(resolve: Resolver) -> Egg:
+    await resolve.aresolve(Chicken)
+    return Egg()
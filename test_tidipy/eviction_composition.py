@@ -0,0 +1,36 @@
+from typing import Iterator
+
+from tidipy import composer
+
+closed: list[str] = []
+
+
+class Tenant:
+    def __init__(self, name: str):
+        self.name = name
+
+
+class Catalog:
+    pass
+
+
+class Report:
+    pass
+
+
+@composer(scope_type='tenant')
+def tenant() -> Iterator[Tenant]:
+    created = Tenant(str(len(closed)))
+    yield created
+    closed.append('tenant')
+
+
+@composer(scope_type='tenant')
+def catalog() -> Catalog:
+    return Catalog()
+
+
+@composer(scope_type='report')
+def report() -> Iterator[Report]:
+    yield Report()
+    closed.append('report')
@@ -0,0 +1,64 @@
+from abc import ABC
+
+from tidipy import composer
+
+
+class Engine:
+    pass
+
+
+class Wheel:
+    pass
+
+
+class Car:
+    def __init__(self, engine: Engine, wheel: Wheel):
+        self.engine = engine
+        self.wheel = wheel
+
+
+class Fuel(ABC):
+    pass
+
+
+class Diesel(Fuel):
+    pass
+
+
+class Petrol(Fuel):
+    pass
+
+
+class FuelTank:
+    def __init__(self, fuel: Fuel):
+        self.fuel = fuel
+
+
+class PetrolPump:
+    def __init__(self, petrol: Petrol):
+        self.petrol = petrol
+
+
+class Driver:
+    def __init__(self, name):
+        self.name = name
+
+
+@composer
+def engine() -> Engine:
+    return Engine()
+
+
+@composer(scope_type='garage')
+def wheel() -> Wheel:
+    return Wheel()
+
+
+@composer(scope_type='garage', fuel='diesel')
+def diesel() -> Diesel:
+    return Diesel()
+
+
+@composer(scope_type='garage', fuel='petrol')
+def petrol() -> Petrol:
+    return Petrol()
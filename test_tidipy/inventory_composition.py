@@ -0,0 +1,12 @@
+class Session:
+    def __init__(self):
+        self.payload = bytearray(4096)
+
+
+class Request:
+    pass
+
+
+class Archive:
+    def __init__(self):
+        self.pages = [[bytearray(1024) for _ in range(4)] for _ in range(4)]
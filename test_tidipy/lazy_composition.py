@@ -0,0 +1,13 @@
+from tidipy import Lazy
+
+
+class Report:
+    built = 0
+
+    def __init__(self):
+        Report.built += 1
+
+
+class Controller:
+    def __init__(self, report: Lazy[Report]):
+        self.report = report
@@ -0,0 +1,27 @@
+from tidipy import Lazy
+
+
+class Clock:
+    pass
+
+
+class Greeter:
+    pass
+
+
+class Stamp:
+    pass
+
+
+class Mailer:
+    def __init__(self):
+        self.sent: list[str] = []
+
+    def reset(self) -> None:
+        self.sent.clear()
+
+
+class Newsletter:
+    def __init__(self, clock: Clock, mailer: Lazy[Mailer]):
+        self.clock = clock
+        self.mailer = mailer
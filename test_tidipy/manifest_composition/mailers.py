@@ -0,0 +1,16 @@
+from tidipy import composer, auto_compose
+from test_tidipy.manifest_composition.domain import Mailer, Greeter, Stamp
+
+
+@composer(id='mailer', scope_type='request', pooled=True, pool_reset=Mailer.reset)
+def mailer() -> Mailer:
+    return Mailer()
+
+
+def make_greeter() -> Greeter:
+    return Greeter()
+
+
+greeter = composer(make_greeter, id='greeter')
+
+auto_compose(Stamp)
@@ -0,0 +1,5 @@
+from tidipy import auto_compose
+from test_tidipy.manifest_composition.domain import Clock, Newsletter
+
+auto_compose(Clock)
+auto_compose(Newsletter, id='newsletter', scope_type='request', language={'en', 'nl'})
@@ -0,0 +1,12 @@
+class Settings:
+    pass
+
+
+class Repository:
+    def __init__(self, settings: Settings):
+        self.settings = settings
+
+
+class Handler:
+    def __init__(self, repository: Repository):
+        self.repository = repository
@@ -0,0 +1,35 @@
+from tidipy import composer
+
+
+class Serializer:
+    def __init__(self):
+        self.buffer: list[str] = []
+        self.resets = 0
+
+    def reset(self) -> None:
+        self.buffer.clear()
+        self.resets += 1
+
+
+class Parser:
+    pass
+
+
+class Buffer:
+    pass
+
+
+@composer(id='serializer', scope_type='request', pooled=True, pool_reset=Serializer.reset)
+def serializer() -> Serializer:
+    return Serializer()
+
+
+@composer(id='parser', scope_type='request', pooled=True, pool_size=1)
+async def parser() -> Parser:
+    return Parser()
+
+
+
+@composer(id='buffer', scope_type='request', pooled=True, pool_size=2)
+def buffer() -> Buffer:
+    return Buffer()
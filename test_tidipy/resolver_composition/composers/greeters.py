@@ -0,0 +1,12 @@
+from test_tidipy.resolver_composition.greeter import VirtualGreeter, PoliteFarewell
+from tidipy import composer
+
+
+@composer
+def virtual_greeter() -> VirtualGreeter:
+    return VirtualGreeter()
+
+
+@composer
+def polite_farewell() -> PoliteFarewell:
+    return PoliteFarewell()
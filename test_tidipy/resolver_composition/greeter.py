@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+
+
+class Greeter(ABC):
+    @abstractmethod
+    def greet(self) -> str:
+        ...
+
+
+class VirtualGreeter:
+    def greet(self) -> str:
+        return 'Hi'
+
+
+Greeter.register(VirtualGreeter)
+
+
+class Farewell:
+    def say(self) -> str:
+        return 'Bye'
+
+
+class PoliteFarewell(Farewell):
+    def say(self) -> str:
+        return 'Goodbye'
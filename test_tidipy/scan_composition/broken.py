@@ -0,0 +1,9 @@
+from tidipy import composer
+
+
+@composer
+def broken() -> int:
+    return 1
+
+
+raise ImportError('broken on purpose')
@@ -0,0 +1,10 @@
+from tidipy import composer as provides
+
+
+class Greeter:
+    pass
+
+
+@provides(id='greeter', scope_type='request')
+def greeter() -> Greeter:
+    return Greeter()
@@ -0,0 +1,8 @@
+import tidipy
+
+
+class Clock:
+    pass
+
+
+tidipy.auto_compose(Clock)
@@ -0,0 +1,72 @@
+from typing import Iterator, AsyncGenerator
+
+from tidipy import composer, Resolver
+
+events: list[str] = []
+
+
+class Connection:
+    pass
+
+
+class Session:
+    def __init__(self, connection: Connection):
+        self.connection = connection
+
+
+class Cursor:
+    pass
+
+
+class Client:
+    pass
+
+
+class Handle:
+    pass
+
+
+class Stubborn:
+    pass
+
+
+class Fragile:
+    pass
+
+
+@composer(scope_type='tenant')
+def connection() -> Connection:
+    events.append('open connection')
+    yield Connection()
+    events.append('close connection')
+
+
+@composer(scope_type='tenant')
+def session(resolve: Resolver) -> Session:
+    events.append('open session')
+    yield Session(resolve(Connection))
+    events.append('close session')
+
+
+@composer(scope_type='request')
+def cursor() -> Iterator[Cursor]:
+    yield Cursor()
+    events.append('close cursor')
+
+
+@composer(scope_type='tenant')
+async def client() -> AsyncGenerator[Client, None]:
+    yield Client()
+    events.append('close client')
+
+
+@composer(scope_type='tenant')
+def stubborn() -> Stubborn:
+    yield Stubborn()
+    yield Stubborn()
+
+
+@composer(scope_type='tenant')
+def fragile() -> Fragile:
+    yield Fragile()
+    raise ValueError('cannot close')
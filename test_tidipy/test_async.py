@@ -0,0 +1,176 @@
+import asyncio
+import threading
+from unittest import IsolatedAsyncioTestCase
+
+from test_tidipy import async_composition
+from test_tidipy.async_composition import Database, Service, Greeting, Vault, Nonce, Chicken, Builds
+from tidipy import scan, reset, ensure_scope, get_resolver, auto_compose, Resolver
+from tidipy.composer import Composer, FactoryKind
+from tidipy.container import default_container
+from tidipy.context_filter import parse_context_filter
+from tidipy.scope_type import parse_scope_type
+
+
+class TestAsync(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        scan(async_composition)
+        Database.connections = 0
+        Builds.peak = 0
+        ensure_scope('tenant', scope_type='tenant')
+        self.resolver = get_resolver('tenant')
+
+    def tearDown(self) -> None:
+        reset()
+
+    async def test_resolve_async_composer(self):
+        result = await self.resolver.aresolve(Greeting)
+
+        self.assertEqual('hello', result.text)
+
+    async def test_async_stored_dependency_is_built_once(self):
+        results = await asyncio.gather(*[self.resolver.aresolve(Database) for _ in range(10)])
+
+        self.assertEqual(1, Database.connections)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    async def test_constructor_arguments_are_built_concurrently(self):
+        auto_compose(Service, scope_type='tenant')
+        ensure_scope('other-tenant', scope_type='tenant')
+        resolver = get_resolver('other-tenant')
+
+        service = await resolver.aresolve(Service)
+
+        self.assertEqual(3, Builds.peak)
+        self.assertIsInstance(service.database, Database)
+
+    async def test_cannot_resolve_async_composer_synchronously(self):
+        with self.assertRaises(Exception):
+            self.resolver(Database)
+
+    async def test_resolve_synchronously_after_async_construction(self):
+        database = await self.resolver.aresolve(Database)
+
+        self.assertIs(database, self.resolver(Database))
+
+    async def test_aresolve_from_parent(self):
+        ensure_scope('request', scope_type='request', parent_id='tenant')
+        resolver = get_resolver('request')
+
+        self.assertIsInstance(await resolver.aresolve(Greeting), Greeting)
+
+    async def test_aresolve_without_candidate(self):
+        with self.assertRaises(Exception):
+            await self.resolver.aresolve(float)
+
+    async def test_construction_error_is_raised_in_all_waiting_tasks(self):
+        results = await asyncio.gather(
+            *[self.resolver.aresolve(Vault) for _ in range(5)],
+            return_exceptions=True
+        )
+
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+
+    async def test_transient_async_dependencies_are_not_stored(self):
+        first = await self.resolver.aresolve(Nonce)
+        second = await self.resolver.aresolve(Nonce)
+
+        self.assertIsNot(first, second)
+
+    async def test_circular_dependency(self):
+        with self.assertRaisesRegex(Exception, 'Circular dependency'):
+            await self.resolver.aresolve(Chicken)
+
+
+class Gate:
+    builds = 0
+    started = threading.Event()
+    release = threading.Event()
+
+
+class Shared:
+    pass
+
+
+def _gated(resolver: Resolver) -> Shared:
+    Gate.builds += 1
+    Gate.started.set()
+    Gate.release.wait(5)
+    return Shared()
+
+
+class AsyncGate:
+    builds = 0
+    started: asyncio.Event
+    release: asyncio.Event
+
+
+async def _agated(resolver: Resolver) -> Shared:
+    AsyncGate.builds += 1
+    AsyncGate.started.set()
+    await AsyncGate.release.wait()
+    return Shared()
+
+
+class TestSyncAndAsyncSingleFlight(IsolatedAsyncioTestCase):
+    def tearDown(self) -> None:
+        reset()
+
+    async def test_aresolve_waits_for_build_on_other_thread(self):
+        Gate.builds = 0
+        Gate.started.clear()
+        Gate.release.clear()
+        default_container().register(Composer('shared', parse_scope_type('tenant'), parse_context_filter(), _gated, Shared))
+        ensure_scope('tenant', scope_type='tenant')
+        resolver = get_resolver('tenant')
+        results = []
+        thread = threading.Thread(target=lambda: results.append(resolver(Shared)))
+        thread.start()
+        await asyncio.get_running_loop().run_in_executor(None, Gate.started.wait, 5)
+
+        waiting = asyncio.ensure_future(resolver.aresolve(Shared))
+        await asyncio.sleep(0)
+        Gate.release.set()
+        shared = await waiting
+        thread.join()
+
+        self.assertEqual(1, Gate.builds)
+        self.assertIs(results[0], shared)
+
+    async def test_resolve_on_other_thread_waits_for_async_build(self):
+        AsyncGate.builds = 0
+        AsyncGate.started = asyncio.Event()
+        AsyncGate.release = asyncio.Event()
+        default_container().register(Composer(
+            'shared', parse_scope_type('tenant'), parse_context_filter(), _agated, Shared, FactoryKind.ASYNC
+        ))
+        ensure_scope('tenant', scope_type='tenant')
+        resolver = get_resolver('tenant')
+        building = asyncio.ensure_future(resolver.aresolve(Shared))
+        await AsyncGate.started.wait()
+
+        waiting = asyncio.get_running_loop().run_in_executor(None, resolver, Shared)
+        await asyncio.sleep(0.01)
+        AsyncGate.release.set()
+
+        self.assertIs(await building, await waiting)
+        self.assertEqual(1, AsyncGate.builds)
+
+    async def test_resolve_on_loop_thread_during_async_build(self):
+        AsyncGate.builds = 0
+        AsyncGate.started = asyncio.Event()
+        AsyncGate.release = asyncio.Event()
+        default_container().register(Composer(
+            'shared', parse_scope_type('tenant'), parse_context_filter(), _agated, Shared, FactoryKind.ASYNC
+        ))
+        ensure_scope('tenant', scope_type='tenant')
+        resolver = get_resolver('tenant')
+        building = asyncio.ensure_future(resolver.aresolve(Shared))
+        await AsyncGate.started.wait()
+
+        with self.assertRaises(Exception) as context:
+            resolver(Shared)
+        AsyncGate.release.set()
+        await building
+
+        self.assertEqual('Composer shared is being built by aresolve on this thread, use aresolve to wait for it',
+                         str(context.exception))
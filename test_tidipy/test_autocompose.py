@@ -1,8 +1,10 @@
 from unittest import TestCase
+from unittest.mock import patch
 
 from test_tidipy import autocompose_composition
 from test_tidipy.autocompose_composition import PointWrapper, Point, PointWrapperWrapper, EmptyInit, UnTypedInit
 from tidipy import scan, get_resolver, reset, auto_compose, ensure_scope
+from tidipy.candidate_index import CandidateIndex
 
 
 class TestAutoCompose(TestCase):
@@ -29,6 +31,15 @@ class TestAutoCompose(TestCase):
             resolver(PointWrapperWrapper)
         self.assertEqual(PointWrapper(point=Point(x=3, y=4)), tenant_resolver(PointWrapperWrapper).point_wrapper)
 
+    def test_auto_compose_after_creating_scope_of_same_type(self):
+        ensure_scope('tenant-a', scope_type='tenant')
+        auto_compose(PointWrapperWrapper, scope_type='tenant')
+        ensure_scope('tenant-b', scope_type='tenant')
+
+        result = get_resolver('tenant-b')(PointWrapperWrapper)
+
+        self.assertEqual(PointWrapper(point=Point(x=3, y=4)), result.point_wrapper)
+
     def test_auto_compose_with_id(self):
         auto_compose(PointWrapper, id='auto-composed')
         resolver = get_resolver()
@@ -72,3 +83,37 @@ class TestAutoCompose(TestCase):
         resolver = get_resolver()
         with self.assertRaises(Exception):
             resolver(UnTypedInit)
+        with self.assertRaises(Exception):
+            resolver(UnTypedInit)
+
+    def test_auto_compose_transient_builds_new_instances(self):
+        auto_compose(PointWrapperWrapper, scope_type='transient')
+        resolver = get_resolver()
+
+        first = resolver(PointWrapperWrapper)
+        second = resolver(PointWrapperWrapper)
+
+        self.assertIsNot(first, second)
+        self.assertIs(first.point_wrapper, second.point_wrapper)
+
+    def test_compiled_plan_skips_candidate_lookup(self):
+        auto_compose(PointWrapperWrapper, scope_type='transient')
+        resolver = get_resolver()
+        resolver(PointWrapperWrapper)
+
+        with patch.object(CandidateIndex, 'find', autospec=True, side_effect=CandidateIndex.find) as find:
+            resolver(PointWrapperWrapper)
+
+        self.assertEqual([PointWrapperWrapper], [call.args[1] for call in find.call_args_list])
+
+    def test_compiled_plan_follows_new_composers(self):
+        auto_compose(PointWrapperWrapper, scope_type='transient')
+        ensure_scope('tenant-a', scope_type='tenant')
+        resolver = get_resolver('tenant-a')
+        before = resolver(PointWrapperWrapper)
+
+        auto_compose(PointWrapper, id='tenant-point', scope_type='tenant')
+        after = resolver(PointWrapperWrapper)
+
+        self.assertEqual(PointWrapper(point=Point(x=3, y=4)), before.point_wrapper)
+        self.assertEqual(PointWrapper(point=Point(x=1, y=2)), after.point_wrapper)
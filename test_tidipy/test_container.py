@@ -0,0 +1,87 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from test_tidipy import scan_composition
+from tidipy import Container, reset, get_resolver, composer, current_resolver
+
+CLOCKS = 'test_tidipy.scan_composition.nested.clocks'
+
+
+class Greeting:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class Greeter:
+    def __init__(self, greeting: Greeting):
+        self.greeting = greeting
+
+
+@composer
+def english() -> Greeting:
+    return Greeting('hello')
+
+
+@composer
+def dutch() -> Greeting:
+    return Greeting('hallo')
+
+
+class TestContainer(TestCase):
+    def setUp(self) -> None:
+        self.english = Container()
+        self.english.register(english)
+        self.english.auto_compose(Greeter, scope_type='request')
+        self.dutch = Container()
+        self.dutch.register(dutch)
+        self.dutch.auto_compose(Greeter, scope_type='request')
+
+    def tearDown(self) -> None:
+        reset()
+
+    def test_containers_are_isolated(self):
+        self.english.ensure_scope('request', scope_type='request')
+        self.dutch.ensure_scope('request', scope_type='request')
+
+        self.assertEqual('hello', self.english.get_resolver('request')(Greeter).greeting.text)
+        self.assertEqual('hallo', self.dutch.get_resolver('request')(Greeter).greeting.text)
+        with self.assertRaises(Exception):
+            get_resolver()(Greeting)
+
+    def test_reset_does_not_affect_other_containers(self):
+        self.english.reset()
+
+        self.assertEqual('hallo', self.dutch.get_resolver()(Greeting).text)
+
+    def test_scope_blocks_stay_in_their_container(self):
+        with self.english.scope('request') as english_resolver:
+            with self.dutch.scope('request') as dutch_resolver:
+                self.assertEqual('hallo', dutch_resolver(Greeter).greeting.text)
+                self.assertIs(dutch_resolver, self.dutch.current_resolver())
+                self.assertIs(get_resolver(), current_resolver())
+            self.assertIs(english_resolver, self.english.current_resolver())
+
+        self.assertIs(self.english.get_resolver(), self.english.current_resolver())
+
+    def test_frozen_container_is_shared_between_threads(self):
+        self.english.freeze()
+
+        def request(number: int) -> str:
+            with self.english.scope('request') as resolver:
+                return resolver(Greeter).greeting.text
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            texts = list(executor.map(request, range(100)))
+
+        self.assertEqual(['hello'] * 100, texts)
+
+    def test_scan_registers_module_level_auto_compose_in_scanning_container(self):
+        sys.modules.pop(CLOCKS, None)
+
+        self.english.scan(scan_composition, static=True, cache=False, max_workers=2)
+
+        clock_type = sys.modules[CLOCKS].Clock
+        self.assertIsInstance(self.english.get_resolver()(clock_type), clock_type)
+        with self.assertRaises(Exception):
+            get_resolver()(clock_type)
@@ -0,0 +1,149 @@
+import threading
+from unittest import TestCase
+
+from test_tidipy import eviction_composition
+from test_tidipy.eviction_composition import Tenant, Catalog, Report, closed
+from test_tidipy.fake_clock import FakeClock
+from tidipy import Container
+
+
+class TestEviction(TestCase):
+    def setUp(self) -> None:
+        closed.clear()
+        self.clock = FakeClock()
+        self.container = Container(clock=self.clock)
+        self.container.scan(eviction_composition)
+
+    def tearDown(self) -> None:
+        self.container.reset()
+
+    def registered(self) -> set[str]:
+        root = self.container._root.get()
+        return {scope_id for scope_id in ['tenant-a', 'tenant-b', 'tenant-c', 'report'] if root.find_scope(scope_id)}
+
+    def test_least_recently_used_scope_is_evicted(self):
+        self.container.set_eviction_policy('tenant', max_scopes=2)
+        self.container.ensure_scope('tenant-a', scope_type='tenant')
+        self.container.ensure_scope('tenant-b', scope_type='tenant')
+        self.clock.advance(1)
+        self.container.get_resolver('tenant-a')(Tenant)
+
+        self.container.ensure_scope('tenant-c', scope_type='tenant')
+
+        self.assertEqual({'tenant-a', 'tenant-c'}, self.registered())
+
+    def test_idle_scope_is_evicted_with_its_subtree(self):
+        self.container.set_eviction_policy('tenant', ttl=10)
+        self.container.ensure_scope('tenant-a', scope_type='tenant')
+        self.container.get_resolver('tenant-a')(Tenant)
+        self.container.ensure_scope('report', scope_type='report', parent_id='tenant-a')
+        self.container.get_resolver('report')(Report)
+        self.clock.advance(11)
+
+        self.assertEqual(1, self.container.evict_idle())
+
+        self.assertEqual(set(), self.registered())
+        self.assertEqual(['report', 'tenant'], closed)
+
+    def test_resolving_keeps_scope_alive(self):
+        self.container.set_eviction_policy('tenant', ttl=10)
+        self.container.ensure_scope('tenant-a', scope_type='tenant')
+        for _ in range(4):
+            self.clock.advance(6)
+            self.container.get_resolver('tenant-a')(Tenant)
+
+        self.assertEqual(0, self.container.evict_idle())
+
+    def test_resolving_from_child_keeps_parent_alive(self):
+        self.container.set_eviction_policy('tenant', ttl=10)
+        self.container.ensure_scope('tenant-a', scope_type='tenant')
+        self.container.ensure_scope('report', scope_type='report', parent_id='tenant-a')
+        for _ in range(4):
+            self.clock.advance(6)
+            self.container.get_resolver('report')(Catalog)
+
+        self.assertEqual(0, self.container.evict_idle())
+
+    def test_child_resolving_its_own_dependencies_keeps_parent_alive(self):
+        self.container.set_eviction_policy('tenant', ttl=10)
+        self.container.ensure_scope('tenant-a', scope_type='tenant')
+        self.container.ensure_scope('report', scope_type='report', parent_id='tenant-a')
+        for _ in range(4):
+            self.clock.advance(6)
+            self.container.get_resolver('report')(Report)
+
+        self.assertEqual(0, self.container.evict_idle())
+
+    def test_ending_a_child_scope_counts_as_activity(self):
+        self.container.set_eviction_policy('tenant', ttl=10)
+        self.container.ensure_scope('tenant-a', scope_type='tenant')
+        self.container.ensure_scope('report', scope_type='report', parent_id='tenant-a')
+        self.clock.advance(9)
+        self.container.clear_scope('report')
+        self.clock.advance(9)
+
+        self.assertEqual(0, self.container.evict_idle())
+
+    def test_existing_scopes_are_not_swept_by_ensure_scope(self):
+        self.container.set_eviction_policy('tenant', ttl=10)
+        self.container.ensure_scope('tenant-a', scope_type='tenant')
+        self.container.ensure_scope('tenant-b', scope_type='tenant')
+        self.clock.advance(11)
+
+        self.container.ensure_scope('report', scope_type='report', parent_id='tenant-b')
+
+        self.assertEqual({'tenant-a', 'tenant-b', 'report'}, self.registered())
+
+    def test_new_scope_evicts_expired_scopes_of_its_type(self):
+        self.container.set_eviction_policy('tenant', ttl=10)
+        self.container.ensure_scope('tenant-a', scope_type='tenant')
+        self.clock.advance(11)
+
+        self.container.ensure_scope('tenant-b', scope_type='tenant')
+
+        self.assertEqual({'tenant-b'}, self.registered())
+
+    def test_periodic_sweep(self):
+        self.container.set_eviction_policy('tenant', ttl=10)
+        self.container.ensure_scope('tenant-a', scope_type='tenant')
+        self.clock.advance(11)
+        swept = threading.Event()
+        eviction = self.container._root._eviction
+        evict = eviction.evict
+        eviction.evict = lambda scope_type=None: (evict(scope_type), swept.set())[0]
+        sweeper = self.container.evict_idle_every(0.001)
+        try:
+            self.assertTrue(swept.wait(1))
+        finally:
+            sweeper.stop()
+
+        self.assertEqual(set(), self.registered())
+
+    def test_instance_budget(self):
+        self.container.set_eviction_policy('tenant', max_instances=3)
+        self.container.ensure_scope('tenant-a', scope_type='tenant')
+        self.container.get_resolver('tenant-a')(Tenant)
+        self.container.get_resolver('tenant-a')(Catalog)
+        self.container.ensure_scope('tenant-b', scope_type='tenant')
+        self.clock.advance(1)
+        self.container.get_resolver('tenant-b')(Tenant)
+
+        self.container.get_resolver('tenant-b')(Catalog)
+
+        self.assertEqual({'tenant-b'}, self.registered())
+        self.assertEqual(['tenant'], closed)
+
+    def test_cleared_scopes_are_forgotten(self):
+        self.container.set_eviction_policy('tenant', max_scopes=1)
+        self.container.ensure_scope('tenant-a', scope_type='tenant')
+        self.container.clear_scope('tenant-a')
+        self.container.ensure_scope('tenant-b', scope_type='tenant')
+
+        self.assertEqual({'tenant-b'}, self.registered())
+
+    def test_no_policy(self):
+        self.container.ensure_scope('tenant-a', scope_type='tenant')
+        self.container.ensure_scope('tenant-b', scope_type='tenant')
+
+        self.assertEqual(0, self.container.evict_idle())
+        self.assertEqual({'tenant-a', 'tenant-b'}, self.registered())
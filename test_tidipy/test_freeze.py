@@ -0,0 +1,146 @@
+import gc
+import weakref
+from unittest import TestCase
+
+from test_tidipy import freeze_composition
+from test_tidipy.freeze_composition import Car, Engine, FuelTank, Diesel, Driver, Wheel, PetrolPump
+from tidipy import scan, reset, freeze, auto_compose, ensure_scope, get_resolver, default_container
+from tidipy.scope_context import ScopeContext
+from tidipy.scope_template import MAX_RECENT_TEMPLATES
+from tidipy.scope_type import CustomScope
+
+
+class Badge:
+    pass
+
+
+class TestFreeze(TestCase):
+    def setUp(self) -> None:
+        scan(freeze_composition)
+
+    def tearDown(self) -> None:
+        reset()
+
+    def test_freeze_valid_composition(self):
+        auto_compose(Car, scope_type='garage')
+        freeze()
+
+        ensure_scope('garage', scope_type='garage', context={'fuel': 'diesel'})
+        resolver = get_resolver('garage')
+
+        self.assertIsInstance(resolver(Car).engine, Engine)
+        self.assertIsInstance(resolver(Diesel), Diesel)
+
+    def test_cannot_add_composer_after_freezing(self):
+        freeze()
+
+        with self.assertRaises(Exception):
+            auto_compose(Car, scope_type='garage')
+
+    def test_can_add_composer_after_reset(self):
+        freeze()
+        reset()
+
+        try:
+            auto_compose(Car, scope_type='garage')
+        except Exception:
+            self.fail()
+
+    def test_freeze_reports_untyped_parameter(self):
+        auto_compose(Driver)
+
+        with self.assertRaisesRegex(Exception, 'untyped parameter: name'):
+            freeze()
+
+    def test_freeze_reports_missing_dependency(self):
+        auto_compose(Car)
+
+        with self.assertRaisesRegex(Exception, 'No candidate'):
+            freeze()
+
+    def test_freeze_reports_all_errors(self):
+        auto_compose(Car)
+        auto_compose(Driver)
+
+        with self.assertRaises(Exception) as context:
+            freeze()
+
+        self.assertIn('No candidate', str(context.exception))
+        self.assertIn('untyped parameter', str(context.exception))
+
+    def test_freeze_reports_ambiguous_dependency(self):
+        auto_compose(Diesel, id='other-diesel', scope_type='garage', fuel='diesel')
+        auto_compose(FuelTank, scope_type='garage')
+
+        with self.assertRaisesRegex(Exception, 'More than 1 candidate'):
+            freeze()
+
+    def test_freeze_reports_ambiguity_in_context_without_filter_key(self):
+        auto_compose(FuelTank, scope_type='garage')
+
+        with self.assertRaisesRegex(Exception, 'context {}: More than 1 candidate'):
+            freeze()
+
+    def test_freeze_reports_dependency_only_in_other_context_of_same_scope_type(self):
+        auto_compose(PetrolPump, scope_type='garage', fuel='diesel')
+
+        with self.assertRaisesRegex(Exception, "context {'fuel': 'diesel'}: No candidate"):
+            freeze()
+
+    def test_freeze_only_checks_context_keys_that_separate_candidates(self):
+        auto_compose(PetrolPump, scope_type='garage', fuel='diesel')
+        for region in range(51):
+            for size in range(6):
+                auto_compose(Badge, id=f'badge-{region}-{size}', scope_type='garage', region=str(region), size=str(size))
+
+        with self.assertRaises(Exception) as context:
+            freeze()
+
+        errors = str(context.exception).splitlines()[1:]
+        self.assertEqual(1, len(errors))
+        self.assertIn("context {'fuel': 'diesel'}: No candidate", errors[0])
+
+    def test_validated_templates_stay_cached_after_freezing(self):
+        auto_compose(Car, scope_type='garage')
+        freeze()
+        templates = default_container().repository().get_templates()
+        template = weakref.ref(templates.get(CustomScope('garage'), ScopeContext.empty()))
+        for tenant in range(MAX_RECENT_TEMPLATES + 1):
+            templates.get(CustomScope('tenant'), ScopeContext({'tenant': str(tenant)}))
+        gc.collect()
+
+        self.assertIsNotNone(template())
+
+    def test_freeze_accepts_dependency_from_other_scope_type(self):
+        auto_compose(Car, scope_type='parking')
+        try:
+            freeze()
+        except Exception:
+            self.fail()
+
+    def test_freeze_accepts_transient_depending_on_scoped_dependency(self):
+        auto_compose(Car, scope_type='transient')
+        try:
+            freeze()
+        except Exception:
+            self.fail()
+
+    def test_freeze_twice(self):
+        freeze()
+        try:
+            freeze()
+        except Exception:
+            self.fail()
+
+    def test_scan_again_after_freezing(self):
+        freeze()
+        try:
+            scan(freeze_composition)
+        except Exception:
+            self.fail()
+
+    def test_resolve_after_freezing(self):
+        freeze()
+        ensure_scope('garage', scope_type='garage')
+
+        self.assertIsInstance(get_resolver('garage')(Wheel), Wheel)
@@ -0,0 +1,72 @@
+import gc
+import weakref
+from unittest import TestCase
+
+from test_tidipy import scope_composition, teardown_composition
+from test_tidipy.scope_composition import User, Animal
+from test_tidipy.teardown_composition import Session
+from tidipy import scan, reset, ensure_scope, get_resolver, clear_scope, scope, freeze_root
+
+
+class TestGarbage(TestCase):
+    def setUp(self) -> None:
+        scan(scope_composition)
+        scan(teardown_composition)
+        gc.collect()
+        gc.disable()
+
+    def tearDown(self) -> None:
+        gc.enable()
+        reset()
+
+    def test_cleared_scope_is_freed_without_garbage_collector(self):
+        ensure_scope('request', scope_type='request')
+        user = weakref.ref(get_resolver('request')(User))
+        clear_scope('request')
+
+        self.assertIsNone(user())
+
+    def test_cleared_subtree_is_freed_without_garbage_collector(self):
+        ensure_scope('tenant', scope_type='tenant')
+        ensure_scope('request', scope_type='request', parent_id='tenant')
+        animal = weakref.ref(get_resolver('tenant')(Animal))
+        user = weakref.ref(get_resolver('request')(User))
+        session = weakref.ref(get_resolver('tenant')(Session))
+        clear_scope('tenant')
+
+        self.assertIsNone(animal())
+        self.assertIsNone(user())
+        self.assertIsNone(session())
+
+    def test_scope_block_is_freed_without_garbage_collector(self):
+        with scope('tenant'):
+            with scope('request') as resolver:
+                user = weakref.ref(resolver(User))
+            del resolver
+
+        self.assertIsNone(user())
+
+    def test_cleared_scopes_leave_no_garbage(self):
+        gc.set_debug(gc.DEBUG_SAVEALL)
+        try:
+            for i in range(10):
+                ensure_scope(f'tenant-{i}', scope_type='tenant')
+                ensure_scope(f'request-{i}', scope_type='request', parent_id=f'tenant-{i}')
+                get_resolver(f'request-{i}')(User)
+                get_resolver(f'tenant-{i}')(Session)
+                clear_scope(f'tenant-{i}')
+            gc.collect()
+            garbage = [item for item in gc.garbage if type(item).__module__.startswith('tidipy')]
+        finally:
+            gc.set_debug(0)
+            gc.garbage.clear()
+
+        self.assertEqual([], garbage)
+
+    def test_freeze_root(self):
+        get_resolver()
+        try:
+            freeze_root()
+            self.assertGreater(gc.get_freeze_count(), 0)
+        finally:
+            gc.unfreeze()
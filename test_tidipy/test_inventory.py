@@ -0,0 +1,152 @@
+import warnings
+from unittest import TestCase
+
+from test_tidipy.fake_clock import FakeClock
+from test_tidipy.inventory_composition import Session, Request, Archive
+from tidipy import reset, auto_compose, ensure_scope, get_resolver, clear_scope, inventory, ScopeLeakWarning, Container
+from tidipy.inventory import retained_size
+
+
+def compose() -> None:
+    auto_compose(Session, id='session', scope_type='session')
+    auto_compose(Request, id='request', scope_type='request')
+
+
+class TestInventory(TestCase):
+    def setUp(self) -> None:
+        compose()
+        ensure_scope('session', scope_type='session')
+
+    def tearDown(self) -> None:
+        reset()
+
+    def test_counts_by_type_and_parent(self):
+        ensure_scope('request-1', scope_type='request', parent_id='session')
+        ensure_scope('request-2', scope_type='request', parent_id='session')
+
+        report = inventory()
+
+        self.assertEqual({'root': 1, 'session': 1, 'request': 2}, report.by_type)
+        self.assertEqual({'root': 1, 'session': 2}, report.by_parent)
+        self.assertEqual(2, report.ages['request'].count)
+
+    def test_cleared_scopes_are_not_reported(self):
+        ensure_scope('request-1', scope_type='request', parent_id='session')
+        clear_scope('request-1')
+
+        self.assertEqual({'root': 1, 'session': 1}, inventory().by_type)
+
+    def test_stored_instances_and_retained_size(self):
+        get_resolver('session')(Session)
+
+        session = next(info for info in inventory().scopes if info.scope_id == 'session')
+
+        self.assertEqual(1, session.instances)
+        self.assertGreater(session.retained_size, 4096)
+
+    def test_retained_size_follows_nested_references(self):
+        archive = Archive()
+
+        self.assertGreater(retained_size([archive]), 16 * 1024)
+
+    def test_retained_size_is_capped(self):
+        archive = Archive()
+
+        self.assertLess(retained_size([archive], depth=1), 1024)
+        self.assertLess(retained_size([archive], max_objects=4), 16 * 1024)
+
+    def test_oldest_scopes_come_first(self):
+        ensure_scope('request-1', scope_type='request', parent_id='session')
+
+        self.assertEqual(['root', 'session'], [info.scope_id for info in inventory().oldest(2)])
+
+
+class TestLeakDetector(TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.container = Container(clock=self.clock)
+        self.container.auto_compose(Session, id='session', scope_type='session')
+        self.container.auto_compose(Request, id='request', scope_type='request')
+        self.container.ensure_scope('session', scope_type='session')
+
+    def tearDown(self) -> None:
+        self.container.reset()
+
+    def open_request(self, request_id: str) -> None:
+        self.container.ensure_scope(request_id, scope_type='request', parent_id='session')
+
+    def test_warns_about_scopes_outliving_threshold(self):
+        self.container.detect_leaks('request', max_age=10)
+        self.open_request('request-1')
+        self.clock.advance(11)
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            self.open_request('request-2')
+
+        self.assertEqual(1, len(caught))
+        self.assertIs(ScopeLeakWarning, caught[0].category)
+        self.assertIn('request-1', str(caught[0].message))
+
+    def test_inventory_ages_use_the_container_clock(self):
+        self.container.detect_leaks('request', max_age=10)
+        self.open_request('request-1')
+        self.clock.advance(11)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            leaks = self.container.check_leaks()
+        ages = {info.scope_id: info.age for info in self.container.inventory().scopes}
+
+        self.assertEqual(leaks[0].age, ages['request-1'])
+
+    def test_scope_within_threshold_is_not_a_leak(self):
+        self.container.detect_leaks('request', max_age=10)
+        self.open_request('request-1')
+        self.clock.advance(9)
+
+        self.assertEqual([], self.container.check_leaks())
+
+    def test_reports_where_scope_was_created(self):
+        self.container.detect_leaks('request', max_age=10)
+        self.open_request('request-1')
+        self.clock.advance(11)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            leaks = self.container.check_leaks()
+
+        self.assertEqual(['request-1'], [leak.scope_id for leak in leaks])
+        self.assertEqual(11, leaks[0].age)
+        self.assertIn('open_request', ''.join(leaks[0].created_at))
+        self.assertNotIn('tidipy/scope.py', ''.join(leaks[0].created_at))
+
+    def test_leak_is_warned_once_and_forgotten_when_cleared(self):
+        self.container.detect_leaks('request', max_age=10)
+        self.open_request('request-1')
+        self.clock.advance(11)
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            self.container.check_leaks()
+            self.container.check_leaks()
+            self.container.clear_scope('request-1')
+            leaks = self.container.check_leaks()
+
+        self.assertEqual(1, len(caught))
+        self.assertEqual([], leaks)
+
+    def test_other_scope_types_are_not_watched(self):
+        self.container.detect_leaks('request', max_age=10)
+        self.container.ensure_scope('session-2', scope_type='session')
+        self.clock.advance(11)
+
+        self.assertEqual([], self.container.check_leaks())
+
+    def test_detection_can_be_disabled(self):
+        self.container.detect_leaks('request', max_age=10)
+        self.container.detect_leaks('request', max_age=None)
+        self.open_request('request-1')
+        self.clock.advance(11)
+
+        self.assertEqual([], self.container.check_leaks())
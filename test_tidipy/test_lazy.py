@@ -0,0 +1,65 @@
+from unittest import TestCase, IsolatedAsyncioTestCase
+
+from test_tidipy.lazy_composition import Report, Controller
+from tidipy import reset, auto_compose, ensure_scope, get_resolver, clear_scope, freeze
+
+
+class TestLazy(TestCase):
+    def setUp(self) -> None:
+        Report.built = 0
+        auto_compose(Report, scope_type='request')
+        auto_compose(Controller, scope_type='request')
+        ensure_scope('request', scope_type='request')
+        self.resolver = get_resolver('request')
+
+    def tearDown(self) -> None:
+        reset()
+
+    def test_dependency_is_not_built_eagerly(self):
+        self.resolver(Controller)
+
+        self.assertEqual(0, Report.built)
+
+    def test_dependency_is_built_on_first_use(self):
+        controller = self.resolver(Controller)
+
+        report = controller.report.get()
+
+        self.assertIs(report, self.resolver(Report))
+        self.assertIs(report, controller.report.get())
+        self.assertEqual(1, Report.built)
+
+    def test_cannot_use_lazy_dependency_after_clearing_scope(self):
+        controller = self.resolver(Controller)
+        del self.resolver
+        clear_scope('request')
+
+        with self.assertRaises(Exception):
+            controller.report.get()
+
+    def test_freeze_with_lazy_dependency(self):
+        try:
+            freeze()
+        except Exception:
+            self.fail()
+
+
+class TestAsyncLazy(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        Report.built = 0
+        auto_compose(Report, scope_type='request')
+        auto_compose(Controller, scope_type='request')
+        ensure_scope('request', scope_type='request')
+        self.resolver = get_resolver('request')
+
+    def tearDown(self) -> None:
+        reset()
+
+    async def test_async_lazy_dependency(self):
+        controller = await self.resolver.aresolve(Controller)
+        self.assertEqual(0, Report.built)
+
+        report = await controller.report.aget()
+
+        self.assertIs(report, await controller.report.aget())
+        self.assertEqual(1, Report.built)
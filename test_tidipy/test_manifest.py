@@ -0,0 +1,118 @@
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from test_tidipy import manifest_composition
+from test_tidipy.manifest_composition.domain import Newsletter, Mailer, Greeter, Stamp
+from tidipy import Container, reset, scan, export_manifest, load_manifest, ensure_scope, get_resolver, composer, default_container
+
+WIRING = 'test_tidipy.manifest_composition.wiring'
+MAILERS = 'test_tidipy.manifest_composition.mailers'
+
+
+class TestManifest(TestCase):
+    def setUp(self) -> None:
+        sys.modules.pop(WIRING, None)
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / 'manifest.json'
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+        reset()
+
+    def export(self) -> None:
+        scan(manifest_composition)
+        export_manifest(self.path, manifest_composition)
+        reset()
+        sys.modules.pop(WIRING, None)
+
+    def test_load_without_scanning(self):
+        self.export()
+
+        report = load_manifest(self.path, manifest_composition)
+
+        self.assertTrue(report.manifest)
+        self.assertNotIn(WIRING, sys.modules)
+        ensure_scope('request', scope_type='request', context={'language': 'nl'})
+        newsletter = get_resolver('request')(Newsletter)
+        self.assertIsInstance(newsletter.mailer.get(), Mailer)
+        self.assertIsInstance(get_resolver('request')(Greeter), Greeter)
+
+    def test_load_skips_introspection(self):
+        self.export()
+
+        load_manifest(self.path, manifest_composition)
+
+        newsletter = next(composer for composer in default_container().repository().get_composers() if composer.id == 'newsletter')
+        self.assertIsNotNone(newsletter.factory._parameter_types)
+
+    def test_manifest_contents(self):
+        self.export()
+
+        entries = {entry['id']: entry for entry in json.loads(self.path.read_text())['composers']}
+
+        self.assertEqual('test_tidipy.manifest_composition.mailers:mailer', entries['mailer']['composer'])
+        self.assertEqual('test_tidipy.manifest_composition.mailers:greeter', entries['greeter']['composer'])
+        self.assertEqual('test_tidipy.manifest_composition.domain:Mailer.reset', entries['mailer']['pool_reset'])
+        self.assertEqual({'language': ['en', 'nl']}, entries['newsletter']['context_filter'])
+        self.assertEqual(
+            ['test_tidipy.manifest_composition.domain:Clock', {'lazy': 'test_tidipy.manifest_composition.domain:Mailer'}],
+            entries['newsletter']['parameters']
+        )
+        self.assertEqual('test_tidipy.manifest_composition.domain:Clock', entries[None]['dependency_type'])
+
+    def test_missing_manifest_falls_back_to_scan(self):
+        report = load_manifest(self.path, manifest_composition)
+
+        self.assertFalse(report.manifest)
+        self.assertIn(WIRING, report.modules)
+        self.assertTrue(self.path.exists())
+
+    def test_stale_manifest_falls_back_to_scan(self):
+        self.export()
+        wiring = Path(manifest_composition.__file__).parent / 'wiring.py'
+        stat = wiring.stat()
+        os.utime(wiring, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        try:
+            report = load_manifest(self.path, manifest_composition)
+        finally:
+            os.utime(wiring, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        self.assertFalse(report.manifest)
+
+    def test_local_composer_cannot_be_exported(self):
+        def local() -> int:
+            return 1
+
+        default_container().repository().add_composer(composer(local, id='local'))
+
+        with self.assertRaises(Exception) as context:
+            export_manifest(self.path, manifest_composition)
+
+        self.assertEqual('Composer local cannot be exported: it is not defined at module level', str(context.exception))
+
+    def test_unexportable_composition_skips_writing_the_manifest(self):
+        def local() -> int:
+            return 1
+
+        default_container().repository().add_composer(composer(local, id='local'))
+
+        report = load_manifest(self.path, manifest_composition)
+
+        self.assertFalse(report.manifest)
+        self.assertFalse(self.path.exists())
+        self.assertIsInstance(get_resolver()(Greeter), Greeter)
+
+    def test_load_into_container_registers_module_level_auto_compose_there(self):
+        self.export()
+        sys.modules.pop(MAILERS, None)
+        container = Container()
+
+        report = container.load_manifest(self.path, manifest_composition)
+
+        self.assertTrue(report.manifest)
+        self.assertEqual(set(), default_container().repository().get_composers())
+        self.assertIsInstance(container.get_resolver()(Stamp), Stamp)
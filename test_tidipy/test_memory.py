@@ -0,0 +1,55 @@
+import gc
+import tracemalloc
+from unittest import TestCase
+
+from test_tidipy import scope_composition
+from test_tidipy.scope_composition import User
+from tidipy import scan, reset, ensure_scope, get_resolver, clear_scope
+from tidipy.container import default_container
+
+SCOPES = 2000
+BYTES_PER_REQUEST_SCOPE = 800
+
+
+def _bytes_per_scope(scope_ids: list[str], context: dict[str, str] = None) -> float:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        for scope_id in scope_ids:
+            ensure_scope(scope_id, scope_type='request', context=context)
+        gc.collect()
+        return (tracemalloc.get_traced_memory()[0] - before) / len(scope_ids)
+    finally:
+        tracemalloc.stop()
+
+
+class TestMemory(TestCase):
+    def setUp(self) -> None:
+        scan(scope_composition)
+        ensure_scope('warmup', scope_type='request')
+
+    def tearDown(self) -> None:
+        reset()
+
+    def test_bytes_per_live_request_scope(self):
+        scope_ids = [f'request-{i}' for i in range(SCOPES)]
+
+        self.assertLess(_bytes_per_scope(scope_ids), BYTES_PER_REQUEST_SCOPE)
+
+    def test_scopes_with_context_share_it(self):
+        scope_ids = [f'request-{i}' for i in range(SCOPES)]
+
+        self.assertLess(_bytes_per_scope(scope_ids, {'tenant': 'a'}), BYTES_PER_REQUEST_SCOPE + 100)
+
+    def test_scopes_have_no_instance_dict(self):
+        scope = default_container()._root.get().find_scope('warmup')
+
+        self.assertFalse(hasattr(scope, '__dict__'))
+        self.assertFalse(hasattr(scope.resolver(), '__dict__'))
+
+    def test_instances_are_stored_after_lazy_allocation(self):
+        resolver = get_resolver('warmup')
+
+        self.assertIs(resolver(User), resolver(User))
+        clear_scope('warmup')
@@ -0,0 +1,105 @@
+from unittest import TestCase, IsolatedAsyncioTestCase
+
+from test_tidipy.observer_composition import Settings, Repository, Handler
+from tidipy import reset, auto_compose, ensure_scope, get_resolver, clear_scope, set_observer, InMemoryAggregator
+from tidipy.observer import Histogram
+
+
+def compose() -> None:
+    auto_compose(Settings, id='settings')
+    auto_compose(Repository, id='repository', scope_type='request')
+    auto_compose(Handler, id='handler', scope_type='transient')
+
+
+class TestObserver(TestCase):
+    def setUp(self) -> None:
+        compose()
+        self.aggregator = InMemoryAggregator()
+        set_observer(self.aggregator)
+
+    def tearDown(self) -> None:
+        reset()
+
+    def test_cache_hits_and_misses(self):
+        ensure_scope('request', scope_type='request')
+        resolver = get_resolver('request')
+        resolver(Repository)
+        resolver(Repository)
+
+        self.assertEqual({'repository': 1, 'settings': 1}, self.aggregator.misses)
+        self.assertEqual({'repository': 1}, self.aggregator.hits)
+
+    def test_ancestor_level(self):
+        ensure_scope('request', scope_type='request')
+        get_resolver('request')(Handler)
+
+        self.assertEqual({0: 2, 1: 1}, self.aggregator.levels)
+
+    def test_builds_are_timed(self):
+        ensure_scope('request', scope_type='request')
+        get_resolver('request')(Handler)
+        get_resolver('request')(Handler)
+
+        self.assertEqual(2, self.aggregator.builds['handler'].count)
+        self.assertEqual(1, self.aggregator.builds['repository'].count)
+        self.assertEqual(
+            {'handler', 'repository', 'settings'},
+            {composer_id for composer_id, _ in self.aggregator.slowest()}
+        )
+        self.assertEqual(1, len(self.aggregator.slowest(1)))
+
+    def test_scope_lifetimes(self):
+        ensure_scope('request-a', scope_type='request')
+        ensure_scope('request-b', scope_type='request')
+        self.assertEqual(3, self.aggregator.live_scopes)
+
+        clear_scope('request-a')
+
+        self.assertEqual(2, self.aggregator.live_scopes)
+        self.assertEqual(1, self.aggregator.lifetimes['request'].count)
+
+    def test_observer_can_be_removed(self):
+        ensure_scope('request', scope_type='request')
+        set_observer(None)
+        get_resolver('request')(Handler)
+
+        self.assertEqual({}, self.aggregator.misses)
+
+    def test_missing_dependency(self):
+        with self.assertRaises(Exception) as context:
+            get_resolver()(int)
+
+        self.assertEqual(f'No candidate for type {int}', str(context.exception))
+
+
+class TestAsyncObserver(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        compose()
+        self.aggregator = InMemoryAggregator()
+        set_observer(self.aggregator)
+
+    def tearDown(self) -> None:
+        reset()
+
+    async def test_async_resolution_is_observed(self):
+        ensure_scope('request', scope_type='request')
+        await get_resolver('request').aresolve(Handler)
+
+        self.assertEqual({'handler': 1, 'repository': 1, 'settings': 1}, self.aggregator.misses)
+        self.assertEqual({0: 2, 1: 1}, self.aggregator.levels)
+        self.assertEqual(1, self.aggregator.builds['handler'].count)
+
+
+class TestHistogram(TestCase):
+    def test_record(self):
+        histogram = Histogram()
+        histogram.record(5e-6)
+        histogram.record(0.5)
+        histogram.record(100.0)
+
+        self.assertEqual([0, 1, 0, 0, 0, 0, 1, 0, 1], histogram.counts)
+        self.assertEqual(100.0, histogram.max)
+        self.assertAlmostEqual(100.500005 / 3, histogram.mean)
+
+    def test_empty(self):
+        self.assertEqual(0.0, Histogram().mean)
@@ -0,0 +1,110 @@
+from unittest import TestCase, IsolatedAsyncioTestCase
+
+from test_tidipy import pool_composition
+from test_tidipy.pool_composition import Serializer, Parser, Buffer
+from tidipy import scan, reset, ensure_scope, get_resolver, clear_scope, aclear_scope, pool_stats, composer, auto_compose
+
+
+class TestPool(TestCase):
+    def setUp(self) -> None:
+        scan(pool_composition)
+
+    def tearDown(self) -> None:
+        reset()
+
+    def test_instance_is_reused_by_next_scope(self):
+        ensure_scope('request-a', scope_type='request')
+        first = get_resolver('request-a')(Serializer)
+        first.buffer.append('data')
+        clear_scope('request-a')
+
+        ensure_scope('request-b', scope_type='request')
+        second = get_resolver('request-b')(Serializer)
+
+        self.assertIs(first, second)
+        self.assertEqual([], second.buffer)
+        self.assertEqual(1, second.resets)
+
+    def test_instance_is_not_shared_by_live_scopes(self):
+        ensure_scope('request-a', scope_type='request')
+        ensure_scope('request-b', scope_type='request')
+
+        self.assertIsNot(get_resolver('request-a')(Serializer), get_resolver('request-b')(Serializer))
+
+    def test_pool_stats(self):
+        for request_id in ['request-a', 'request-b', 'request-c']:
+            ensure_scope(request_id, scope_type='request')
+            get_resolver(request_id)(Serializer)
+            clear_scope(request_id)
+
+        stats = pool_stats()['serializer']
+
+        self.assertEqual(2, stats.hits)
+        self.assertEqual(1, stats.misses)
+        self.assertEqual(1, stats.size)
+        self.assertAlmostEqual(2 / 3, stats.hit_rate)
+
+    def test_pool_stats_without_requests(self):
+        ensure_scope('request', scope_type='request')
+
+        self.assertEqual(0.0, pool_stats()['serializer'].hit_rate)
+
+    def test_pool_is_bounded(self):
+        request_ids = ['request-a', 'request-b', 'request-c', 'request-d']
+        for request_id in request_ids:
+            ensure_scope(request_id, scope_type='request')
+        released = [get_resolver(request_id)(Buffer) for request_id in request_ids]
+        for request_id in request_ids:
+            clear_scope(request_id)
+
+        self.assertEqual(2, pool_stats()['buffer'].size)
+
+        for request_id in request_ids:
+            ensure_scope(request_id, scope_type='request')
+        reused = [get_resolver(request_id)(Buffer) for request_id in request_ids]
+
+        self.assertEqual(2, len([instance for instance in reused if any(instance is r for r in released)]))
+        self.assertEqual(2, pool_stats()['buffer'].hits)
+        self.assertEqual(6, pool_stats()['buffer'].misses)
+
+    def test_pool_stats_are_summed_over_contexts(self):
+        ensure_scope('request-a', scope_type='request', context={'tenant': 'a'})
+        ensure_scope('request-b', scope_type='request', context={'tenant': 'b'})
+        get_resolver('request-a')(Serializer)
+        get_resolver('request-b')(Serializer)
+
+        self.assertEqual(2, pool_stats()['serializer'].misses)
+
+    def test_cannot_pool_transient_dependency(self):
+        with self.assertRaises(Exception):
+            auto_compose(Parser, scope_type='transient', pooled=True)
+
+    def test_cannot_pool_generator_composer(self):
+        def generator() -> Parser:
+            yield Parser()
+
+        with self.assertRaises(Exception):
+            composer(generator, scope_type='request', pooled=True)
+
+
+class TestAsyncPool(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        scan(pool_composition)
+
+    def tearDown(self) -> None:
+        reset()
+
+    async def test_async_instance_is_reused(self):
+        ensure_scope('request-a', scope_type='request')
+        ensure_scope('request-b', scope_type='request')
+        first = await get_resolver('request-a').aresolve(Parser)
+        await get_resolver('request-b').aresolve(Parser)
+        await aclear_scope('request-a')
+        await aclear_scope('request-b')
+
+        ensure_scope('request-c', scope_type='request')
+        third = await get_resolver('request-c').aresolve(Parser)
+
+        self.assertIs(first, third)
+        self.assertEqual(1, pool_stats()['parser'].hits)
+        self.assertEqual(0, pool_stats()['parser'].size)
@@ -0,0 +1,111 @@
+from abc import ABC
+from unittest import TestCase
+
+from tidipy import reset, auto_compose, composer, get_resolver, ensure_scope, pool_stats, default_container
+from tidipy.scope_context import ScopeContext
+from tidipy.scope_type import CustomScope, RootType
+
+
+class Clock:
+    pass
+
+
+class Store(ABC):
+    pass
+
+
+class MemoryStore(Store):
+    pass
+
+
+class DiskStore(Store):
+    pass
+
+
+class Cache:
+    pass
+
+
+class Sink(ABC):
+    pass
+
+
+class FileSink:
+    pass
+
+
+class TestRepository(TestCase):
+    def tearDown(self) -> None:
+        reset()
+
+    def test_live_root_scope_sees_new_composer(self):
+        resolver = get_resolver()
+        with self.assertRaises(Exception):
+            resolver(Clock)
+
+        auto_compose(Clock)
+
+        self.assertIsInstance(resolver(Clock), Clock)
+
+    def test_live_scope_sees_new_composer_of_its_type(self):
+        ensure_scope('request', scope_type='request')
+        ensure_scope('session', scope_type='session')
+        session_template = default_container().repository().get_templates().get(CustomScope('session'), ScopeContext.empty())
+
+        auto_compose(Cache, id='cache', scope_type='request', pooled=True)
+
+        self.assertIsInstance(get_resolver('request')(Cache), Cache)
+        self.assertEqual(0, session_template.generation)
+        self.assertEqual(1, pool_stats()['cache'].misses)
+
+    def test_new_composer_makes_abstract_type_ambiguous(self):
+        auto_compose(MemoryStore)
+        resolver = get_resolver()
+        self.assertIsInstance(resolver(Store), MemoryStore)
+
+        auto_compose(DiskStore)
+
+        with self.assertRaises(Exception) as context:
+            resolver(Store)
+        self.assertEqual(f'More than 1 candidate for type {Store}', str(context.exception))
+
+    def test_registering_a_virtual_subclass_refreshes_lookup(self):
+        auto_compose(FileSink)
+        resolver = get_resolver()
+        with self.assertRaises(Exception):
+            resolver(Sink)
+
+        Sink.register(FileSink)
+
+        self.assertIsInstance(resolver(Sink), FileSink)
+
+    def test_new_composer_does_not_change_index_in_use(self):
+        auto_compose(MemoryStore)
+        template = default_container().repository().get_templates().get(RootType(), ScopeContext.empty())
+        index = template.index
+
+        auto_compose(DiskStore)
+
+        self.assertIs(index.find(Store, None).dependency_type, MemoryStore)
+        self.assertIsNot(index, template.index)
+
+    def test_bulk_registration_is_one_generation(self):
+        first = composer(lambda: Clock(), id='first')
+        second = composer(lambda: Cache(), id='second')
+
+        default_container().repository().add_composers([first, second])
+        default_container().repository().add_composers([first])
+
+        self.assertEqual(1, default_container().repository().generation())
+        self.assertEqual({first, second}, default_container().repository().get_composers())
+
+    def test_bulk_registration_with_duplicate_adds_nothing(self):
+        with self.assertRaises(Exception) as context:
+            default_container().repository().add_composers([
+                composer(lambda: Clock(), id='clock'),
+                composer(lambda: Cache(), id='clock')
+            ])
+
+        self.assertEqual('Duplicate composer with id clock', str(context.exception))
+        self.assertEqual(set(), default_container().repository().get_composers())
+        self.assertEqual(0, default_container().repository().generation())
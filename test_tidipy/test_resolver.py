@@ -1,6 +1,7 @@
 from unittest import TestCase
 from test_tidipy import resolver_composition
 from test_tidipy.resolver_composition.buzz import Buzz
+from test_tidipy.resolver_composition.greeter import Greeter, Farewell
 
 from tidipy import scan, get_resolver, reset
 
@@ -23,3 +24,17 @@ class TestResolver(TestCase):
         result_2 = self.resolver(Buzz)
 
         self.assertEqual(id(result_1), id(result_2))
+
+    def test_resolve_by_base_class(self):
+        result = self.resolver(Farewell)
+
+        self.assertEqual(result.say(), 'Goodbye')
+
+    def test_resolve_virtual_subclass(self):
+        result = self.resolver(Greeter)
+
+        self.assertEqual(result.greet(), 'Hi')
+
+    def test_resolve_by_id_with_wrong_type(self):
+        with self.assertRaises(Exception):
+            self.resolver(Buzz, id='timber')
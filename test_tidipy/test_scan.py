@@ -0,0 +1,73 @@
+import sys
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from test_tidipy import scan_composition, scope_composition
+from tidipy import scan, reset, get_resolver, default_container
+from tidipy.discovery import contains_composers, discover
+
+
+class TestScan(TestCase):
+    def setUp(self) -> None:
+        for module_name in ['helpers', 'nested.clocks']:
+            sys.modules.pop(f'test_tidipy.scan_composition.{module_name}', None)
+
+    def tearDown(self) -> None:
+        reset()
+
+    def test_failed_imports_are_reported(self):
+        report = scan(scan_composition)
+
+        self.assertEqual(['test_tidipy.scan_composition.broken'], list(report.failed))
+        self.assertEqual('broken on purpose', str(report.failed['test_tidipy.scan_composition.broken']))
+        self.assertIn('test_tidipy.scan_composition.helpers', report.modules)
+
+    def test_static_scan_imports_only_modules_with_composers(self):
+        with tempfile.TemporaryDirectory() as directory:
+            report = scan(scan_composition, static=True, cache=Path(directory) / 'scan.json')
+
+        self.assertEqual(
+            ['test_tidipy.scan_composition', 'test_tidipy.scan_composition.greeters',
+             'test_tidipy.scan_composition.nested.clocks'],
+            report.modules
+        )
+        self.assertEqual(['test_tidipy.scan_composition.broken'], list(report.failed))
+        self.assertNotIn('test_tidipy.scan_composition.helpers', sys.modules)
+
+    def test_static_scan_registers_composers(self):
+        scan(scan_composition, static=True, cache=False, max_workers=4)
+
+        clock_type = sys.modules['test_tidipy.scan_composition.nested.clocks'].Clock
+        self.assertIsInstance(get_resolver()(clock_type), clock_type)
+        self.assertIn('greeter', {composer.id for composer in default_container().repository().get_composers()})
+
+    def test_scan_of_module(self):
+        report = scan(scope_composition)
+
+        self.assertEqual(['test_tidipy.scope_composition'], report.modules)
+        self.assertEqual({}, report.failed)
+
+
+class TestDiscovery(TestCase):
+    def test_contains_composers(self):
+        self.assertTrue(contains_composers(b'@composer\ndef f() -> int:\n    return 1\n'))
+        self.assertTrue(contains_composers(b'@tidipy.composer(scope_type="request")\ndef f() -> int:\n    return 1\n'))
+        self.assertTrue(contains_composers(b'from tidipy import auto_compose as ac\nac(int)\n'))
+        self.assertTrue(contains_composers(b'def f(:\n'))
+        self.assertFalse(contains_composers(b'def composer_name() -> str:\n    return "composer"\n'))
+
+    def test_cache_is_reused_until_file_changes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            package = Path(directory) / 'package'
+            package.mkdir()
+            module = package / 'module.py'
+            module.write_text('x = 1\n')
+            cache = Path(directory) / 'cache' / 'scan.json'
+
+            self.assertEqual([], discover(package, 'package', cache))
+            self.assertTrue(cache.exists())
+
+            module.write_text('auto_compose(int)\n')
+
+            self.assertEqual(['package.module'], discover(package, 'package', cache))
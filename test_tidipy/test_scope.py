@@ -137,6 +137,31 @@ class TestScope(TestCase):
         with self.assertRaises(Exception):
             get_resolver('request-b')
 
+    def test_clear_parent_scope_clears_grandchild(self):
+        ensure_scope(scope_id='app', scope_type='app')
+        ensure_scope(scope_id='tenant', scope_type='tenant', parent_id='app')
+        ensure_scope(scope_id='request', scope_type='request', parent_id='tenant')
+        clear_scope('app')
+
+        with self.assertRaises(Exception):
+            get_resolver('request')
+
+    def test_can_ensure_scope_again_after_clearing_parent(self):
+        ensure_scope(scope_id='tenant', scope_type='tenant')
+        ensure_scope(scope_id='request', scope_type='request', parent_id='tenant')
+        clear_scope('tenant')
+        ensure_scope(scope_id='request', scope_type='request')
+
+        self.assertEqual(User(id='user'), get_resolver('request')(User))
+
+    def test_clear_scope_keeps_siblings(self):
+        ensure_scope(scope_id='tenant', scope_type='tenant')
+        ensure_scope(scope_id='request-a', scope_type='request', parent_id='tenant')
+        ensure_scope(scope_id='request-b', scope_type='request', parent_id='tenant')
+        clear_scope('request-a')
+
+        self.assertEqual(User(id='user'), get_resolver('request-b')(User))
+
     def test_clear_child_scope(self):
         ensure_scope(scope_id='app', scope_type='app')
         ensure_scope(scope_id='tenant', scope_type='tenant', parent_id='app')
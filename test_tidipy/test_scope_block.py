@@ -0,0 +1,173 @@
+import asyncio
+from unittest import TestCase, IsolatedAsyncioTestCase
+
+from test_tidipy import scope_composition
+from test_tidipy.scope_composition import Animal, Hey, User
+from tidipy import scan, reset, scope, current_resolver, get_resolver, ensure_scope, clear_scope, set_observer, \
+    Container, InMemoryAggregator
+
+
+class TestScopeBlock(TestCase):
+    def setUp(self) -> None:
+        scan(scope_composition)
+
+    def tearDown(self) -> None:
+        reset()
+
+    def test_resolve_in_scope(self):
+        with scope('request') as resolver:
+            self.assertEqual(User(id='user'), resolver(User))
+            self.assertEqual(Hey(age=17), resolver(Hey))
+
+    def test_current_resolver(self):
+        with scope('request') as resolver:
+            self.assertIs(resolver, current_resolver())
+
+    def test_current_resolver_defaults_to_root(self):
+        self.assertIs(get_resolver(), current_resolver())
+
+    def test_current_resolver_is_restored_on_exit(self):
+        with scope('tenant') as tenant_resolver:
+            with scope('request'):
+                pass
+            self.assertIs(tenant_resolver, current_resolver())
+
+        self.assertIs(get_resolver(), current_resolver())
+
+    def test_nested_scope_uses_ambient_parent(self):
+        with scope('tenant'):
+            with scope('request') as resolver:
+                self.assertEqual(Animal(name='Henk'), resolver(Animal))
+
+    def test_nested_scope_with_ambient_parent_of_same_type(self):
+        with scope('tenant'):
+            with self.assertRaises(Exception):
+                with scope('tenant'):
+                    pass
+
+    def test_scope_with_parent_id(self):
+        ensure_scope('tenant-a', scope_type='tenant')
+
+        with scope('request', 'tenant-a') as resolver:
+            self.assertEqual(Animal(name='Henk'), resolver(Animal))
+
+    def test_scope_with_parent_resolver(self):
+        ensure_scope('tenant-a', scope_type='tenant')
+
+        with scope('request', get_resolver('tenant-a')) as resolver:
+            self.assertEqual(Animal(name='Henk'), resolver(Animal))
+
+    def test_scope_with_parent_resolver_of_other_container(self):
+        other = Container()
+        other.scan(scope_composition)
+        other.ensure_scope('tenant-a', scope_type='tenant')
+
+        with self.assertRaises(Exception):
+            with scope('request', other.get_resolver('tenant-a')):
+                pass
+
+    def test_nested_entries_of_same_block(self):
+        block = scope('tenant')
+
+        with block as outer:
+            with scope('request'):
+                with self.assertRaises(Exception):
+                    with block:
+                        pass
+            self.assertIs(outer, current_resolver())
+
+        self.assertIs(get_resolver(), current_resolver())
+
+    def test_block_can_be_reused(self):
+        block = scope('request')
+
+        with block as first:
+            pass
+        with block as second:
+            self.assertIs(second, current_resolver())
+
+        self.assertIsNot(first, second)
+
+    def test_scope_cleared_inside_block_is_cleared_once(self):
+        get_resolver()
+        aggregator = InMemoryAggregator()
+        set_observer(aggregator)
+
+        with scope('tenant', scope_id='tenant-a'):
+            clear_scope('tenant-a')
+
+        self.assertEqual(0, aggregator.live_scopes)
+
+    def test_scope_with_nonexisting_parent(self):
+        with self.assertRaises(Exception):
+            with scope('request', 'tenant-a'):
+                pass
+
+    def test_anonymous_scope_is_not_registered(self):
+        with scope('request', scope_id=None):
+            with self.assertRaises(Exception):
+                get_resolver('request')
+
+    def test_scope_with_id_is_registered(self):
+        with scope('tenant', scope_id='tenant-a') as resolver:
+            self.assertIs(resolver, get_resolver('tenant-a'))
+
+        with self.assertRaises(Exception):
+            get_resolver('tenant-a')
+
+    def test_scope_with_existing_id(self):
+        ensure_scope('tenant-a', scope_type='tenant')
+
+        with self.assertRaises(Exception):
+            with scope('tenant', scope_id='tenant-a'):
+                pass
+
+    def test_scope_with_context(self):
+        with scope('tenant', context={'a': 'b'}):
+            with self.assertRaises(Exception):
+                with scope('request', context={'a': 'c'}):
+                    pass
+
+    def test_scope_is_cleared_after_exception(self):
+        with self.assertRaises(ValueError):
+            with scope('tenant', scope_id='tenant-a'):
+                raise ValueError
+
+        with self.assertRaises(Exception):
+            get_resolver('tenant-a')
+
+
+class TestAsyncScopeBlock(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        scan(scope_composition)
+
+    def tearDown(self) -> None:
+        reset()
+
+    async def test_block_entered_by_concurrent_tasks(self):
+        block = scope('request')
+        entered = asyncio.Event()
+        resolvers = []
+
+        async def handle(wait: bool) -> None:
+            async with block as resolver:
+                resolvers.append(resolver)
+                if wait:
+                    await entered.wait()
+                else:
+                    entered.set()
+                    await asyncio.sleep(0)
+                self.assertIs(resolver, current_resolver())
+
+        await asyncio.gather(handle(True), handle(False))
+
+        self.assertIsNot(resolvers[0], resolvers[1])
+        self.assertEqual([], get_resolver().scope().children())
+
+    async def test_async_scope(self):
+        async with scope('tenant', scope_id='tenant-a') as resolver:
+            self.assertEqual(Animal(name='Henk'), await resolver.aresolve(Animal))
+            self.assertIs(resolver, current_resolver())
+
+        with self.assertRaises(Exception):
+            get_resolver('tenant-a')
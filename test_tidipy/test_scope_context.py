@@ -0,0 +1,105 @@
+import gc
+import weakref
+from unittest import TestCase
+
+from tidipy.auto_compose import auto_composer
+from tidipy.context_filter import parse_context_filter
+from tidipy.scope_context import ScopeContext
+from tidipy.scope_template import ScopeTemplates, MAX_RECENT_TEMPLATES
+from tidipy.scope_type import CustomScope
+
+
+class Catalog:
+    pass
+
+
+class TestScopeContext(TestCase):
+    def test_equal_contexts_are_interned(self):
+        self.assertIs(ScopeContext({'tenant': 'a', 'env': 'prod'}), ScopeContext({'env': 'prod', 'tenant': 'a'}))
+
+    def test_contexts_are_hashable(self):
+        templates = {ScopeContext({'tenant': 'a'}): 'a'}
+
+        self.assertEqual('a', templates[ScopeContext({'tenant': 'a'})])
+
+    def test_values_are_immutable(self):
+        values = {'tenant': 'a'}
+        context = ScopeContext(values)
+        values['tenant'] = 'b'
+
+        self.assertEqual({'tenant': 'a'}, dict(context.values()))
+        with self.assertRaises(TypeError):
+            context.values()['tenant'] = 'b'  # type: ignore
+
+    def test_add_merges_values(self):
+        context = ScopeContext({'tenant': 'a'}).add(ScopeContext({'env': 'prod'}))
+
+        self.assertIs(ScopeContext({'tenant': 'a', 'env': 'prod'}), context)
+
+    def test_add_with_empty_context_returns_same_context(self):
+        context = ScopeContext({'tenant': 'a'})
+
+        self.assertIs(context, context.add(ScopeContext.empty()))
+        self.assertIs(context, ScopeContext.empty().add(context))
+
+    def test_add_can_not_override_values(self):
+        with self.assertRaises(Exception):
+            ScopeContext({'tenant': 'a'}).add(ScopeContext({'tenant': 'b'}))
+
+    def test_part_of(self):
+        context = ScopeContext({'tenant': 'a', 'env': 'prod'})
+
+        self.assertTrue(ScopeContext({'tenant': 'a'}).part_of(context))
+        self.assertFalse(ScopeContext({'tenant': 'b'}).part_of(context))
+
+
+class TestContextFilter(TestCase):
+    def test_matches_allowed_values(self):
+        context_filter = parse_context_filter(tenant={'a', 'b'}, env='prod')
+
+        self.assertTrue(context_filter.is_fulfilled_by(ScopeContext({'tenant': 'b', 'env': 'prod'})))
+        self.assertFalse(context_filter.is_fulfilled_by(ScopeContext({'tenant': 'c', 'env': 'prod'})))
+
+    def test_missing_keys_are_fulfilled(self):
+        context_filter = parse_context_filter(tenant='a')
+
+        self.assertTrue(context_filter.is_fulfilled_by(ScopeContext({'env': 'prod'})))
+
+    def test_filters_are_hashable(self):
+        self.assertEqual(hash(parse_context_filter(tenant='a')), hash(parse_context_filter(tenant='a')))
+
+
+class TestScopeTemplates(TestCase):
+    def test_unused_templates_are_bounded(self):
+        templates = ScopeTemplates()
+        context = ScopeContext({'tenant': '0'})
+        first = weakref.ref(templates.get(CustomScope('tenant'), context))
+        first_context = weakref.ref(context)
+        del context
+        for tenant in range(1, MAX_RECENT_TEMPLATES + 1):
+            templates.get(CustomScope('tenant'), ScopeContext({'tenant': str(tenant)}))
+        gc.collect()
+
+        self.assertIsNone(first())
+        self.assertIsNone(first_context())
+
+    def test_recently_used_template_is_kept(self):
+        templates = ScopeTemplates()
+        first = weakref.ref(templates.get(CustomScope('tenant'), ScopeContext({'tenant': '0'})))
+        for tenant in range(1, MAX_RECENT_TEMPLATES + 1):
+            templates.get(CustomScope('tenant'), ScopeContext({'tenant': '0'}))
+            templates.get(CustomScope('tenant'), ScopeContext({'tenant': str(tenant)}))
+        gc.collect()
+
+        self.assertIs(first(), templates.get(CustomScope('tenant'), ScopeContext({'tenant': '0'})))
+
+    def test_template_in_use_is_kept_and_updated(self):
+        templates = ScopeTemplates()
+        template = templates.get(CustomScope('tenant'), ScopeContext({'tenant': '0'}))
+        for tenant in range(1, MAX_RECENT_TEMPLATES + 1):
+            templates.get(CustomScope('tenant'), ScopeContext({'tenant': str(tenant)}))
+
+        templates.add([auto_composer(Catalog, scope_type='tenant')], 1)
+
+        self.assertIs(template, templates.get(CustomScope('tenant'), ScopeContext({'tenant': '0'})))
+        self.assertIsNotNone(template.index.find(Catalog, None))
@@ -0,0 +1,217 @@
+import threading
+from contextlib import contextmanager, asynccontextmanager
+from typing import Iterator, AsyncIterator
+from unittest import TestCase, IsolatedAsyncioTestCase
+
+from test_tidipy import teardown_composition
+from test_tidipy.teardown_composition import events, Connection, Session, Cursor, Handle, Client, Stubborn, Fragile
+from tidipy import scan, reset, ensure_scope, get_resolver, clear_scope, aclear_scope, scope, composer, \
+    default_container
+
+
+class TestTeardown(TestCase):
+    def setUp(self) -> None:
+        scan(teardown_composition)
+        events.clear()
+        ensure_scope('tenant', scope_type='tenant')
+        self.resolver = get_resolver('tenant')
+
+    def tearDown(self) -> None:
+        reset()
+
+    def test_generator_composer(self):
+        connection = self.resolver(Connection)
+
+        self.assertIsInstance(connection, Connection)
+        self.assertEqual(['open connection'], events)
+
+    def test_teardown_on_clear(self):
+        self.resolver(Connection)
+        clear_scope('tenant')
+
+        self.assertEqual(['open connection', 'close connection'], events)
+
+    def test_teardown_runs_outside_the_scope_id_lock(self):
+        closing = threading.Event()
+        release = threading.Event()
+
+        def pool() -> Iterator[Handle]:
+            yield Handle()
+            closing.set()
+            release.wait(1)
+
+        default_container().register(composer(pool, scope_type='tenant'))
+        self.resolver(Handle)
+        clearing = threading.Thread(target=clear_scope, args=('tenant',))
+        clearing.start()
+        closing.wait(1)
+
+        try:
+            ensure_scope('tenant', scope_type='tenant')
+            self.assertTrue(clearing.is_alive())
+            self.assertIsNot(self.resolver, get_resolver('tenant'))
+        finally:
+            release.set()
+            clearing.join()
+
+    def test_teardown_in_reverse_construction_order(self):
+        self.resolver(Session)
+        clear_scope('tenant')
+
+        self.assertEqual(['open session', 'open connection', 'close session', 'close connection'], events)
+
+    def test_children_are_torn_down_first(self):
+        ensure_scope('request', scope_type='request', parent_id='tenant')
+        self.resolver(Connection)
+        get_resolver('request')(Cursor)
+        clear_scope('tenant')
+
+        self.assertEqual(['open connection', 'close cursor', 'close connection'], events)
+
+    def test_teardown_on_clearing_root(self):
+        self.resolver(Connection)
+        clear_scope('root')
+
+        self.assertEqual(['open connection', 'close connection'], events)
+
+    def test_transient_generator_is_rejected(self):
+        def handle() -> Iterator[Handle]:
+            yield Handle()
+
+        with self.assertRaises(Exception):
+            composer(handle, scope_type='transient')
+
+    def test_context_manager_composer(self):
+        @contextmanager
+        def handle() -> Iterator[Handle]:
+            events.append('enter handle')
+            yield Handle()
+            events.append('exit handle')
+
+        default_container().register(composer(handle, scope_type='tenant'))
+
+        self.assertIsInstance(self.resolver(Handle), Handle)
+        clear_scope('tenant')
+
+        self.assertEqual(['enter handle', 'exit handle'], events)
+
+    def test_transient_context_manager_is_rejected(self):
+        @contextmanager
+        def handle() -> Iterator[Handle]:
+            yield Handle()
+
+        with self.assertRaises(Exception):
+            composer(handle, scope_type='transient')
+
+    def test_teardown_on_leaving_scope_block(self):
+        with scope('request') as resolver:
+            resolver(Cursor)
+            self.assertEqual([], events)
+
+        self.assertEqual(['close cursor'], events)
+
+    def test_concurrent_teardown(self):
+        for i in range(5):
+            ensure_scope(f'request-{i}', scope_type='request', parent_id='tenant')
+            get_resolver(f'request-{i}')(Cursor)
+        self.resolver(Connection)
+        clear_scope('tenant', concurrent=True)
+
+        self.assertEqual(['close cursor'] * 5, events[1:6])
+        self.assertEqual('close connection', events[-1])
+
+    def test_teardown_error_does_not_stop_other_teardowns(self):
+        self.resolver(Connection)
+        self.resolver(Fragile)
+
+        with self.assertRaises(ValueError):
+            clear_scope('tenant')
+        self.assertEqual(['open connection', 'close connection'], events)
+
+    def test_generator_must_yield_once(self):
+        self.resolver(Stubborn)
+
+        with self.assertRaises(Exception):
+            clear_scope('tenant')
+
+    def test_cannot_resolve_async_generator_synchronously(self):
+        with self.assertRaises(Exception):
+            self.resolver(Client)
+
+
+class TestAsyncTeardown(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        scan(teardown_composition)
+        events.clear()
+        ensure_scope('tenant', scope_type='tenant')
+        self.resolver = get_resolver('tenant')
+
+    def tearDown(self) -> None:
+        reset()
+
+    async def test_async_context_manager_composer(self):
+        @asynccontextmanager
+        async def handle() -> AsyncIterator[Handle]:
+            events.append('enter handle')
+            yield Handle()
+            events.append('exit handle')
+
+        default_container().register(composer(handle, scope_type='tenant'))
+
+        self.assertIsInstance(await self.resolver.aresolve(Handle), Handle)
+        await aclear_scope('tenant')
+
+        self.assertEqual(['enter handle', 'exit handle'], events)
+
+    async def test_async_generator_composer(self):
+        client = await self.resolver.aresolve(Client)
+        await aclear_scope('tenant')
+
+        self.assertIsInstance(client, Client)
+        self.assertEqual(['close client'], events)
+
+    async def test_cannot_clear_async_teardowns_synchronously(self):
+        await self.resolver.aresolve(Client)
+
+        with self.assertRaises(Exception):
+            clear_scope('tenant')
+        with self.assertRaises(Exception):
+            clear_scope('root')
+
+    async def test_sync_and_async_teardowns(self):
+        await self.resolver.aresolve(Client)
+        await self.resolver.aresolve(Session)
+        await aclear_scope('tenant')
+
+        self.assertEqual(['close session', 'close connection', 'close client'], events[2:])
+
+    async def test_concurrent_async_teardown(self):
+        ensure_scope('request', scope_type='request', parent_id='tenant')
+        await get_resolver('request').aresolve(Cursor)
+        await self.resolver.aresolve(Client)
+        await self.resolver.aresolve(Connection)
+        await aclear_scope('tenant', concurrent=True)
+
+        self.assertEqual(['open connection', 'close cursor', 'close connection', 'close client'], events)
+
+    async def test_async_clear_root(self):
+        await self.resolver.aresolve(Client)
+        await aclear_scope('root')
+
+        self.assertEqual(['close client'], events)
+
+    async def test_async_teardown_error_does_not_stop_other_teardowns(self):
+        ensure_scope('request', scope_type='request', parent_id='tenant')
+        await get_resolver('request').aresolve(Cursor)
+        await self.resolver.aresolve(Fragile)
+        await self.resolver.aresolve(Client)
+
+        with self.assertRaises(ValueError):
+            await aclear_scope('tenant')
+        self.assertEqual(['close cursor', 'close client'], events)
+
+    async def test_teardown_on_leaving_async_scope_block(self):
+        async with scope('request') as resolver:
+            await resolver.aresolve(Cursor)
+
+        self.assertEqual(['close cursor'], events)
@@ -0,0 +1,107 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from test_tidipy import scope_composition, threading_composition
+from test_tidipy.scope_composition import Animal, Hey, User
+from test_tidipy.threading_composition import ConnectionPool, BrokenPool, Chicken
+from tidipy import scan, reset, ensure_scope, get_resolver, clear_scope, auto_compose
+
+THREADS = 8
+ITERATIONS = 300
+
+
+class TestThreading(TestCase):
+    def setUp(self) -> None:
+        scan(scope_composition)
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self) -> None:
+        sys.setswitchinterval(self._switch_interval)
+        reset()
+
+    def _handle_requests(self, worker: int) -> list[str]:
+        request_ids = []
+        for i in range(ITERATIONS):
+            tenant_id = f'tenant-{i % 4}'
+            request_id = f'request-{worker}-{i}'
+            ensure_scope(tenant_id, scope_type='tenant')
+            ensure_scope(request_id, scope_type='request', parent_id=tenant_id)
+
+            resolver = get_resolver(request_id)
+            self.assertEqual(User(id='user'), resolver(User))
+            self.assertEqual(Animal(name='Henk'), resolver(Animal))
+            self.assertEqual(Hey(age=17), resolver(Hey))
+
+            clear_scope(request_id)
+            request_ids.append(request_id)
+
+        return request_ids
+
+    def _churn_tenant(self, worker: int) -> list[str]:
+        scope_ids = []
+        for i in range(ITERATIONS):
+            tenant_id = f'churn-{worker}'
+            request_id = f'churn-request-{worker}-{i}'
+            ensure_scope(tenant_id, scope_type='tenant')
+            ensure_scope(request_id, scope_type='request', parent_id=tenant_id)
+            clear_scope(tenant_id)
+            scope_ids += [tenant_id, request_id]
+
+        return scope_ids
+
+    def test_concurrent_scope_churn(self):
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            futures = [executor.submit(self._handle_requests, worker) for worker in range(THREADS)]
+            futures += [executor.submit(self._churn_tenant, worker) for worker in range(THREADS)]
+            scope_ids = [scope_id for future in futures for scope_id in future.result()]
+
+        for scope_id in scope_ids:
+            with self.assertRaises(Exception):
+                get_resolver(scope_id)
+        for i in range(4):
+            self.assertEqual(Animal(name='Henk'), get_resolver(f'tenant-{i}')(Animal))
+
+    def test_concurrent_ensure_of_same_scope(self):
+        def ensure_and_resolve(_):
+            ensure_scope('tenant', scope_type='tenant')
+            return get_resolver('tenant')
+
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            resolvers = list(executor.map(ensure_and_resolve, range(100)))
+
+        self.assertTrue(all(resolver is resolvers[0] for resolver in resolvers))
+
+    def test_stored_dependency_is_built_once(self):
+        ConnectionPool.instances = 0
+        auto_compose(ConnectionPool, scope_type='tenant')
+        ensure_scope('tenant', scope_type='tenant')
+        resolver = get_resolver('tenant')
+
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            pools = list(executor.map(lambda _: resolver(ConnectionPool), range(THREADS)))
+
+        self.assertEqual(1, ConnectionPool.instances)
+        self.assertTrue(all(pool is pools[0] for pool in pools))
+
+    def test_construction_error_is_raised_in_all_waiting_threads(self):
+        auto_compose(BrokenPool)
+        resolver = get_resolver()
+
+        def resolve(_):
+            try:
+                resolver(BrokenPool)
+            except ValueError as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            errors = list(executor.map(resolve, range(THREADS)))
+
+        self.assertTrue(all(isinstance(error, ValueError) for error in errors))
+
+    def test_circular_dependency(self):
+        scan(threading_composition)
+
+        with self.assertRaisesRegex(Exception, 'Circular dependency'):
+            get_resolver()(Chicken)
@@ -0,0 +1,92 @@
+from unittest import TestCase, IsolatedAsyncioTestCase
+
+from test_tidipy import warmup_composition
+from test_tidipy.warmup_composition import events, overlap, async_overlap, Cache, Pool, Service, Broken
+from tidipy import scan, reset, auto_compose, warmup, awarmup, ensure_scope, get_resolver
+
+
+class TestWarmup(TestCase):
+    def setUp(self) -> None:
+        scan(warmup_composition)
+        auto_compose(Cache)
+        auto_compose(Pool)
+        auto_compose(Service)
+        events.clear()
+        overlap.reset()
+        async_overlap.reset()
+
+    def tearDown(self) -> None:
+        reset()
+
+    def test_warmup_builds_independent_dependencies_in_parallel(self):
+        timings = warmup(max_workers=4)
+
+        self.assertEqual(3, len(timings))
+        self.assertFalse(overlap.broken)
+        self.assertEqual('service', events[-1])
+
+    def test_warmup_reports_build_time_per_composer(self):
+        timings = warmup(max_workers=4)
+
+        self.assertGreaterEqual(min(timings.values()), 0.1)
+
+    def test_warmed_up_dependencies_are_stored(self):
+        warmup()
+        resolver = get_resolver()
+        resolver(Service)
+        resolver(Cache)
+
+        self.assertEqual(3, len(events))
+
+    def test_warmup_tenant_scope_in_background(self):
+        future = ensure_scope('tenant', scope_type='tenant', warmup=True)
+
+        self.assertEqual(1, len(future.result()))
+
+    def test_ensure_scope_without_warmup(self):
+        self.assertIsNone(ensure_scope('tenant', scope_type='tenant'))
+
+    def test_warmup_unknown_scope(self):
+        with self.assertRaises(Exception):
+            warmup('tenant')
+
+    def test_warmup_error(self):
+        auto_compose(Broken, scope_type='tenant')
+        ensure_scope('tenant', scope_type='tenant')
+
+        with self.assertRaises(Exception):
+            warmup('tenant')
+
+
+class TestAsyncWarmup(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        scan(warmup_composition)
+        auto_compose(Cache)
+        auto_compose(Pool)
+        auto_compose(Service)
+        events.clear()
+        overlap.reset()
+        async_overlap.reset()
+
+    def tearDown(self) -> None:
+        reset()
+
+    async def test_async_warmup_offloads_sync_composers_in_parallel(self):
+        timings = await awarmup()
+
+        self.assertEqual(3, len(timings))
+        self.assertFalse(overlap.broken)
+        self.assertEqual('service', events[-1])
+
+    async def test_async_warmup_builds_async_composers_concurrently(self):
+        ensure_scope('worker', scope_type='worker')
+        timings = await awarmup('worker')
+
+        self.assertEqual({'feed', 'catalog'}, set(timings))
+        self.assertEqual(2, async_overlap.arrived)
+
+    async def test_async_warmup_times_only_the_build(self):
+        timings = await awarmup()
+        service = timings[str(id(Service))]
+
+        self.assertLess(service, timings[str(id(Cache))] + timings[str(id(Pool))])
@@ -0,0 +1,40 @@
+import threading
+import time
+
+from tidipy import composer, Resolver
+
+
+class ConnectionPool:
+    instances = 0
+    _lock = threading.Lock()
+
+    def __init__(self):
+        time.sleep(0.05)
+        with ConnectionPool._lock:
+            ConnectionPool.instances += 1
+
+
+class BrokenPool:
+    def __init__(self):
+        time.sleep(0.05)
+        raise ValueError('cannot connect')
+
+
+class Chicken:
+    def __init__(self, egg):
+        self.egg = egg
+
+
+class Egg:
+    def __init__(self, chicken):
+        self.chicken = chicken
+
+
+@composer
+def chicken(resolve: Resolver) -> Chicken:
+    return Chicken(resolve(Egg))
+
+
+@composer
+def egg(resolve: Resolver) -> Egg:
+    return Egg(resolve(Chicken))
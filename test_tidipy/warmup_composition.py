@@ -0,0 +1,93 @@
+import asyncio
+import threading
+import time
+
+from tidipy import composer
+
+events: list[str] = []
+overlap = threading.Barrier(2, timeout=1)
+
+
+class Rendezvous:
+    def __init__(self, parties: int):
+        self.parties = parties
+        self.arrived = 0
+        self.all = None
+
+    def reset(self) -> None:
+        self.arrived = 0
+        self.all = None
+
+    async def wait(self) -> None:
+        if self.all is None:
+            self.all = asyncio.get_running_loop().create_future()
+        self.arrived += 1
+        if self.arrived == self.parties:
+            self.all.set_result(None)
+        await asyncio.wait_for(asyncio.shield(self.all), 1)
+
+
+async_overlap = Rendezvous(2)
+
+
+class Cache:
+    def __init__(self):
+        overlap.wait()
+        time.sleep(0.1)
+        events.append('cache')
+
+
+class Pool:
+    def __init__(self):
+        overlap.wait()
+        time.sleep(0.1)
+        events.append('pool')
+
+
+class Service:
+    def __init__(self, cache: Cache, pool: Pool):
+        time.sleep(0.1)
+        events.append('service')
+
+
+class Broken:
+    def __init__(self, value):
+        self.value = value
+
+
+class TenantClient:
+    pass
+
+
+class Nonce:
+    pass
+
+
+class Feed:
+    pass
+
+
+class Catalog:
+    pass
+
+
+@composer(scope_type='tenant')
+def tenant_client() -> TenantClient:
+    return TenantClient()
+
+
+@composer(scope_type='transient')
+def nonce() -> Nonce:
+    return Nonce()
+
+
+@composer(id='feed', scope_type='worker')
+async def feed() -> Feed:
+    await async_overlap.wait()
+    return Feed()
+
+
+@composer(id='catalog', scope_type='worker')
+async def catalog() -> Catalog:
+    await async_overlap.wait()
+    return Catalog()
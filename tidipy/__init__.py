@@ -1,5 +1,9 @@
 from .composer_decorator import composer
 from .resolver import Resolver
-from .scan import scan
-from .scope_api import ensure_scope, clear_scope, reset, get_resolver
-from .auto_compose import auto_compose
+from .scope_api import ensure_scope, clear_scope, aclear_scope, reset, get_resolver, freeze, freeze_root, pool_stats, warmup, awarmup, \
+    set_observer, scope, current_resolver, auto_compose, scan, export_manifest, load_manifest, \
+    set_eviction_policy, evict_idle, evict_idle_every, inventory, detect_leaks, check_leaks
+from .container import Container, default_container
+from .lazy import Lazy
+from .observer import Observer, InMemoryAggregator
+from .leaks import ScopeLeakWarning
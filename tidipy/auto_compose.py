@@ -1,26 +1,30 @@
 import builtins
-from typing import Type, Optional
+from typing import Type, Optional, Callable, Any
 
 from .auto_factory import AutoFactory
 from .composer import Composer
-from .composer_repository import ComposerRepository
 from .context_filter import parse_context_filter
 from .scope_type import parse_scope_type
 
 
-def auto_compose(
+def auto_composer(
     dependency_type: Type,
     *,
     id: Optional[str] = None,
     scope_type: str = 'root',
+    pooled: bool = False,
+    pool_size: int = 16,
+    pool_reset: Optional[Callable[[Any], None]] = None,
     **kwargs
-):
+) -> Composer:
     factory = AutoFactory(dependency_type)
-    composer = Composer(
+    return Composer(
             id=str(builtins.id(dependency_type)) if id is None else id,
             scope_type=parse_scope_type(scope_type),
             context_filter=parse_context_filter(**kwargs),
             dependency_type=dependency_type,
-            factory=factory
+            factory=factory,
+            pooled=pooled,
+            pool_size=pool_size,
+            pool_reset=pool_reset
         )
-    ComposerRepository.add_composer(composer)
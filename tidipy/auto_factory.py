@@ -1,27 +1,82 @@
 from __future__ import annotations
 
+import asyncio
 import inspect
-from typing import Type
+from typing import Type, Callable, Any, Optional
 
+from .lazy import Lazy, lazy_type
 from .resolver import Resolver
 
 
 class AutoFactory:
-    def __init__(self, dependency_type: Type):
+    def __init__(self, dependency_type: Type, parameter_types: Optional[list[Type]] = None):
         self._dependency_type = dependency_type
+        self._parameter_types = parameter_types
+        self._construct: Optional[Callable[[Resolver], Any]] = None
 
     def __eq__(self, other: AutoFactory) -> bool:
         return self._dependency_type == other._dependency_type
 
-    def __call__(self, resolver: Resolver):
+    def parameter_types(self) -> list[Type]:
         sig = inspect.signature(self._dependency_type)
-        params = list(sig.parameters.values())
 
-        args = []
-        for param in params:
+        parameter_types = []
+        for param in sig.parameters.values():
             if param.annotation is inspect.Parameter.empty:
                 raise TypeError(f"Cannot resolve untyped parameter: {param.name}")
-            dependency = resolver(param.annotation)
-            args.append(dependency)
+            parameter_types.append(param.annotation)
+
+        return parameter_types
+
+    def _compiled_parameter_types(self) -> list[Type]:
+        if self._parameter_types is None:
+            self._parameter_types = self.parameter_types()
+
+        return self._parameter_types
+
+    def _compile(self) -> Callable[[Resolver], Any]:
+        parameters = [
+            (parameter_type, lazy_type(parameter_type))
+            for parameter_type in self._compiled_parameter_types()
+        ]
+        dependency_type = self._dependency_type
+
+        def construct(resolver: Resolver):
+            return dependency_type(*[
+                resolver(parameter_type) if lazy is None else Lazy(resolver, lazy)
+                for parameter_type, lazy in parameters
+            ])
+
+        return construct
+
+    def _plan(self, resolver: Resolver) -> Any:
+        plan = getattr(resolver, 'plan', None)
+        return plan(self, self._compiled_parameter_types()) if plan is not None else None
+
+    def __call__(self, resolver: Resolver):
+        plan = self._plan(resolver)
+        if plan is not None:
+            return self._dependency_type(*plan.arguments(resolver))
+
+        if self._construct is None:
+            self._construct = self._compile()
+
+        return self._construct(resolver)
+
+    async def _aresolve(self, resolver: Resolver, parameter_type: Type) -> Any:
+        lazy = lazy_type(parameter_type)
+        if lazy is not None:
+            return Lazy(resolver, lazy)
+
+        return await resolver.aresolve(parameter_type)
+
+    async def acall(self, resolver: Resolver):
+        plan = self._plan(resolver)
+        if plan is not None:
+            return self._dependency_type(*await plan.aarguments(resolver))
+
+        dependencies = await asyncio.gather(
+            *[self._aresolve(resolver, parameter_type) for parameter_type in self._compiled_parameter_types()]
+        )
 
-        return self._dependency_type(*args)
+        return self._dependency_type(*dependencies)
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from abc import ABCMeta, get_cache_token
+from typing import Type, Optional, Any
+
+from .composer import Composer
+
+_AMBIGUOUS = object()
+_UNKNOWN = object()
+
+
+class CandidateIndex:
+    def __init__(self, composers: tuple[Composer, ...]):
+        self._composers = composers
+        self._by_id: dict[str, Composer] = {composer.id: composer for composer in composers}
+        self._by_type: dict[Type, Any] = {}
+        self._by_abc: tuple[object, dict[Type, Any]] = (get_cache_token(), {})
+
+        for composer in composers:
+            self._index(composer)
+
+    def _index(self, composer: Composer) -> None:
+        for base in composer.dependency_type.__mro__:
+            if not isinstance(base, ABCMeta):
+                self._by_type[base] = composer if self._by_type.get(base) is None else _AMBIGUOUS
+
+    def with_composers(self, composers: tuple[Composer, ...]) -> CandidateIndex:
+        index = CandidateIndex.__new__(CandidateIndex)
+        index._composers = self._composers + composers
+        index._by_id = {**self._by_id, **{composer.id: composer for composer in composers}}
+        index._by_type = dict(self._by_type)
+        token, by_abc = self._by_abc
+        index._by_abc = (token, {
+            dependency_type: result
+            for dependency_type, result in list(by_abc.items())
+            if not any(issubclass(composer.dependency_type, dependency_type) for composer in composers)
+        })
+        for composer in composers:
+            index._index(composer)
+
+        return index
+
+    def _scan(self, dependency_type: Type) -> Any:
+        memo = self._by_type
+        if isinstance(dependency_type, ABCMeta):
+            token, memo = self._by_abc
+            if token != get_cache_token():
+                token, memo = self._by_abc = (get_cache_token(), {})
+            result = memo.get(dependency_type, _UNKNOWN)
+            if result is not _UNKNOWN:
+                return result
+
+        candidates = [
+            composer
+            for composer in self._composers
+            if issubclass(composer.dependency_type, dependency_type)
+        ]
+        result = _AMBIGUOUS if len(candidates) > 1 else next(iter(candidates), None)
+        memo[dependency_type] = result
+        return result
+
+    def find(self, dependency_type: Type, dependency_id: Optional[str]) -> Optional[Composer]:
+        if dependency_id is not None:
+            composer = self._by_id.get(dependency_id)
+            if composer is None or not issubclass(composer.dependency_type, dependency_type):
+                return None
+            return composer
+
+        result = self._by_type.get(dependency_type, _UNKNOWN)
+        if result is _UNKNOWN:
+            result = self._scan(dependency_type)
+        if result is _AMBIGUOUS:
+            raise Exception(f'More than 1 candidate for type {dependency_type}')
+
+        return result
@@ -1,4 +1,4 @@
-from typing import Protocol, Optional, TypeVar, Generic
+from typing import Protocol, TypeVar, Generic, Iterable, Optional
 
 
 class HasId(Protocol):
@@ -9,27 +9,22 @@ T = TypeVar('T', bound=HasId)
 
 
 class Children(Generic[T]):
-    def __init__(self, value: T, children: dict[str, T]):
-        self._value = value
+    __slots__ = ('_children',)
+
+    def __init__(self, children: Optional[dict[str, T]] = None):
         self._children = children
 
     def add_child(self, child: T):
+        if self._children is None:
+            self._children = {}
         self._children[child.get_id()] = child
 
-    def find_descendant(self, node_id: str) -> Optional[T]:
-        if node_id == self._value.get_id():
-            return self._value
-
-        for child_id, child in self._children.items():
-            result = child.find_scope(node_id)
-            if result is not None:
-                return result
-
-        return None
+    def is_empty(self) -> bool:
+        return not self._children
 
-    def remove_descendant(self, node_id: str) -> None:
-        if node_id in self._children:
-            self._children.pop(node_id)
+    def values(self) -> Iterable[T]:
+        return self._children.values() if self._children is not None else ()
 
-        for child_id, child in self._children.items():
-            child.remove_scope(node_id)
+    def remove_child(self, child_id: str) -> None:
+        if self._children is not None:
+            self._children.pop(child_id, None)
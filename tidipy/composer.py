@@ -1,11 +1,30 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Type, Any, Callable
+from contextlib import AbstractContextManager, AbstractAsyncContextManager
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Type, Any, Callable, Optional
 
+from .auto_factory import AutoFactory
 from .context_filter import ContextFilter
 from .resolver import Resolver
 from .scope_type import ScopeType, RootType
+from .teardowns import Teardowns, exiting, aexiting
+
+
+class FactoryKind(Enum):
+    SYNC = 'sync'
+    ASYNC = 'async'
+    GENERATOR = 'generator'
+    ASYNC_GENERATOR = 'async_generator'
+    CONTEXT_MANAGER = 'context_manager'
+    ASYNC_CONTEXT_MANAGER = 'async_context_manager'
+
+    def is_async(self) -> bool:
+        return self in (FactoryKind.ASYNC, FactoryKind.ASYNC_GENERATOR, FactoryKind.ASYNC_CONTEXT_MANAGER)
+
+    def has_teardown(self) -> bool:
+        return self not in (FactoryKind.SYNC, FactoryKind.ASYNC)
 
 
 @dataclass(frozen=True)
@@ -15,6 +34,11 @@ class Composer:
     context_filter: ContextFilter
     factory: Callable[[Resolver], Any]
     dependency_type: Type
+    kind: FactoryKind = FactoryKind.SYNC
+    pooled: bool = False
+    pool_size: int = 16
+    pool_reset: Optional[Callable[[Any], None]] = None
+    origin: Optional[str] = field(default=None, compare=False)
 
     def __hash__(self) -> int:
         return hash(self.id)
@@ -22,6 +46,51 @@ class Composer:
     def __post_init__(self):
         if self.scope_type == RootType() and not self.context_filter.is_empty():
             raise Exception('Dependency with root scope type cannot have context filter')
+        if self.pooled and not self.supports_storing():
+            raise Exception('Transient dependencies cannot be pooled')
+        if self.pooled and self.kind.has_teardown():
+            raise Exception('Generator composers cannot be pooled')
+        if not self.supports_storing() and self.kind.has_teardown():
+            raise Exception(f'Transient composer {self.id} cannot be a generator: nothing would tear it down')
 
     def supports_storing(self) -> bool:
         return self.scope_type.supports_storing()
+
+    def create(self, resolver: Resolver, teardowns: Teardowns) -> Any:
+        if self.kind.is_async():
+            raise Exception(f'Composer {self.id} is async and can only be resolved with aresolve')
+
+        if self.kind == FactoryKind.GENERATOR:
+            generator = self.factory(resolver)
+            dependency = next(generator)
+            teardowns.push(generator)
+            return dependency
+        if self.kind == FactoryKind.CONTEXT_MANAGER:
+            manager = self.factory(resolver)
+            if not isinstance(manager, AbstractContextManager):
+                raise Exception(f'Composer {self.id} must return a context manager')
+            dependency = manager.__enter__()
+            teardowns.push(exiting(manager))
+            return dependency
+
+        return self.factory(resolver)
+
+    async def acreate(self, resolver: Resolver, teardowns: Teardowns) -> Any:
+        if self.kind == FactoryKind.ASYNC:
+            return await self.factory(resolver)
+        if self.kind == FactoryKind.ASYNC_GENERATOR:
+            generator = self.factory(resolver)
+            dependency = await generator.__anext__()
+            teardowns.push(generator)
+            return dependency
+        if self.kind == FactoryKind.ASYNC_CONTEXT_MANAGER:
+            manager = self.factory(resolver)
+            if not isinstance(manager, AbstractAsyncContextManager):
+                raise Exception(f'Composer {self.id} must return an async context manager')
+            dependency = await manager.__aenter__()
+            teardowns.push(await aexiting(manager))
+            return dependency
+        if isinstance(self.factory, AutoFactory):
+            return await self.factory.acall(resolver)
+
+        return self.create(resolver, teardowns)
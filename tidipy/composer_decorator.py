@@ -1,31 +1,77 @@
 from __future__ import annotations
 
 import builtins
+import collections.abc
+import contextlib
 import inspect
-from typing import Callable, get_type_hints, Optional
+from typing import Callable, get_type_hints, Optional, Type, get_origin, get_args, Any
 
-from .composer import Composer
+from .composer import Composer, FactoryKind
 from .context_filter import parse_context_filter
 from .scope_type import parse_scope_type
 
 
+def _factory_kind(func: Callable) -> FactoryKind:
+    if inspect.iscoroutinefunction(func):
+        return FactoryKind.ASYNC
+    if inspect.isasyncgenfunction(func):
+        return FactoryKind.ASYNC_GENERATOR
+    if inspect.isgeneratorfunction(func):
+        return FactoryKind.GENERATOR
+
+    wrapped = inspect.unwrap(func)
+    if wrapped is not func and inspect.isgeneratorfunction(wrapped):
+        return FactoryKind.CONTEXT_MANAGER
+    if wrapped is not func and inspect.isasyncgenfunction(wrapped):
+        return FactoryKind.ASYNC_CONTEXT_MANAGER
+
+    return FactoryKind.SYNC
+
+
+_GENERATOR_TYPES = (
+    collections.abc.Generator,
+    collections.abc.Iterator,
+    collections.abc.AsyncGenerator,
+    collections.abc.AsyncIterator,
+    contextlib.AbstractContextManager,
+    contextlib.AbstractAsyncContextManager
+)
+
+
+def _dependency_type(func: Callable, kind: FactoryKind) -> Type:
+    return_type = get_type_hints(func).get('return', object)
+    if kind.has_teardown() and get_origin(return_type) in _GENERATOR_TYPES:
+        return get_args(return_type)[0]
+
+    return return_type
+
+
 def composer(
     factory: Optional[Callable] = None,
     *,
     id: Optional[str] = None,
     scope_type: str = 'root',
+    pooled: bool = False,
+    pool_size: int = 16,
+    pool_reset: Optional[Callable[[Any], None]] = None,
     **kwargs: str | set[str]
 ):
     parsed_scope_type = parse_scope_type(scope_type)
 
     def inner(func: Callable):
         has_parameter = len(inspect.signature(func).parameters) > 0
+        kind = _factory_kind(func)
         return Composer(
             id=str(builtins.id(func)) if id is None else id,
             scope_type=parsed_scope_type,
             context_filter=parse_context_filter(**kwargs),
             factory=func if has_parameter else lambda resolve: func(),
-            dependency_type=get_type_hints(func).get('return', object)
+            dependency_type=_dependency_type(func, kind),
+            kind=kind,
+            pooled=pooled,
+            pool_size=pool_size,
+            pool_reset=pool_reset,
+            origin=f'{func.__module__}:{func.__qualname__}'
         )
 
     if factory is not None:
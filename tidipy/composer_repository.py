@@ -1,24 +1,63 @@
+import threading
+from typing import Iterable
+
 from .composer import Composer
+from .scope_template import ScopeTemplates, ScopeTemplate
+from .validation import validate
 
 
 class ComposerRepository:
-    _composers: set[Composer] = set()
+    def __init__(self):
+        self._composers: dict[str, Composer] = {}
+        self._templates = ScopeTemplates()
+        self._generation = 0
+        self._frozen = False
+        self._validated: list[ScopeTemplate] = []
+        self._lock = threading.Lock()
+
+    def add_composer(self, composer: Composer) -> None:
+        self.add_composers([composer])
+
+    def add_composers(self, composers: Iterable[Composer]) -> None:
+        with self._lock:
+            added: dict[str, Composer] = {}
+            for composer in composers:
+                existing = self._composers.get(composer.id, added.get(composer.id))
+                if existing == composer:
+                    continue
+                if self._frozen:
+                    raise Exception(f'Cannot add composer {composer.id} after freezing')
+                if existing is not None:
+                    raise Exception(f'Duplicate composer with id {composer.id}')
+                added[composer.id] = composer
+
+            if len(added) == 0:
+                return
+
+            self._composers.update(added)
+            self._generation += 1
+            self._templates.add(list(added.values()), self._generation)
+
+    def get_composers(self) -> set[Composer]:
+        return set(self._composers.values())
 
-    @classmethod
-    def add_composer(cls, composer: Composer) -> None:
-        if composer in cls._composers:
-            return
-        existing_ids = {composer.id for composer in cls._composers}
-        if composer.id in existing_ids:
-            raise Exception(f'Duplicate composer with id {composer.id}')
+    def generation(self) -> int:
+        return self._generation
 
-        cls._composers.add(composer)
+    def get_templates(self) -> ScopeTemplates:
+        return self._templates
 
-    @classmethod
-    def get_composers(cls) -> set[Composer]:
-        return cls._composers
+    def freeze(self) -> None:
+        errors, validated = validate(self.get_composers(), self._templates)
+        if len(errors) > 0:
+            raise Exception('Invalid composition:\n' + '\n'.join(errors))
 
-    @classmethod
-    def reset(cls) -> None:
-        cls._composers = set()
+        self._validated = validated
+        self._frozen = True
 
+    def reset(self) -> None:
+        self._composers = {}
+        self._templates = ScopeTemplates()
+        self._generation = 0
+        self._frozen = False
+        self._validated = []
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import gc
+from concurrent.futures import Future
+from contextvars import ContextVar
+from pathlib import Path
+from types import ModuleType
+from time import monotonic
+from typing import Optional, Type, Union, Callable
+
+from .auto_compose import auto_composer
+from .composer import Composer
+from .composer_repository import ComposerRepository
+from .eviction import EvictionPolicy, Sweeper
+from .inventory import Inventory, take_inventory
+from .leaks import Leak
+from .manifest import write_manifest, read_manifest
+from .observer import Observer
+from .pool import PoolStats
+from .resolver import Resolver
+from .root_scope_provider import RootScopeProvider
+from .scan import ScanReport, scan_package
+from .scope import Scope
+from .scope_block import ScopeBlock, current_scope
+from .scope_context import ScopeContext
+from .scope_type import parse_scope_type
+from .warmup import warmup_scope, warmup_in_background, awarmup_scope
+
+
+class Container:
+    def __init__(self, clock: Callable[[], float] = monotonic):
+        self._repository = ComposerRepository()
+        self._root = RootScopeProvider(self._repository, clock)
+        self._clock = clock
+
+    def repository(self) -> ComposerRepository:
+        return self._repository
+
+    def register(self, *composers: Composer) -> None:
+        self._repository.add_composers(composers)
+
+    def auto_compose(self, dependency_type: Type, **options) -> None:
+        self._repository.add_composer(auto_composer(dependency_type, **options))
+
+    def scan(
+        self,
+        package: ModuleType,
+        static: bool = False,
+        cache: Union[bool, str, Path] = True,
+        max_workers: Optional[int] = None
+    ) -> ScanReport:
+        token = _registering.set(self)
+        try:
+            return scan_package(self._repository, package, static, cache, max_workers)
+        finally:
+            _registering.reset(token)
+
+    def export_manifest(self, path: Union[str, Path], package: ModuleType) -> None:
+        write_manifest(self._repository, path, package)
+
+    def load_manifest(
+        self,
+        path: Union[str, Path],
+        package: ModuleType,
+        rebuild: bool = True,
+        **scan_options
+    ) -> ScanReport:
+        token = _registering.set(self)
+        try:
+            report = read_manifest(self._repository, path, package)
+        finally:
+            _registering.reset(token)
+        if report is not None:
+            return report
+
+        report = self.scan(package, **scan_options)
+        if rebuild and len(report.failed) == 0:
+            try:
+                self.export_manifest(path, package)
+            except Exception:
+                pass
+
+        return report
+
+    def ensure_scope(
+        self,
+        scope_id: str,
+        scope_type: str,
+        parent_id: str = 'root',
+        context: Optional[dict[str, str]] = None,
+        warmup: bool = False
+    ) -> Optional[Future]:
+        parsed_scope_type = parse_scope_type(scope_type)
+        parsed_context = ScopeContext(context) if context is not None else ScopeContext.empty()
+        root_scope = self._root.get()
+
+        with root_scope.lock(scope_id):
+            existing_scope = root_scope.find_scope(scope_id)
+            created = existing_scope is None
+
+            if created:
+                parent_scope = root_scope.find_scope(parent_id)
+                existing_scope = parent_scope.add_scope(
+                    scope_id=scope_id,
+                    scope_type=parsed_scope_type,
+                    context=parsed_context
+                )
+            elif not existing_scope.matches(parsed_scope_type, parent_id, parsed_context):
+                raise Exception
+            else:
+                existing_scope.touch()
+
+        if created:
+            self._root.evict(parsed_scope_type)
+
+        if warmup:
+            return warmup_in_background(existing_scope)
+
+        return None
+
+    def _get_scope(self, scope_id: str) -> Scope:
+        scope = self._root.get().find_scope(scope_id)
+        if scope is None:
+            raise Exception(f'Scope {scope_id} does not exist')
+
+        return scope
+
+    def get_resolver(self, scope_id: str = 'root') -> Resolver:
+        return self._root.get().find_scope(scope_id).resolver()
+
+    def clear_scope(self, scope_id: str, concurrent: bool = False) -> None:
+        if scope_id == 'root':
+            self._root.clear(concurrent)
+            return
+        root_scope = self._root.get()
+        with root_scope.lock(scope_id):
+            scope = root_scope.find_scope(scope_id)
+            subtrees = scope.release() if scope is not None else None
+
+        if subtrees is not None:
+            scope.close(subtrees, concurrent)
+
+    async def aclear_scope(self, scope_id: str, concurrent: bool = False) -> None:
+        if scope_id == 'root':
+            await self._root.aclear(concurrent)
+            return
+        await self._root.get().aremove_scope(scope_id, concurrent)
+
+    def scope(
+        self,
+        scope_type: str,
+        parent: Union[str, Resolver, None] = None,
+        *,
+        scope_id: Optional[str] = None,
+        context: Optional[dict[str, str]] = None
+    ) -> ScopeBlock:
+        return ScopeBlock(self._root, scope_type=scope_type, parent=parent, scope_id=scope_id, context=context)
+
+    def current_resolver(self) -> Resolver:
+        root_scope = self._root.get()
+        current = current_scope()
+        return current.resolver() if current is not None and current.shares_tree(root_scope) else root_scope.resolver()
+
+    def reset(self) -> None:
+        self._root.reset()
+        self._root.set_observer(None)
+        self._root.reset_eviction()
+        self._root.reset_leak_detection()
+        self._repository.reset()
+
+    def set_observer(self, observer: Optional[Observer]) -> None:
+        self._root.set_observer(observer)
+
+    def set_eviction_policy(
+        self,
+        scope_type: str,
+        ttl: Optional[float] = None,
+        max_scopes: Optional[int] = None,
+        max_instances: Optional[int] = None
+    ) -> None:
+        policy = EvictionPolicy(ttl, max_scopes, max_instances)
+        self._root.set_eviction_policy(parse_scope_type(scope_type), policy if policy != EvictionPolicy() else None)
+
+    def evict_idle(self) -> int:
+        return self._root.evict()
+
+    def evict_idle_every(self, interval: float) -> Sweeper:
+        return self._root.sweep(interval)
+
+    def inventory(self) -> Inventory:
+        return take_inventory(self._root.get(), self._clock)
+
+    def detect_leaks(self, scope_type: str, max_age: Optional[float]) -> None:
+        self._root.set_leak_threshold(parse_scope_type(scope_type), max_age)
+
+    def check_leaks(self) -> list[Leak]:
+        return self._root.leak_detector().leaks()
+
+    def freeze(self) -> None:
+        self._repository.freeze()
+
+    def freeze_root(self) -> None:
+        self._root.get()
+        gc.collect()
+        gc.freeze()
+
+    def pool_stats(self) -> dict[str, PoolStats]:
+        return self._repository.get_templates().pool_stats()
+
+    def warmup(self, scope_id: str = 'root', max_workers: Optional[int] = None) -> dict[str, float]:
+        return warmup_scope(self._get_scope(scope_id), max_workers)
+
+    async def awarmup(self, scope_id: str = 'root') -> dict[str, float]:
+        return await awarmup_scope(self._get_scope(scope_id))
+
+
+_default = Container()
+_registering: ContextVar[Optional[Container]] = ContextVar('registering', default=None)
+
+
+def default_container() -> Container:
+    return _default
+
+
+def registering_container() -> Container:
+    container = _registering.get()
+    return container if container is not None else _default
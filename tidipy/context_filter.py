@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from tidipy.scope_context import ScopeContext
 
@@ -6,33 +6,45 @@ from tidipy.scope_context import ScopeContext
 @dataclass(frozen=True)
 class ContextFilterElement:
     key: str
-    one_of_values: set[str]
+    one_of_values: frozenset[str]
 
     def is_fulfilled_by(self, context: ScopeContext) -> bool:
-        if self.key not in context.values():
-            return True
-
-        return context.values()[self.key] in self.one_of_values
+        value = context.values().get(self.key)
+        return value is None or value in self.one_of_values
 
 
 @dataclass(frozen=True)
 class ContextFilter:
-    elements: set[ContextFilterElement]
+    elements: frozenset[ContextFilterElement]
+    _allowed: tuple[tuple[str, frozenset[str]], ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            '_allowed',
+            tuple((element.key, element.one_of_values) for element in self.elements)
+        )
 
     def is_fulfilled_by(self, context: ScopeContext) -> bool:
-        return all(element.is_fulfilled_by(context) for element in self.elements)
+        values = context.values()
+        for key, allowed in self._allowed:
+            value = values.get(key)
+            if value is not None and value not in allowed:
+                return False
+
+        return True
 
     def is_empty(self) -> bool:
-        return len(self.elements) == 0
+        return len(self._allowed) == 0
 
 
 def parse_context_filter(**kwargs) -> ContextFilter:
     return ContextFilter(
-            elements={
+            elements=frozenset(
                 ContextFilterElement(
                     key=key,
-                    one_of_values=frozenset(value) if isinstance(value, set) else frozenset({value})  # type: ignore
+                    one_of_values=frozenset(value) if isinstance(value, set) else frozenset({value})
                 )
                 for key, value in kwargs.items()
-            }
+            )
         )
@@ -1,29 +1,79 @@
 from __future__ import annotations
 
-from typing import Optional, Type, Any
-from .resolver import Resolver
+import asyncio
+import threading
+from contextvars import ContextVar
+from time import perf_counter
+from types import MappingProxyType
+from typing import Optional, Type, Any, Mapping
+
 from .composer import Composer
+from .eviction import Usage
+from .observer import Instrumentation, BuildEvent
+from .pool import EMPTY
+from .resolver import Resolver
+from .scope_template import ScopeTemplate
+from .teardowns import Teardowns
+
+_MISSING = object()
+_NONE: Mapping[str, Any] = MappingProxyType({})
+
+
+def _wake(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class _Flight:
+    __slots__ = ('owner', 'is_async', 'lock', 'error', 'waiters')
+
+    def __init__(self, owner: int, is_async: bool):
+        self.owner = owner
+        self.is_async = is_async
+        self.lock = threading.Lock()
+        self.lock.acquire()
+        self.error: Optional[BaseException] = None
+        self.waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+    def waiter(self) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.waiters.append((loop, future))
+        return future
+
+    def land(self, error: Optional[BaseException]) -> None:
+        self.error = error
+        self.lock.release()
+        for loop, future in self.waiters:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(_wake, future)
+
+
+_building: ContextVar[frozenset[tuple[int, str]]] = ContextVar('building', default=frozenset())
 
 
 class DependencyBag:
-    def __init__(self, composers: list[Composer]):
-        self._composers = composers
-        self._dependencies: dict[str, Any] = {}
+    __slots__ = (
+        '_template', '_instrumentation', '_usage', '_dependencies', '_lock', '_in_flight', '_teardowns'
+    )
 
-    def _get_candidates(
-        self,
-        dependency_type: Type,
-        dependency_id: Optional[str]
-    ) -> list[Composer]:
-        candidates = [
-            composer
-            for composer in self._composers
-            if issubclass(composer.dependency_type, dependency_type)
-        ]
-        if dependency_id is not None:
-            candidates = [composer for composer in candidates if composer.id == dependency_id]
-
-        return candidates
+    def __init__(self, template: ScopeTemplate, instrumentation: Instrumentation, usage: Optional[Usage] = None):
+        self._template = template
+        self._instrumentation = instrumentation
+        self._usage = usage
+        self._dependencies: Mapping[str, Any] = _NONE
+        self._lock = threading.Lock()
+        self._in_flight: Mapping[str, _Flight] = _NONE
+        self._teardowns = Teardowns()
+
+    def lookup(self, dependency_type: Type, dependency_id: Optional[str]) -> Optional[Composer]:
+        return self._template.index.find(dependency_type, dependency_id)
+
+    def contains(self, composer: Composer) -> bool:
+        return composer.id in self._dependencies
+
+    def stored(self) -> list[Any]:
+        return list(self._dependencies.values())
 
     def find(
         self,
@@ -31,21 +81,197 @@ class DependencyBag:
         dependency_id: Optional[str],
         resolver: Resolver
     ) -> Optional[Any]:
-        candidates = self._get_candidates(dependency_type, dependency_id)
+        composer = self._template.index.find(dependency_type, dependency_id)
+        if composer is None:
+            return None
+
+        dependency = self._dependencies.get(composer.id, _MISSING)
+        if dependency is not _MISSING:
+            return dependency
+
+        return self._build(composer, resolver)
+
+    def get(self, composer: Composer, resolver: Resolver) -> Any:
+        dependency = self._dependencies.get(composer.id, _MISSING)
+        if dependency is not _MISSING:
+            return dependency
+
+        return self._build(composer, resolver)
+
+    def _build(self, composer: Composer, resolver: Resolver) -> Any:
+        if not composer.supports_storing():
+            return self._construct(composer, resolver)
 
-        if len(candidates) == 0:
+        return self._build_once(composer, resolver)
+
+    async def afind(
+        self,
+        dependency_type: Type,
+        dependency_id: Optional[str],
+        resolver: Resolver
+    ) -> Optional[Any]:
+        composer = self._template.index.find(dependency_type, dependency_id)
+        if composer is None:
             return None
-        if len(candidates) > 1:
-            raise Exception(f'More than 1 candidate for type {dependency_type}')
 
-        composer = next(iter(candidates))
-        composer_id = composer.id
-        if composer_id in self._dependencies:
-            return self._dependencies[composer_id]
+        return await self.aget(composer, resolver)
+
+    async def aget(self, composer: Composer, resolver: Resolver) -> Any:
+        dependency = self._dependencies.get(composer.id, _MISSING)
+        if dependency is not _MISSING:
+            return dependency
+
+        if not composer.supports_storing():
+            return await self._aconstruct(composer, resolver)
 
-        dependency = composer.factory(resolver)
+        return await self._abuild_once(composer, resolver)
 
-        if composer.supports_storing():
-            self._dependencies[composer_id] = dependency
+    def _construct(self, composer: Composer, resolver: Resolver) -> Any:
+        observer = self._instrumentation.observer
+        if observer is None:
+            return composer.create(resolver, self._teardowns)
+
+        start = perf_counter()
+        dependency = composer.create(resolver, self._teardowns)
+        observer.on_build(BuildEvent(composer.id, perf_counter() - start))
+
+        return dependency
+
+    async def _aconstruct(self, composer: Composer, resolver: Resolver) -> Any:
+        observer = self._instrumentation.observer
+        if observer is None:
+            return await composer.acreate(resolver, self._teardowns)
+
+        start = perf_counter()
+        dependency = await composer.acreate(resolver, self._teardowns)
+        observer.on_build(BuildEvent(composer.id, perf_counter() - start))
+
+        return dependency
+
+    def _acquire_pooled(self, composer: Composer) -> Any:
+        if not composer.pooled:
+            return EMPTY
+
+        return self._template.pools[composer.id].acquire()
+
+    def _create(self, composer: Composer, resolver: Resolver) -> Any:
+        dependency = self._acquire_pooled(composer)
+        if dependency is EMPTY:
+            dependency = self._construct(composer, resolver)
+
+        return dependency
+
+    def _start(self, composer_id: str, is_async: bool) -> _Flight:
+        if self._in_flight is _NONE:
+            self._in_flight = {}
+        flight = self._in_flight[composer_id] = _Flight(threading.get_ident(), is_async)
+        return flight
+
+    def _land(self, composer_id: str, flight: _Flight, dependency: Any, error: Optional[BaseException]) -> None:
+        with self._lock:
+            if error is None:
+                self._store(composer_id, dependency)
+            del self._in_flight[composer_id]
+        flight.land(error)
+
+    def _build_once(self, composer: Composer, resolver: Resolver) -> Any:
+        with self._lock:
+            dependency = self._dependencies.get(composer.id, _MISSING)
+            if dependency is not _MISSING:
+                return dependency
+
+            flight = self._in_flight.get(composer.id)
+            owner = flight is None
+            if owner:
+                flight = self._start(composer.id, False)
+
+        if not owner:
+            if flight.owner == threading.get_ident() and flight.is_async:
+                raise Exception(
+                    f'Composer {composer.id} is being built by aresolve on this thread, use aresolve to wait for it'
+                )
+            if flight.owner == threading.get_ident():
+                raise Exception(f'Circular dependency on composer {composer.id}')
+            with flight.lock:
+                if flight.error is not None:
+                    raise flight.error
+                return self._dependencies[composer.id]
+
+        try:
+            dependency = self._create(composer, resolver)
+        except BaseException as e:
+            self._land(composer.id, flight, _MISSING, e)
+            raise
+
+        self._land(composer.id, flight, dependency, None)
+        if self._usage is not None:
+            self._usage.stored()
+
+        return dependency
+
+    async def _abuild_once(self, composer: Composer, resolver: Resolver) -> Any:
+        key = (id(self), composer.id)
+        building = _building.get()
+        if key in building:
+            raise Exception(f'Circular dependency on composer {composer.id}')
+
+        with self._lock:
+            dependency = self._dependencies.get(composer.id, _MISSING)
+            if dependency is not _MISSING:
+                return dependency
+
+            flight = self._in_flight.get(composer.id)
+            waiter = flight.waiter() if flight is not None else None
+            if flight is None:
+                flight = self._start(composer.id, True)
+
+        if waiter is not None:
+            await waiter
+            if flight.error is not None:
+                raise flight.error
+            return self._dependencies[composer.id]
+
+        token = _building.set(building | {key})
+        try:
+            dependency = self._acquire_pooled(composer)
+            if dependency is EMPTY:
+                dependency = await self._aconstruct(composer, resolver)
+        except BaseException as e:
+            self._land(composer.id, flight, _MISSING, e)
+            raise
+        finally:
+            _building.reset(token)
+
+        self._land(composer.id, flight, dependency, None)
+        if self._usage is not None:
+            self._usage.stored()
 
         return dependency
+
+    def _store(self, composer_id: str, dependency: Any) -> None:
+        if self._dependencies is _NONE:
+            self._dependencies = {}
+        self._dependencies[composer_id] = dependency
+
+    def has_async_teardowns(self) -> bool:
+        return self._teardowns.has_async()
+
+    def _release_pooled(self) -> None:
+        if self._dependencies is _NONE:
+            return
+        for composer_id, pool in self._template.pools.items():
+            dependency = self._dependencies.pop(composer_id, _MISSING)
+            if dependency is not _MISSING:
+                pool.release(dependency)
+
+    def close(self) -> None:
+        try:
+            self._teardowns.close()
+        finally:
+            self._release_pooled()
+
+    async def aclose(self, offload: bool = False) -> None:
+        try:
+            await self._teardowns.aclose(offload)
+        finally:
+            self._release_pooled()
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+from pathlib import Path
+from typing import Iterator, Optional
+
+MARKERS = frozenset({'composer', 'auto_compose', 'Composer'})
+
+
+def walk_paths(path: Path, prefix: str) -> Iterator[tuple[str, Path]]:
+    for item in sorted(path.iterdir()):
+        if item.is_dir():
+            yield from walk_paths(item, f"{prefix}.{item.name}")
+        elif item.suffix == '.py' and item.name != '__init__.py':
+            yield f"{prefix}.{item.stem}", item
+
+
+def _is_marker(node: ast.expr, names: set[str]) -> bool:
+    if isinstance(node, ast.Call):
+        node = node.func
+    if isinstance(node, ast.Name):
+        return node.id in names
+    if isinstance(node, ast.Attribute):
+        return node.attr in MARKERS
+
+    return False
+
+
+def contains_composers(source: bytes) -> bool:
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return True
+
+    names = set(MARKERS)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom):
+            names |= {alias.asname for alias in node.names if alias.name in MARKERS and alias.asname is not None}
+
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            if any(_is_marker(decorator, names) for decorator in node.decorator_list):
+                return True
+        if isinstance(node, ast.Call) and _is_marker(node.func, names):
+            return True
+
+    return False
+
+
+class DiscoveryCache:
+    def __init__(self, path: Optional[Path]):
+        self._path = path
+        self._entries: dict[str, dict] = {}
+        self._changed = False
+        if path is not None:
+            try:
+                self._entries = json.loads(path.read_text())
+            except (OSError, ValueError):
+                self._entries = {}
+
+    def contains_composers(self, file: Path) -> bool:
+        key = str(file)
+        stat = file.stat()
+        entry = self._entries.get(key)
+        if entry is not None and entry['mtime'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            return entry['composers']
+
+        source = file.read_bytes()
+        digest = hashlib.sha256(source).hexdigest()
+        if entry is not None and entry['hash'] == digest:
+            composers = entry['composers']
+        else:
+            composers = contains_composers(source)
+
+        self._entries[key] = {'mtime': stat.st_mtime_ns, 'size': stat.st_size, 'hash': digest, 'composers': composers}
+        self._changed = True
+        return composers
+
+    def save(self) -> None:
+        if self._path is None or not self._changed:
+            return
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._path.write_text(json.dumps(self._entries))
+        except OSError:
+            pass
+
+
+def discover(path: Path, prefix: str, cache_path: Optional[Path]) -> list[str]:
+    cache = DiscoveryCache(cache_path)
+    module_names = [
+        module_name
+        for module_name, file in walk_paths(path, prefix)
+        if cache.contains_composers(file)
+    ]
+    cache.save()
+
+    return module_names
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import itertools
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from time import monotonic
+from typing import Optional, Any, Callable
+
+from .scope_type import ScopeType
+
+_keys = itertools.count()
+_TOUCH_RESOLUTION = 0.001
+
+
+@dataclass(frozen=True)
+class EvictionPolicy:
+    ttl: Optional[float] = None
+    max_scopes: Optional[int] = None
+    max_instances: Optional[int] = None
+
+
+class Usage:
+    def __init__(self, tracker: EvictionTracker, key: int):
+        self._tracker = tracker
+        self._key = key
+
+    def touch(self) -> None:
+        self._tracker.touch(self._key)
+
+    def stored(self) -> None:
+        self._tracker.stored(self._key)
+
+    def forget(self) -> None:
+        self._tracker.forget(self._key)
+
+
+class Activity:
+    __slots__ = ('usages',)
+
+    def __init__(self, usages: tuple[Usage, ...]):
+        self.usages = usages
+
+    def touch(self) -> None:
+        for usage in self.usages:
+            usage.touch()
+
+
+class EvictionTracker:
+    def __init__(self, policy: EvictionPolicy, clock: Callable[[], float] = monotonic):
+        self._policy = policy
+        self._clock = clock
+        self._entries: OrderedDict[int, list] = OrderedDict()
+        self._instances = 0
+        self._lock = threading.Lock()
+
+    def add(self, scope: Any) -> Usage:
+        key = next(_keys)
+        with self._lock:
+            self._entries[key] = [weakref.ref(scope), self._clock(), 0]
+
+        return Usage(self, key)
+
+    def touch(self, key: int) -> None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+        now = self._clock()
+        if now - entry[1] < _TOUCH_RESOLUTION:
+            return
+        entry[1] = now
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+
+    def stored(self, key: int) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            entry[2] += 1
+            self._instances += 1
+            over_budget = self._policy.max_instances is not None and self._instances > self._policy.max_instances
+
+        if over_budget:
+            self.evict()
+
+    def forget(self, key: int) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._instances -= entry[2]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _victims(self, now: float) -> list[Any]:
+        policy = self._policy
+        victims = []
+        dead = []
+        with self._lock:
+            remaining = len(self._entries)
+            instances = self._instances
+            for key, (scope_ref, last_used, stored) in self._entries.items():
+                scope = scope_ref()
+                if scope is None:
+                    dead.append(key)
+                    remaining -= 1
+                    instances -= stored
+                    continue
+
+                expired = policy.ttl is not None and now - last_used > policy.ttl
+                over = remaining > 1 and (
+                    policy.max_scopes is not None and remaining > policy.max_scopes
+                    or policy.max_instances is not None and instances > policy.max_instances
+                )
+                if not expired and not over:
+                    break
+                if scope.has_async_teardowns():
+                    continue
+
+                victims.append(scope)
+                remaining -= 1
+                instances -= stored
+
+            for key in dead:
+                self._instances -= self._entries.pop(key)[2]
+
+        return victims
+
+    def evict(self) -> int:
+        victims = self._victims(self._clock())
+
+        errors = []
+        for scope in victims:
+            try:
+                scope.evict()
+            except Exception as e:
+                errors.append(e)
+
+        if len(errors) > 0:
+            raise errors[0]
+
+        return len(victims)
+
+
+class Eviction:
+    def __init__(self, clock: Callable[[], float] = monotonic):
+        self._clock = clock
+        self._trackers: dict[ScopeType, EvictionTracker] = {}
+
+    def set_policy(self, scope_type: ScopeType, policy: Optional[EvictionPolicy]) -> None:
+        if policy is None:
+            self._trackers.pop(scope_type, None)
+        else:
+            self._trackers[scope_type] = EvictionTracker(policy, self._clock)
+
+    def track(self, scope_type: ScopeType, scope: Any) -> Optional[Usage]:
+        tracker = self._trackers.get(scope_type) if self._trackers else None
+        return tracker.add(scope) if tracker is not None else None
+
+    def evict(self, scope_type: Optional[ScopeType] = None) -> int:
+        if scope_type is not None:
+            tracker = self._trackers.get(scope_type) if self._trackers else None
+            return tracker.evict() if tracker is not None else 0
+
+        return sum(tracker.evict() for tracker in list(self._trackers.values()))
+
+
+class Sweeper:
+    def __init__(self, evict: Callable[[], int], interval: float):
+        self._evict = evict
+        self._interval = interval
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='tidipy-eviction', daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            try:
+                self._evict()
+            except Exception:
+                pass
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
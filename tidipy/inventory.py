@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import gc
+import sys
+from dataclasses import dataclass, field
+from time import monotonic
+from types import ModuleType, FunctionType, BuiltinFunctionType, MethodType
+from typing import Any, Optional, Callable, TYPE_CHECKING
+
+from .observer import Histogram
+
+if TYPE_CHECKING:
+    from .scope import Scope
+
+AGE_BUCKETS = (1.0, 10.0, 60.0, 600.0, 3600.0, 86400.0)
+SIZE_DEPTH = 4
+SIZE_MAX_OBJECTS = 10_000
+_SHARED = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType)
+
+
+@dataclass(frozen=True)
+class ScopeInfo:
+    scope_id: str
+    scope_type: str
+    parent_id: Optional[str]
+    age: float
+    instances: int
+    retained_size: int
+
+
+@dataclass
+class Inventory:
+    scopes: list[ScopeInfo] = field(default_factory=list)
+    by_type: dict[str, int] = field(default_factory=dict)
+    by_parent: dict[str, int] = field(default_factory=dict)
+    ages: dict[str, Histogram] = field(default_factory=dict)
+
+    def add(self, info: ScopeInfo) -> None:
+        self.scopes.append(info)
+        self.by_type[info.scope_type] = self.by_type.get(info.scope_type, 0) + 1
+        if info.parent_id is not None:
+            self.by_parent[info.parent_id] = self.by_parent.get(info.parent_id, 0) + 1
+        self.ages.setdefault(info.scope_type, Histogram(AGE_BUCKETS)).record(info.age)
+
+    @property
+    def instances(self) -> int:
+        return sum(info.instances for info in self.scopes)
+
+    @property
+    def retained_size(self) -> int:
+        return sum(info.retained_size for info in self.scopes)
+
+    def oldest(self, n: int = 10) -> list[ScopeInfo]:
+        return sorted(self.scopes, key=lambda info: info.age, reverse=True)[:n]
+
+
+def retained_size(instances: list[Any], depth: int = SIZE_DEPTH, max_objects: int = SIZE_MAX_OBJECTS) -> int:
+    seen = {id(instance) for instance in instances}
+    level = list(instances)
+    size = 0
+    for _ in range(depth + 1):
+        referents = []
+        for obj in level:
+            size += sys.getsizeof(obj)
+            if len(seen) >= max_objects:
+                return size
+            for referent in gc.get_referents(obj):
+                if id(referent) not in seen and not isinstance(referent, _SHARED):
+                    seen.add(id(referent))
+                    referents.append(referent)
+        level = referents
+
+    return size
+
+
+def take_inventory(root_scope: Scope, clock: Callable[[], float] = monotonic) -> Inventory:
+    now = clock()
+    inventory = Inventory()
+    pending = [root_scope]
+    while len(pending) > 0:
+        scope = pending.pop()
+        inventory.add(scope.info(now))
+        pending.extend(scope.children())
+
+    return inventory
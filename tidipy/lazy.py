@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import weakref
+from typing import Generic, TypeVar, Type, Optional, Any, get_origin, get_args
+
+from .resolver import Resolver
+
+T = TypeVar('T')
+
+_MISSING: Any = object()
+
+
+class Lazy(Generic[T]):
+    def __init__(self, resolver: Resolver, dependency_type: Type[T]):
+        self._resolver = weakref.ref(resolver)
+        self._dependency_type = dependency_type
+        self._value: T = _MISSING
+
+    def _get_resolver(self) -> Resolver:
+        resolver = self._resolver()
+        if resolver is None:
+            raise Exception(f'Scope of lazy dependency {self._dependency_type} has been cleared')
+
+        return resolver
+
+    def get(self) -> T:
+        if self._value is _MISSING:
+            self._value = self._get_resolver()(self._dependency_type)
+
+        return self._value
+
+    async def aget(self) -> T:
+        if self._value is _MISSING:
+            self._value = await self._get_resolver().aresolve(self._dependency_type)
+
+        return self._value
+
+
+def lazy_type(annotation: Any) -> Optional[Type]:
+    if get_origin(annotation) is Lazy:
+        return get_args(annotation)[0]
+
+    return None
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import itertools
+import os
+import threading
+import traceback
+import warnings
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from time import monotonic
+from typing import Optional, Any, Callable
+
+from .scope_type import ScopeType
+
+_keys = itertools.count()
+_package_dir = os.path.dirname(os.path.abspath(__file__))
+_STACK_LIMIT = 8
+
+
+class ScopeLeakWarning(UserWarning):
+    pass
+
+
+@dataclass(frozen=True)
+class Leak:
+    scope_id: str
+    scope_type: str
+    age: float
+    created_at: tuple[str, ...]
+
+    def __str__(self) -> str:
+        return f'Scope {self.scope_id} of type {self.scope_type} is alive for {self.age:.1f}s, created at:\n' \
+               + ''.join(self.created_at)
+
+
+def _creation_stack() -> tuple[str, ...]:
+    frames = [frame for frame in traceback.extract_stack() if not frame.filename.startswith(_package_dir)]
+    return tuple(traceback.format_list(frames[-_STACK_LIMIT:]))
+
+
+class Watch:
+    def __init__(self, tracker: LeakTracker, key: int):
+        self._tracker = tracker
+        self._key = key
+
+    def forget(self) -> None:
+        self._tracker.forget(self._key)
+
+
+class LeakTracker:
+    def __init__(self, scope_type: ScopeType, max_age: float, clock: Callable[[], float] = monotonic):
+        self._scope_type = scope_type
+        self._max_age = max_age
+        self._clock = clock
+        self._pending: OrderedDict[int, tuple] = OrderedDict()
+        self._reported: dict[int, tuple] = {}
+        self._lock = threading.Lock()
+
+    def add(self, scope_id: str, scope: Any) -> Watch:
+        key = next(_keys)
+        entry = (weakref.ref(scope), scope_id, self._clock(), _creation_stack())
+        with self._lock:
+            self._pending[key] = entry
+
+        self.check()
+        return Watch(self, key)
+
+    def forget(self, key: int) -> None:
+        with self._lock:
+            if self._pending.pop(key, None) is None:
+                self._reported.pop(key, None)
+
+    def _leak(self, entry: tuple, now: float) -> Leak:
+        _, scope_id, created, stack = entry
+        return Leak(scope_id, self._scope_type.name(), now - created, stack)
+
+    def check(self) -> list[Leak]:
+        now = self._clock()
+        leaks = []
+        with self._lock:
+            while len(self._pending) > 0:
+                key, entry = next(iter(self._pending.items()))
+                if now - entry[2] <= self._max_age:
+                    break
+                del self._pending[key]
+                if entry[0]() is not None:
+                    self._reported[key] = entry
+                    leaks.append(self._leak(entry, now))
+
+        for leak in leaks:
+            warnings.warn(str(leak), ScopeLeakWarning, stacklevel=2)
+
+        return leaks
+
+    def leaks(self) -> list[Leak]:
+        self.check()
+        now = self._clock()
+        with self._lock:
+            return [self._leak(entry, now) for entry in self._reported.values() if entry[0]() is not None]
+
+
+class LeakDetector:
+    def __init__(self, clock: Callable[[], float] = monotonic):
+        self._clock = clock
+        self._trackers: dict[ScopeType, LeakTracker] = {}
+
+    def set_threshold(self, scope_type: ScopeType, max_age: Optional[float]) -> None:
+        if max_age is None:
+            self._trackers.pop(scope_type, None)
+        else:
+            self._trackers[scope_type] = LeakTracker(scope_type, max_age, self._clock)
+
+    def track(self, scope_type: ScopeType, scope_id: str, scope: Any) -> Optional[Watch]:
+        tracker = self._trackers.get(scope_type) if self._trackers else None
+        return tracker.add(scope_id, scope) if tracker is not None else None
+
+    def leaks(self) -> list[Leak]:
+        return [leak for tracker in list(self._trackers.values()) for leak in tracker.leaks()]
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import builtins
+import importlib
+import json
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Optional, Union
+
+from .auto_factory import AutoFactory
+from .composer import Composer, FactoryKind
+from .composer_repository import ComposerRepository
+from .context_filter import parse_context_filter
+from .lazy import Lazy, lazy_type
+from .scan import ScanReport
+from .scope_context import ScopeContext
+from .scope_type import parse_scope_type
+
+VERSION = 1
+
+
+def _locate(path: str) -> Any:
+    module_name, qualname = path.split(':')
+    obj = importlib.import_module(module_name)
+    for name in qualname.split('.'):
+        obj = getattr(obj, name)
+
+    return obj
+
+
+def _path(obj: Any) -> Optional[str]:
+    module_name = getattr(obj, '__module__', None)
+    qualname = getattr(obj, '__qualname__', None)
+    if module_name is None or qualname is None or '<' in qualname:
+        return None
+    path = f'{module_name}:{qualname}'
+
+    return path if _try_locate(path) is obj else None
+
+
+def _try_locate(path: str) -> Optional[Any]:
+    try:
+        return _locate(path)
+    except (ImportError, AttributeError):
+        return None
+
+
+def _parameter(parameter_type: Any) -> Optional[Union[str, dict[str, str]]]:
+    lazy = lazy_type(parameter_type)
+    if lazy is not None:
+        path = _path(lazy)
+        return {'lazy': path} if path is not None else None
+
+    return _path(parameter_type)
+
+
+def _parameters(factory: AutoFactory) -> Optional[list]:
+    try:
+        parameters = [_parameter(parameter_type) for parameter_type in factory.parameter_types()]
+    except (TypeError, ValueError):
+        return None
+
+    return parameters if None not in parameters else None
+
+
+def _entry(composer: Composer, package: ModuleType) -> dict:
+    entry: dict[str, Any] = {
+        'id': composer.id,
+        'scope_type': composer.scope_type.name(),
+        'context_filter': {
+            element.key: sorted(element.one_of_values)
+            for element in composer.context_filter.elements
+        },
+        'dependency_type': _path(composer.dependency_type),
+        'kind': composer.kind.value,
+        'pooled': composer.pooled,
+        'pool_size': composer.pool_size,
+        'pool_reset': None,
+    }
+    if composer.pool_reset is not None:
+        entry['pool_reset'] = _path(composer.pool_reset)
+        if entry['pool_reset'] is None:
+            raise Exception(f'Composer {composer.id} cannot be exported: pool_reset is not importable')
+
+    if isinstance(composer.factory, AutoFactory):
+        if entry['dependency_type'] is None:
+            raise Exception(f'Composer {composer.id} cannot be exported: {composer.dependency_type} is not importable')
+        if composer.id == str(builtins.id(composer.dependency_type)):
+            entry['id'] = None
+        entry['parameters'] = _parameters(composer.factory)
+        return entry
+
+    entry['composer'] = _origin(composer, package)
+    if entry['composer'] is None:
+        raise Exception(f'Composer {composer.id} cannot be exported: it is not defined at module level')
+    return entry
+
+
+def _origin(composer: Composer, package: ModuleType) -> Optional[str]:
+    if composer.origin is None:
+        return None
+    if _try_locate(composer.origin) is composer:
+        return composer.origin
+
+    module_name = composer.origin.split(':')[0]
+    modules = [sys.modules.get(module_name)] + [
+        module for name, module in list(sys.modules.items())
+        if name != module_name and (name == package.__name__ or name.startswith(package.__name__ + '.'))
+    ]
+    for module in modules:
+        for name, value in list(vars(module).items() if module is not None else ()):
+            if value is composer:
+                return f'{module.__name__}:{name}'
+
+    return None
+
+
+def _package_files(package: ModuleType) -> list[Path]:
+    if not hasattr(package, '__path__'):
+        return [Path(package.__file__)]
+
+    return sorted(Path(package.__file__).parent.rglob('*.py'))
+
+
+def _module_file(path: Optional[str]) -> Optional[Path]:
+    if path is None:
+        return None
+    module = sys.modules.get(path.split(':')[0])
+    module_file = getattr(module, '__file__', None)
+
+    return Path(module_file) if module_file is not None else None
+
+
+def _fingerprint(file: Path) -> list[int]:
+    stat = file.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def write_manifest(repository: ComposerRepository, path: Union[str, Path], package: ModuleType) -> None:
+    entries = [_entry(composer, package) for composer in sorted(repository.get_composers(), key=lambda c: c.id)]
+
+    files = set(_package_files(package))
+    for entry in entries:
+        for key in ('composer', 'dependency_type', 'pool_reset'):
+            module_file = _module_file(entry.get(key))
+            if module_file is not None:
+                files.add(module_file)
+
+    Path(path).write_text(json.dumps({
+        'version': VERSION,
+        'package': package.__name__,
+        'files': {str(file): _fingerprint(file) for file in sorted(files)},
+        'composers': entries,
+    }, indent=2))
+
+
+def _read(path: Union[str, Path]) -> Optional[dict]:
+    try:
+        return json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _is_stale(manifest: dict, package: ModuleType) -> bool:
+    if manifest.get('version') != VERSION or manifest.get('package') != package.__name__:
+        return True
+
+    files = manifest['files']
+    if any(str(file) not in files for file in _package_files(package)):
+        return True
+
+    try:
+        return any(_fingerprint(Path(file)) != fingerprint for file, fingerprint in files.items())
+    except OSError:
+        return True
+
+
+def _resolve_parameter(parameter: Union[str, dict[str, str]]) -> Any:
+    if isinstance(parameter, dict):
+        return Lazy[_locate(parameter['lazy'])]
+
+    return _locate(parameter)
+
+
+def _composer(entry: dict) -> Composer:
+    if 'composer' in entry:
+        return _locate(entry['composer'])
+
+    dependency_type = _locate(entry['dependency_type'])
+    parameters = entry['parameters']
+    return Composer(
+        id=str(builtins.id(dependency_type)) if entry['id'] is None else entry['id'],
+        scope_type=parse_scope_type(entry['scope_type']),
+        context_filter=parse_context_filter(**{key: set(values) for key, values in entry['context_filter'].items()}),
+        factory=AutoFactory(
+            dependency_type,
+            [_resolve_parameter(parameter) for parameter in parameters] if parameters is not None else None
+        ),
+        dependency_type=dependency_type,
+        kind=FactoryKind(entry['kind']),
+        pooled=entry['pooled'],
+        pool_size=entry['pool_size'],
+        pool_reset=_locate(entry['pool_reset']) if entry['pool_reset'] is not None else None
+    )
+
+
+def _load(repository: ComposerRepository, manifest: dict) -> ScanReport:
+    composers = [_composer(entry) for entry in manifest['composers']]
+    repository.add_composers(composers)
+
+    templates = repository.get_templates()
+    for composer in composers:
+        if composer.supports_storing():
+            templates.get(composer.scope_type, ScopeContext.empty())
+
+    modules = {entry.get('composer') or entry['dependency_type'] for entry in manifest['composers']}
+    return ScanReport(modules=sorted({path.split(':')[0] for path in modules}), manifest=True)
+
+
+def read_manifest(repository: ComposerRepository, path: Union[str, Path], package: ModuleType) -> Optional[ScanReport]:
+    manifest = _read(path)
+    if manifest is None or _is_stale(manifest, package):
+        return None
+
+    try:
+        return _load(repository, manifest)
+    except (ImportError, AttributeError):
+        return None
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import bisect
+import threading
+from dataclasses import dataclass
+from time import monotonic
+from typing import Optional, Type, Callable
+
+from .leaks import LeakDetector
+
+
+@dataclass(frozen=True)
+class ResolveEvent:
+    dependency_type: Type
+    dependency_id: Optional[str]
+    composer_id: str
+    level: int
+    cache_hit: bool
+    duration: float
+
+
+@dataclass(frozen=True)
+class BuildEvent:
+    composer_id: str
+    duration: float
+
+
+@dataclass(frozen=True)
+class ScopeEvent:
+    scope_id: str
+    scope_type: str
+    lifetime: Optional[float] = None
+
+
+class Observer:
+    def on_resolve(self, event: ResolveEvent) -> None:
+        pass
+
+    def on_build(self, event: BuildEvent) -> None:
+        pass
+
+    def on_scope_created(self, event: ScopeEvent) -> None:
+        pass
+
+    def on_scope_cleared(self, event: ScopeEvent) -> None:
+        pass
+
+
+class Instrumentation:
+    def __init__(self, leaks: Optional[LeakDetector] = None, clock: Callable[[], float] = monotonic):
+        self.observer: Optional[Observer] = None
+        self.leaks = leaks if leaks is not None else LeakDetector(clock)
+        self.clock = clock
+
+
+BUCKETS = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0, 10.0)
+
+
+class Histogram:
+    def __init__(self, buckets: tuple[float, ...] = BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count > 0 else 0.0
+
+
+class InMemoryAggregator(Observer):
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits: dict[str, int] = {}
+        self.misses: dict[str, int] = {}
+        self.levels: dict[int, int] = {}
+        self.builds: dict[str, Histogram] = {}
+        self.lifetimes: dict[str, Histogram] = {}
+        self.live_scopes = 0
+
+    def on_resolve(self, event: ResolveEvent) -> None:
+        counters = self.hits if event.cache_hit else self.misses
+        with self._lock:
+            counters[event.composer_id] = counters.get(event.composer_id, 0) + 1
+            self.levels[event.level] = self.levels.get(event.level, 0) + 1
+
+    def on_build(self, event: BuildEvent) -> None:
+        with self._lock:
+            self.builds.setdefault(event.composer_id, Histogram()).record(event.duration)
+
+    def on_scope_created(self, event: ScopeEvent) -> None:
+        with self._lock:
+            self.live_scopes += 1
+
+    def on_scope_cleared(self, event: ScopeEvent) -> None:
+        with self._lock:
+            self.live_scopes -= 1
+            self.lifetimes.setdefault(event.scope_type, Histogram()).record(event.lifetime)
+
+    def slowest(self, n: int = 10) -> list[tuple[str, Histogram]]:
+        with self._lock:
+            builds = list(self.builds.items())
+
+        return sorted(builds, key=lambda item: item[1].mean, reverse=True)[:n]
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+EMPTY = object()
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    hits: int
+    misses: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        requests = self.hits + self.misses
+        return self.hits / requests if requests > 0 else 0.0
+
+    def __add__(self, other: PoolStats) -> PoolStats:
+        return PoolStats(hits=self.hits + other.hits, misses=self.misses + other.misses, size=self.size + other.size)
+
+
+class Pool:
+    def __init__(self, max_size: int, reset: Optional[Callable[[Any], None]]):
+        self._max_size = max_size
+        self._reset = reset
+        self._instances: deque[Any] = deque()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def acquire(self) -> Any:
+        with self._lock:
+            if len(self._instances) == 0:
+                self._misses += 1
+                return EMPTY
+            self._hits += 1
+            return self._instances.pop()
+
+    def release(self, instance: Any) -> None:
+        if self._reset is not None:
+            self._reset(instance)
+
+        with self._lock:
+            if len(self._instances) < self._max_size:
+                self._instances.append(instance)
+
+    def stats(self) -> PoolStats:
+        with self._lock:
+            return PoolStats(hits=self._hits, misses=self._misses, size=len(self._instances))
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Type, Optional, Any, TYPE_CHECKING
+
+from .composer import Composer
+from .lazy import Lazy, lazy_type
+
+if TYPE_CHECKING:
+    from .resolve_from_dependency_bag import ResolveFromDependencyBag
+    from .scope_template import ScopeTemplate
+
+
+class TemplateChain:
+    __slots__ = ('templates', '_parent', '_plans')
+
+    def __init__(self, template: ScopeTemplate, parent: Optional[TemplateChain]):
+        self.templates = (template,) if parent is None else (template,) + parent.templates
+        self._parent = parent
+        self._plans: dict[int, ResolutionPlan] = {}
+
+    def plan(self, owner: Any, parameter_types: list[Type]) -> ResolutionPlan:
+        plan = self._plans.get(id(owner))
+        if plan is None or not plan.is_current(self.templates):
+            plan = self._plans[id(owner)] = ResolutionPlan(owner, self.templates, parameter_types)
+
+        return plan
+
+
+def chain_for(template: ScopeTemplate, parent: Optional[TemplateChain]) -> TemplateChain:
+    chain = template.chains.get(id(parent))
+    if chain is None:
+        chain = template.chains.setdefault(id(parent), TemplateChain(template, parent))
+
+    return chain
+
+
+class ResolutionPlan:
+    __slots__ = ('_owner', '_generations', '_steps')
+
+    def __init__(self, owner: Any, templates: tuple[ScopeTemplate, ...], parameter_types: list[Type]):
+        self._owner = owner
+        self._generations = tuple(template.generation for template in templates)
+        self._steps: list[tuple[int, Optional[Composer], Optional[Type]]] = [
+            _step(templates, parameter_type) for parameter_type in parameter_types
+        ]
+
+    def is_current(self, templates: tuple[ScopeTemplate, ...]) -> bool:
+        for template, generation in zip(templates, self._generations):
+            if template.generation != generation:
+                return False
+
+        return True
+
+    def arguments(self, resolver: ResolveFromDependencyBag) -> list[Any]:
+        arguments = []
+        for level, composer, lazy in self._steps:
+            if composer is None:
+                arguments.append(Lazy(resolver, lazy))
+            else:
+                owner = resolver.ancestor(level)
+                arguments.append(owner.dependency_bag().get(composer, owner))
+
+        return arguments
+
+    async def aarguments(self, resolver: ResolveFromDependencyBag) -> list[Any]:
+        async def argument(level: int, composer: Optional[Composer], lazy: Optional[Type]) -> Any:
+            if composer is None:
+                return Lazy(resolver, lazy)
+            owner = resolver.ancestor(level)
+            return await owner.dependency_bag().aget(composer, owner)
+
+        return await asyncio.gather(*[argument(*step) for step in self._steps])
+
+
+def _step(templates: tuple[ScopeTemplate, ...], parameter_type: Type) -> tuple[int, Optional[Composer], Optional[Type]]:
+    lazy = lazy_type(parameter_type)
+    if lazy is not None:
+        return 0, None, lazy
+
+    for level, template in enumerate(templates):
+        composer = template.index.find(parameter_type, None)
+        if composer is not None:
+            return level, composer, None
+
+    raise Exception(f'No candidate for type {parameter_type}')
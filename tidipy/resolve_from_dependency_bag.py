@@ -1,19 +1,42 @@
 from __future__ import annotations
 
-from typing import TypeVar, Type, Optional
+import weakref
+from time import perf_counter
+from typing import TypeVar, Type, Optional, Any
 
+from tidipy.composer import Composer
 from tidipy.dependency_bag import DependencyBag
+from tidipy.eviction import Activity
+from tidipy.observer import Instrumentation, Observer, ResolveEvent
+from tidipy.resolution_plan import TemplateChain, ResolutionPlan
 from tidipy.resolver import Resolver
 
 T = TypeVar('T')
 
 
 class ResolveFromDependencyBag(Resolver):
-    def __init__(self, parent: Optional[ResolveFromDependencyBag], dependency_bag: DependencyBag):
+    __slots__ = ('_parent', '_dependency_bag', '_instrumentation', '_chain', '_scope', '__weakref__')
+    _usage: Optional[Activity] = None
+
+    def __init__(
+        self,
+        parent: Optional[ResolveFromDependencyBag],
+        dependency_bag: DependencyBag,
+        instrumentation: Instrumentation,
+        chain: TemplateChain,
+        scope: weakref.ref
+    ):
         self._parent = parent
         self._dependency_bag = dependency_bag
+        self._instrumentation = instrumentation
+        self._chain = chain
+        self._scope = scope
 
     def __call__(self, dependency_type: Type[T], id: Optional[str] = None) -> T:
+        observer = self._instrumentation.observer
+        if observer is not None:
+            return self._observed_call(observer, dependency_type, id)
+
         result = self._dependency_bag.find(dependency_type, id, self)
         if result is not None:
             return result
@@ -22,3 +45,105 @@ class ResolveFromDependencyBag(Resolver):
             raise Exception(f'No candidate for type {dependency_type}')
 
         return self._parent(dependency_type, id)
+
+    async def aresolve(self, dependency_type: Type[T], id: Optional[str] = None) -> T:
+        observer = self._instrumentation.observer
+        if observer is not None:
+            return await self._observed_aresolve(observer, dependency_type, id)
+
+        result = await self._dependency_bag.afind(dependency_type, id, self)
+        if result is not None:
+            return result
+
+        if self._parent is None:
+            raise Exception(f'No candidate for type {dependency_type}')
+
+        return await self._parent.aresolve(dependency_type, id)
+
+    def scope(self) -> Any:
+        scope = self._scope()
+        if scope is None:
+            raise Exception('Scope of resolver has been cleared')
+
+        return scope
+
+    def chain(self) -> TemplateChain:
+        return self._chain
+
+    def dependency_bag(self) -> DependencyBag:
+        return self._dependency_bag
+
+    def ancestor(self, level: int) -> ResolveFromDependencyBag:
+        resolver = self
+        for _ in range(level):
+            resolver = resolver._parent
+
+        return resolver
+
+    def plan(self, owner: Any, parameter_types: list[Type]) -> Optional[ResolutionPlan]:
+        if self._instrumentation.observer is not None:
+            return None
+
+        return self._chain.plan(owner, parameter_types)
+
+    def _locate(
+        self,
+        dependency_type: Type,
+        id: Optional[str]
+    ) -> tuple[ResolveFromDependencyBag, Composer, int]:
+        resolver = self
+        level = 0
+        while True:
+            composer = resolver._dependency_bag.lookup(dependency_type, id)
+            if composer is not None:
+                return resolver, composer, level
+            if resolver._parent is None:
+                raise Exception(f'No candidate for type {dependency_type}')
+            resolver = resolver._parent
+            level += 1
+
+    def _observed_call(self, observer: Observer, dependency_type: Type[T], id: Optional[str]) -> T:
+        start = perf_counter()
+        resolver, composer, level = self._locate(dependency_type, id)
+        cache_hit = resolver._dependency_bag.contains(composer)
+        result = resolver._dependency_bag.get(composer, resolver)
+        observer.on_resolve(
+            ResolveEvent(dependency_type, id, composer.id, level, cache_hit, perf_counter() - start)
+        )
+
+        return result
+
+    async def _observed_aresolve(self, observer: Observer, dependency_type: Type[T], id: Optional[str]) -> T:
+        start = perf_counter()
+        resolver, composer, level = self._locate(dependency_type, id)
+        cache_hit = resolver._dependency_bag.contains(composer)
+        result = await resolver._dependency_bag.aget(composer, resolver)
+        observer.on_resolve(
+            ResolveEvent(dependency_type, id, composer.id, level, cache_hit, perf_counter() - start)
+        )
+
+        return result
+
+
+class TrackedResolver(ResolveFromDependencyBag):
+    __slots__ = ('_usage',)
+
+    def __init__(
+        self,
+        parent: Optional[ResolveFromDependencyBag],
+        dependency_bag: DependencyBag,
+        instrumentation: Instrumentation,
+        chain: TemplateChain,
+        scope: weakref.ref,
+        usage: Activity
+    ):
+        super().__init__(parent, dependency_bag, instrumentation, chain, scope)
+        self._usage = usage
+
+    def __call__(self, dependency_type: Type[T], id: Optional[str] = None) -> T:
+        self._usage.touch()
+        return super().__call__(dependency_type, id)
+
+    async def aresolve(self, dependency_type: Type[T], id: Optional[str] = None) -> T:
+        self._usage.touch()
+        return await super().aresolve(dependency_type, id)
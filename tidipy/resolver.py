@@ -5,6 +5,12 @@ T = TypeVar('T')
 
 
 class Resolver:
+    __slots__ = ()
+
     @abstractmethod
     def __call__(self, dependency_type: Type[T], id: Optional[str] = None) -> T:
         ...
+
+    @abstractmethod
+    async def aresolve(self, dependency_type: Type[T], id: Optional[str] = None) -> T:
+        ...
@@ -1,26 +1,95 @@
-from typing import Optional
+import threading
+from time import monotonic
+from typing import Optional, Callable
 
 from tidipy.composer_repository import ComposerRepository
+from tidipy.eviction import Eviction, EvictionPolicy, Sweeper
+from tidipy.leaks import LeakDetector
+from tidipy.observer import Instrumentation, Observer
 from tidipy.scope import Scope
 from tidipy.scope_context import ScopeContext
-from tidipy.scope_type import RootType
+from tidipy.scope_registry import ScopeRegistry
+from tidipy.scope_type import RootType, ScopeType
 
 
 class RootScopeProvider:
-    _root_scope: Optional[Scope] = None
-
-    @classmethod
-    def get(cls) -> Scope:
-        if cls._root_scope is None:
-            RootScopeProvider._root_scope = Scope(
-                scope_id='root',
-                scope_type=RootType(),
-                composers=ComposerRepository.get_composers(),
-                context=ScopeContext.empty()
-            )
-
-        return cls._root_scope
-
-    @classmethod
-    def reset(cls) -> None:
-        cls._root_scope = None
+    def __init__(self, repository: ComposerRepository, clock: Callable[[], float] = monotonic):
+        self._repository = repository
+        self._root_scope: Optional[Scope] = None
+        self._lock = threading.Lock()
+        self._clock = clock
+        self._instrumentation = Instrumentation(LeakDetector(clock), clock)
+        self._eviction = Eviction(clock)
+        self._sweeper: Optional[Sweeper] = None
+
+    def get(self) -> Scope:
+        root_scope = self._root_scope
+        if root_scope is not None:
+            return root_scope
+
+        with self._lock:
+            if self._root_scope is None:
+                self._root_scope = Scope(
+                    scope_id='root',
+                    scope_type=RootType(),
+                    templates=self._repository.get_templates(),
+                    context=ScopeContext.empty(),
+                    registry=ScopeRegistry(),
+                    instrumentation=self._instrumentation,
+                    eviction=self._eviction
+                )
+
+            return self._root_scope
+
+    def set_observer(self, observer: Optional[Observer]) -> None:
+        self._instrumentation.observer = observer
+
+    def set_leak_threshold(self, scope_type: ScopeType, max_age: Optional[float]) -> None:
+        self._instrumentation.leaks.set_threshold(scope_type, max_age)
+
+    def leak_detector(self) -> LeakDetector:
+        return self._instrumentation.leaks
+
+    def reset_leak_detection(self) -> None:
+        self._instrumentation.leaks = LeakDetector(self._clock)
+
+    def set_eviction_policy(self, scope_type: ScopeType, policy: Optional[EvictionPolicy]) -> None:
+        self._eviction.set_policy(scope_type, policy)
+
+    def evict(self, scope_type: Optional[ScopeType] = None) -> int:
+        return self._eviction.evict(scope_type)
+
+    def sweep(self, interval: float) -> Sweeper:
+        with self._lock:
+            if self._sweeper is not None:
+                self._sweeper.stop()
+            self._sweeper = Sweeper(self.evict, interval)
+            return self._sweeper
+
+    def reset_eviction(self) -> None:
+        with self._lock:
+            if self._sweeper is not None:
+                self._sweeper.stop()
+                self._sweeper = None
+        self._eviction = Eviction(self._clock)
+
+    def reset(self) -> None:
+        self._root_scope = None
+
+    def clear(self, concurrent: bool = False) -> None:
+        root_scope = self._root_scope
+        if root_scope is None:
+            return
+        if root_scope.has_async_teardowns():
+            raise Exception('Scope has async teardowns and can only be cleared with aclear_scope')
+
+        self.reset()
+        root_scope.clear(concurrent)
+
+    async def aclear(self, concurrent: bool = False) -> None:
+        root_scope = self._root_scope
+        if root_scope is None:
+            return
+
+        self.reset()
+        await root_scope.aclear(concurrent)
@@ -1,33 +1,81 @@
+from __future__ import annotations
+
 import importlib
 import inspect
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import dataclass, field
 from pathlib import Path
+from types import ModuleType
+from typing import Optional, Union
 
 from .composer import Composer
 from .composer_repository import ComposerRepository
+from .discovery import walk_paths, discover
+
+CACHE_FILE = 'tidipy-scan.json'
+
 
+@dataclass
+class ScanReport:
+    modules: list[str] = field(default_factory=list)
+    failed: dict[str, Exception] = field(default_factory=dict)
+    manifest: bool = False
 
-def walk_modules(path, prefix):
-    for item in path.iterdir():
-        if item.is_dir():
-            yield from walk_modules(item, f"{prefix}.{item.name}")
-        elif item.suffix == '.py' and item.name != '__init__.py':
-            modname = f"{prefix}.{item.stem}"
-            try:
-                mod = importlib.import_module(modname)
-                yield mod
-            except Exception:
-                continue
 
+def _import(module_name: str) -> Union[ModuleType, Exception]:
+    try:
+        return importlib.import_module(module_name)
+    except Exception as e:
+        return e
+
+
+def _module_names(package: ModuleType, static: bool, cache: Union[bool, str, Path]) -> list[str]:
+    if not hasattr(package, '__path__'):
+        return []
 
-def scan(package):
     package_path = Path(package.__file__).parent
-    package_name = package.__name__
+    if not static:
+        return [module_name for module_name, _ in walk_paths(package_path, package.__name__)]
+
+    if cache is True:
+        cache_path = package_path / '__pycache__' / CACHE_FILE
+    elif cache is False:
+        cache_path = None
+    else:
+        cache_path = Path(cache)
 
-    module = importlib.import_module(package_name)
-    modules = [module]
-    modules += list(walk_modules(package_path, package_name))
+    return discover(package_path, package.__name__, cache_path)
 
+
+def scan_package(
+    repository: ComposerRepository,
+    package: ModuleType,
+    static: bool = False,
+    cache: Union[bool, str, Path] = True,
+    max_workers: Optional[int] = None
+) -> ScanReport:
+    module_names = _module_names(package, static, cache)
+
+    if max_workers is None:
+        imported = [_import(module_name) for module_name in module_names]
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(copy_context().run, _import, module_name) for module_name in module_names]
+        imported = [future.result() for future in futures]
+
+    report = ScanReport()
+    modules = [importlib.import_module(package.__name__)]
+    for module_name, module in zip(module_names, imported):
+        if isinstance(module, Exception):
+            report.failed[module_name] = module
+        else:
+            modules.append(module)
+
+    composers = []
     for module in modules:
-        for name, obj in inspect.getmembers(module):
-            if isinstance(obj, Composer):
-                ComposerRepository.add_composer(obj)
+        report.modules.append(module.__name__)
+        composers += [obj for name, obj in inspect.getmembers(module) if isinstance(obj, Composer)]
+    repository.add_composers(composers)
+
+    return report
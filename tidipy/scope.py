@@ -1,96 +1,310 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from .children import Children
 from .composer import Composer
 from .dependency_bag import DependencyBag
-from .resolve_from_dependency_bag import ResolveFromDependencyBag
-from .resolver import Resolver
+from .eviction import Eviction, Activity
+from .inventory import ScopeInfo, retained_size
+from .observer import Instrumentation, ScopeEvent
+from .resolve_from_dependency_bag import ResolveFromDependencyBag, TrackedResolver
+from .resolution_plan import chain_for
 from .scope_context import ScopeContext
-from .scope_type import ScopeType, Transient
+from .scope_registry import ScopeRegistry
+from .scope_template import ScopeTemplates, ScopeTemplate
+from .scope_type import ScopeType
 
 
 class Scope:
+    __slots__ = (
+        '_scope_id', '_parent', '_registry', '_children', '_lock', '_cleared', '_scope_type', '_templates',
+        '_context', '_instrumentation', '_eviction', '_usage', '_watch', '_resolver', '_template',
+        '_dependency_bag', '_created_at', '_registered', '__weakref__'
+    )
+
     def __init__(
         self,
         scope_id: str,
         scope_type: ScopeType,
-        composers: set[Composer],
+        templates: ScopeTemplates,
         context: ScopeContext,
+        registry: ScopeRegistry[Scope],
+        instrumentation: Instrumentation,
+        eviction: Eviction,
         parent: Optional[Scope] = None
     ):
         self._scope_id = scope_id
-        self._parent = parent
-        self._children: Children[Scope] = Children(self, {})
+        self._parent = weakref.ref(parent) if parent is not None else None
+        self._registry = registry
+        self._children: Children[Scope] = Children()
+        self._lock = threading.Lock()
+        self._cleared = False
+        self._registered = False
         self._scope_type = scope_type
-        self._composers = composers
+        self._templates = templates
         self._context = context
+        self._instrumentation = instrumentation
+        self._eviction = eviction
+        self._usage = eviction.track(scope_type, self)
+        self._watch = instrumentation.leaks.track(scope_type, scope_id, self)
         self._resolver = self._create_resolver()
         self._validate()
+        self._created_at = instrumentation.clock()
+
+        observer = instrumentation.observer
+        if observer is not None:
+            observer.on_scope_created(ScopeEvent(scope_id, scope_type.name()))
 
     def _create_resolver(self) -> ResolveFromDependencyBag:
+        self._template = self._templates.get(self._scope_type, self._context)
+        self._dependency_bag = DependencyBag(self._template, self._instrumentation, self._usage)
+        parent = self._parent().resolver() if self._parent is not None else None
+        chain = chain_for(self._template, parent.chain() if parent is not None else None)
+        usages = (self._usage,) if self._usage is not None else ()
+        if parent is not None and parent._usage is not None:
+            usages += parent._usage.usages
+        if len(usages) > 0:
+            return TrackedResolver(
+                parent, self._dependency_bag, self._instrumentation, chain, weakref.ref(self), Activity(usages)
+            )
+
         return ResolveFromDependencyBag(
-            parent=self._parent.resolver() if self._parent is not None else None,
-            dependency_bag=DependencyBag([
-                composer
-                for composer in self._composers
-                if not composer.scope_type.supports_storing() or composer.scope_type == self._scope_type
-                and composer.context_filter.is_fulfilled_by(self._context)
-            ])
+            parent=parent,
+            dependency_bag=self._dependency_bag,
+            instrumentation=self._instrumentation,
+            chain=chain,
+            scope=weakref.ref(self)
         )
 
-    def _ancestor_has_type(self, scope_type: ScopeType) -> bool:
-        if self._parent is None:
-            return False
+    def parent(self) -> Optional[Scope]:
+        return self._parent() if self._parent is not None else None
 
-        if self._parent._scope_type == scope_type:
-            return True
+    def _ancestor_has_type(self, scope_type: ScopeType) -> bool:
+        parent = self.parent()
+        while parent is not None:
+            if parent._scope_type == scope_type:
+                return True
+            parent = parent.parent()
 
-        return self._parent._ancestor_has_type(scope_type)
+        return False
 
     def _validate(self):
+        if not self._scope_type.supports_storing():
+            raise Exception('Scopes can not have type transient')
         if self._ancestor_has_type(self._scope_type):
             raise Exception('Ancestor already has a scope of this type')
-        if self._scope_type == Transient():
-            raise Exception('Scopes can not have type transient')
 
     def get_id(self) -> str:
         return self._scope_id
 
+    def template(self) -> ScopeTemplate:
+        return self._template
+
+    def stored_composers(self) -> list[Composer]:
+        return [composer for composer in self._template.composers if composer.scope_type == self._scope_type]
+
+    def lock(self, scope_id: str) -> threading.Lock:
+        return self._registry.lock(scope_id)
+
     def add_scope(
         self,
         scope_id: str,
         scope_type: ScopeType,
-        context: ScopeContext
-    ):
-        self._children.add_child(
-            Scope(
-                scope_id=scope_id,
-                parent=self,
-                scope_type=scope_type,
-                composers=self._composers,
-                context= context.add(self._context)
-            )
+        context: ScopeContext,
+        register: bool = True
+    ) -> Scope:
+        child = Scope(
+            scope_id=scope_id,
+            parent=self,
+            scope_type=scope_type,
+            templates=self._templates,
+            context=context.add(self._context),
+            registry=self._registry,
+            instrumentation=self._instrumentation,
+            eviction=self._eviction
         )
+        self.touch()
+        with self._lock:
+            if self._cleared:
+                raise Exception(f'Scope {self._scope_id} has been cleared')
+            self._children.add_child(child)
+            if register:
+                self._registry.add(child)
+                child._registered = True
+
+        return child
+
+    def touch(self) -> None:
+        activity = self._resolver._usage
+        if activity is not None:
+            activity.touch()
+
+    def evict(self) -> None:
+        with self.lock(self._scope_id):
+            subtrees = self.release()
+
+        if subtrees is not None:
+            self.close(subtrees, False)
+
+    def shares_tree(self, other: Scope) -> bool:
+        return self._registry is other._registry
 
     def find_scope(self, scope_id: str) -> Optional[Scope]:
-        return self._children.find_descendant(scope_id)
+        if scope_id == self._scope_id:
+            return self
+
+        return self._registry.find(scope_id)
+
+    async def aremove_scope(self, scope_id: str, concurrent: bool = False) -> None:
+        scope = self._registry.find(scope_id)
+        if scope is not None:
+            await scope.aclear(concurrent)
+
+    def info(self, now: float) -> ScopeInfo:
+        parent = self.parent()
+        stored = self._dependency_bag.stored()
+        return ScopeInfo(
+            scope_id=self._scope_id,
+            scope_type=self._scope_type.name(),
+            parent_id=parent.get_id() if parent is not None else None,
+            age=now - self._created_at,
+            instances=len(stored),
+            retained_size=retained_size(stored)
+        )
+
+    def children(self) -> list[Scope]:
+        if self._children.is_empty():
+            return []
+        with self._lock:
+            return list(self._children.values())
+
+    def has_async_teardowns(self) -> bool:
+        if self._dependency_bag.has_async_teardowns():
+            return True
+        if self._children.is_empty():
+            return False
+
+        return any(child.has_async_teardowns() for child in self.children())
+
+    def _detach(self) -> None:
+        parent = self.parent()
+        if parent is None:
+            return
+
+        with parent._lock:
+            parent._children.remove_child(self._scope_id)
+        parent.touch()
+
+    def _claim(self) -> Optional[list[tuple[Scope, list]]]:
+        with self._lock:
+            if self._cleared:
+                return None
+            self._cleared = True
+            children = list(self._children.values())
+
+        if self._registered:
+            self._registry.remove(self)
+        if self._usage is not None:
+            self._usage.forget()
+        if self._watch is not None:
+            self._watch.forget()
+
+        observer = self._instrumentation.observer
+        if observer is not None:
+            observer.on_scope_cleared(
+                ScopeEvent(self._scope_id, self._scope_type.name(), self._instrumentation.clock() - self._created_at)
+            )
+
+        subtrees = []
+        for child in children:
+            grandchildren = child._claim()
+            if grandchildren is not None:
+                subtrees.append((child, grandchildren))
+
+        return subtrees
+
+    def release(self) -> Optional[list[tuple[Scope, list]]]:
+        if self.has_async_teardowns():
+            raise Exception('Scope has async teardowns and can only be cleared with aclear_scope')
+
+        subtrees = self._claim()
+        if subtrees is not None:
+            self._detach()
+
+        return subtrees
+
+    def clear(self, concurrent: bool = False) -> None:
+        subtrees = self.release()
+        if subtrees is not None:
+            self.close(subtrees, concurrent)
+
+    def close(self, subtrees: list[tuple[Scope, list]], concurrent: bool) -> None:
+        errors = []
+        if concurrent and len(subtrees) > 1:
+            with ThreadPoolExecutor() as executor:
+                futures = [executor.submit(child.close, grandchildren, False) for child, grandchildren in subtrees]
+            errors += [future.exception() for future in futures if future.exception() is not None]
+        else:
+            for child, grandchildren in subtrees:
+                try:
+                    child.close(grandchildren, False)
+                except Exception as e:
+                    errors.append(e)
+
+        try:
+            self._dependency_bag.close()
+        except Exception as e:
+            errors.append(e)
+
+        if len(errors) > 0:
+            raise errors[0]
+
+    async def aclear(self, concurrent: bool = False) -> None:
+        subtrees = self._claim()
+        if subtrees is not None:
+            self._detach()
+            await self._aclose(subtrees, concurrent)
+
+    async def _aclose(self, subtrees: list[tuple[Scope, list]], concurrent: bool) -> None:
+        if concurrent:
+            results = await asyncio.gather(
+                *[child._aclose(grandchildren, True) for child, grandchildren in subtrees],
+                return_exceptions=True
+            )
+        else:
+            results = []
+            for child, grandchildren in subtrees:
+                try:
+                    await child._aclose(grandchildren, False)
+                except Exception as e:
+                    results.append(e)
+
+        try:
+            await self._dependency_bag.aclose(offload=concurrent)
+        except Exception as e:
+            results.append(e)
 
-    def remove_scope(self, scope_id: str) -> None:
-        self._children.remove_descendant(scope_id)
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if len(errors) > 0:
+            raise errors[0]
 
     def matches(self, scope_type: ScopeType, parent_id: Optional[str], context: Optional[ScopeContext]) -> bool:
         if self._scope_type != scope_type:
             return False
-        if self._parent is None and parent_id is not None:
+        parent = self.parent()
+        if parent is None and parent_id is not None:
             return False
-        if self._parent is not None and self._parent.get_id() != parent_id:
+        if parent is not None and parent.get_id() != parent_id:
             return False
         if context is not None and not context.part_of(self._context):
             return False
 
         return True
 
-    def resolver(self) -> Resolver:
+    def resolver(self) -> ResolveFromDependencyBag:
         return self._resolver
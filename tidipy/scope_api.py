@@ -1,48 +1,145 @@
-from typing import Optional
+from concurrent.futures import Future
+from pathlib import Path
+from types import ModuleType
+from typing import Optional, Type, Callable, Any, Union
 
+from .container import default_container, registering_container
+from .eviction import Sweeper
+from .inventory import Inventory
+from .leaks import Leak
+from .observer import Observer
+from .pool import PoolStats
 from .resolver import Resolver
-from .root_scope_provider import RootScopeProvider
-from .scope_context import ScopeContext
-from .composer_repository import ComposerRepository
-from .scope_type import parse_scope_type
+from .scan import ScanReport
+from .scope_block import ScopeBlock
 
 
 def ensure_scope(
     scope_id: str,
     scope_type: str,
     parent_id: str = 'root',
+    context: Optional[dict[str, str]] = None,
+    warmup: bool = False
+) -> Optional[Future]:
+    return default_container().ensure_scope(scope_id, scope_type, parent_id, context, warmup)
+
+
+def get_resolver(scope_id: str = 'root') -> Resolver:
+    return default_container().get_resolver(scope_id)
+
+
+def clear_scope(scope_id: str, concurrent: bool = False) -> None:
+    default_container().clear_scope(scope_id, concurrent)
+
+
+async def aclear_scope(scope_id: str, concurrent: bool = False) -> None:
+    await default_container().aclear_scope(scope_id, concurrent)
+
+
+def scope(
+    scope_type: str,
+    parent: Union[str, Resolver, None] = None,
+    *,
+    scope_id: Optional[str] = None,
     context: Optional[dict[str, str]] = None
-) -> None:
-    parsed_scope_type=parse_scope_type(scope_type)
-    parsed_context=ScopeContext(context) if context is not None else ScopeContext.empty()
-    root_scope = RootScopeProvider.get()
+) -> ScopeBlock:
+    return default_container().scope(scope_type, parent, scope_id=scope_id, context=context)
 
-    existing_scope = root_scope.find_scope(scope_id)
 
-    if existing_scope is None:
-        parent_scope = root_scope.find_scope(parent_id)
-        parent_scope.add_scope(
-            scope_id=scope_id,
-            scope_type=parsed_scope_type,
-            context=parsed_context
-        )
-        return
+def current_resolver() -> Resolver:
+    return default_container().current_resolver()
 
-    if not existing_scope.matches(parsed_scope_type, parent_id, parsed_context):
-        raise Exception
 
+def auto_compose(
+    dependency_type: Type,
+    *,
+    id: Optional[str] = None,
+    scope_type: str = 'root',
+    pooled: bool = False,
+    pool_size: int = 16,
+    pool_reset: Optional[Callable[[Any], None]] = None,
+    **kwargs
+) -> None:
+    registering_container().auto_compose(
+        dependency_type,
+        id=id,
+        scope_type=scope_type,
+        pooled=pooled,
+        pool_size=pool_size,
+        pool_reset=pool_reset,
+        **kwargs
+    )
 
-def get_resolver(scope_id: str = 'root') -> Resolver:
-    return RootScopeProvider.get().find_scope(scope_id).resolver()
+
+def scan(
+    package: ModuleType,
+    static: bool = False,
+    cache: Union[bool, str, Path] = True,
+    max_workers: Optional[int] = None
+) -> ScanReport:
+    return default_container().scan(package, static, cache, max_workers)
+
+
+def export_manifest(path: Union[str, Path], package: ModuleType) -> None:
+    default_container().export_manifest(path, package)
 
 
-def clear_scope(scope_id: str) -> None:
-    if scope_id == 'root':
-        RootScopeProvider.reset()
-        return
-    return RootScopeProvider.get().remove_scope(scope_id)
+def load_manifest(path: Union[str, Path], package: ModuleType, rebuild: bool = True, **scan_options) -> ScanReport:
+    return default_container().load_manifest(path, package, rebuild, **scan_options)
 
 
 def reset() -> None:
-    RootScopeProvider.reset()
-    ComposerRepository.reset()
+    default_container().reset()
+
+
+def set_observer(observer: Optional[Observer]) -> None:
+    default_container().set_observer(observer)
+
+
+def set_eviction_policy(
+    scope_type: str,
+    ttl: Optional[float] = None,
+    max_scopes: Optional[int] = None,
+    max_instances: Optional[int] = None
+) -> None:
+    default_container().set_eviction_policy(scope_type, ttl, max_scopes, max_instances)
+
+
+def evict_idle() -> int:
+    return default_container().evict_idle()
+
+
+def evict_idle_every(interval: float) -> Sweeper:
+    return default_container().evict_idle_every(interval)
+
+
+def inventory() -> Inventory:
+    return default_container().inventory()
+
+
+def detect_leaks(scope_type: str, max_age: Optional[float]) -> None:
+    default_container().detect_leaks(scope_type, max_age)
+
+
+def check_leaks() -> list[Leak]:
+    return default_container().check_leaks()
+
+
+def freeze() -> None:
+    default_container().freeze()
+
+
+def freeze_root() -> None:
+    default_container().freeze_root()
+
+
+def pool_stats() -> dict[str, PoolStats]:
+    return default_container().pool_stats()
+
+
+def warmup(scope_id: str = 'root', max_workers: Optional[int] = None) -> dict[str, float]:
+    return default_container().warmup(scope_id, max_workers)
+
+
+async def awarmup(scope_id: str = 'root') -> dict[str, float]:
+    return await default_container().awarmup(scope_id)
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import itertools
+from contextvars import ContextVar
+from typing import Optional, Union
+
+from .resolve_from_dependency_bag import ResolveFromDependencyBag
+from .resolver import Resolver
+from .root_scope_provider import RootScopeProvider
+from .scope import Scope
+from .scope_context import ScopeContext
+from .scope_type import parse_scope_type
+
+_current_scope: ContextVar[Optional[Scope]] = ContextVar('current_scope', default=None)
+_anonymous_ids = itertools.count()
+
+
+def current_scope() -> Optional[Scope]:
+    return _current_scope.get()
+
+
+class ScopeBlock:
+    def __init__(
+        self,
+        root: RootScopeProvider,
+        scope_type: str,
+        parent: Union[str, Resolver, None],
+        scope_id: Optional[str],
+        context: Optional[dict[str, str]]
+    ):
+        self._root = root
+        self._scope_type = parse_scope_type(scope_type)
+        self._parent = parent
+        self._scope_id = scope_id
+        self._context = ScopeContext(context) if context is not None else ScopeContext.empty()
+        self._entries: ContextVar[tuple] = ContextVar('scope_block_entries', default=())
+
+    def _parent_scope(self) -> Scope:
+        parent = self._parent
+        root_scope = self._root.get()
+        if isinstance(parent, ResolveFromDependencyBag):
+            scope = parent.scope()
+            if not scope.shares_tree(root_scope):
+                raise Exception('Parent resolver belongs to another container')
+            return scope
+
+        if parent is not None:
+            scope = root_scope.find_scope(parent)
+            if scope is None:
+                raise Exception(f'Parent scope {parent} does not exist')
+            return scope
+
+        current = _current_scope.get()
+        return current if current is not None and current.shares_tree(root_scope) else root_scope
+
+    def _create(self, parent: Scope) -> Scope:
+        if self._scope_id is None:
+            return parent.add_scope(f'#{next(_anonymous_ids)}', self._scope_type, self._context, register=False)
+
+        with parent.lock(self._scope_id):
+            if parent.find_scope(self._scope_id) is not None:
+                raise Exception(f'Scope {self._scope_id} already exists')
+            return parent.add_scope(self._scope_id, self._scope_type, self._context)
+
+    def __enter__(self) -> Resolver:
+        scope = self._create(self._parent_scope())
+        self._entries.set((scope, _current_scope.set(scope), self._entries.get()))
+        return scope.resolver()
+
+    def _pop(self) -> Scope:
+        scope, token, previous = self._entries.get()
+        self._entries.set(previous)
+        _current_scope.reset(token)
+        return scope
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._pop().clear()
+
+    async def __aenter__(self) -> Resolver:
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self._pop().aclear()
@@ -1,27 +1,70 @@
 from __future__ import annotations
 
+import threading
+import weakref
+from types import MappingProxyType
+from typing import Mapping
+
+_interned: weakref.WeakValueDictionary[frozenset[tuple[str, str]], ScopeContext] = weakref.WeakValueDictionary()
+_lock = threading.Lock()
+
 
 class ScopeContext:
-    def __init__(self, values: dict[str, str]):
-        self._values = values
+    __slots__ = ('_values', '_items', '_hash', '__weakref__')
+
+    def __new__(cls, values: Mapping[str, str]) -> ScopeContext:
+        items = frozenset(values.items())
+        context = _interned.get(items)
+        if context is not None:
+            return context
+
+        with _lock:
+            context = _interned.get(items)
+            if context is None:
+                context = super().__new__(cls)
+                context._values = MappingProxyType(dict(values))
+                context._items = items
+                context._hash = hash(items)
+                _interned[items] = context
+
+        return context
 
     @staticmethod
     def empty() -> ScopeContext:
-        return ScopeContext({})
+        return _EMPTY
 
     def add(self, context: ScopeContext) -> ScopeContext:
-        common_keys = set(context.values().keys()).intersection(set(self._values.keys()))
+        if context is self or len(context._values) == 0:
+            return self
+        if len(self._values) == 0:
+            return context
 
-        if any(self._values[key] != context.values()[key] for key in common_keys):
-            raise Exception('Can only add values to scope context, not override values')
+        values = self._values
+        for key, value in context._values.items():
+            if values.get(key, value) != value:
+                raise Exception('Can only add values to scope context, not override values')
 
-        return ScopeContext({**self._values, **context.values()})
+        return ScopeContext({**values, **context._values})
 
     def part_of(self, context: ScopeContext) -> bool:
-        return context.add(self) == context
+        return self._items <= context._items
 
     def __eq__(self, other) -> bool:
-        return self._values == other.values()
+        if self is other:
+            return True
+        if not isinstance(other, ScopeContext):
+            return NotImplemented
 
-    def values(self) -> dict[str, str]:
+        return self._items == other._items
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self):
+        return ScopeContext, (dict(self._values),)
+
+    def values(self) -> Mapping[str, str]:
         return self._values
+
+
+_EMPTY = ScopeContext({})
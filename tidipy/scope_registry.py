@@ -0,0 +1,33 @@
+import threading
+from typing import Optional, TypeVar, Generic
+
+from .children import HasId
+
+T = TypeVar('T', bound=HasId)
+
+STRIPES = 64
+
+
+class ScopeRegistry(Generic[T]):
+    def __init__(self):
+        self._scopes: dict[str, T] = {}
+        self._lock = threading.Lock()
+        self._stripes = [threading.Lock() for _ in range(STRIPES)]
+
+    def lock(self, scope_id: str) -> threading.Lock:
+        return self._stripes[hash(scope_id) % STRIPES]
+
+    def add(self, scope: T) -> None:
+        with self._lock:
+            self._scopes[scope.get_id()] = scope
+
+    def find(self, scope_id: str) -> Optional[T]:
+        return self._scopes.get(scope_id)
+
+    def remove(self, scope: T) -> None:
+        with self._lock:
+            if self._scopes.get(scope.get_id()) is scope:
+                del self._scopes[scope.get_id()]
+
+    def __len__(self) -> int:
+        return len(self._scopes)
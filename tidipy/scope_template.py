@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from .candidate_index import CandidateIndex
+from .composer import Composer
+from .pool import Pool, PoolStats
+from .scope_context import ScopeContext
+from .scope_type import ScopeType
+
+MAX_RECENT_TEMPLATES = 256
+
+
+def _belongs_to(composer: Composer, scope_type: ScopeType, context: ScopeContext) -> bool:
+    return not composer.scope_type.supports_storing() or composer.scope_type == scope_type \
+        and composer.context_filter.is_fulfilled_by(context)
+
+
+def _pool(composer: Composer) -> Pool:
+    return Pool(max_size=composer.pool_size, reset=composer.pool_reset)
+
+
+@dataclass
+class ScopeTemplate:
+    scope_type: ScopeType
+    context: ScopeContext
+    composers: tuple[Composer, ...]
+    index: CandidateIndex
+    pools: dict[str, Pool]
+    generation: int
+    chains: dict = field(default_factory=dict, compare=False, repr=False)
+
+    def add(self, composers: list[Composer], generation: int) -> None:
+        added = tuple(composer for composer in composers if _belongs_to(composer, self.scope_type, self.context))
+        if len(added) == 0:
+            return
+
+        pooled = {composer.id: _pool(composer) for composer in added if composer.pooled}
+        if len(pooled) > 0:
+            self.pools = {**self.pools, **pooled}
+        self.composers = self.composers + added
+        self.index = self.index.with_composers(added)
+        self.generation = generation
+
+
+class ScopeTemplates:
+    def __init__(self):
+        self._unscoped: list[Composer] = []
+        self._by_scope_type: dict[ScopeType, list[Composer]] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._templates: weakref.WeakValueDictionary[tuple[ScopeType, ScopeContext], ScopeTemplate] = \
+            weakref.WeakValueDictionary()
+        self._recent: OrderedDict[tuple[ScopeType, ScopeContext], ScopeTemplate] = OrderedDict()
+
+    def get(self, scope_type: ScopeType, context: ScopeContext) -> ScopeTemplate:
+        key = (scope_type, context)
+        template = self._templates.get(key)
+        if template is not None:
+            try:
+                self._recent.move_to_end(key)
+                return template
+            except KeyError:
+                pass
+
+        with self._lock:
+            template = self._templates.get(key)
+            if template is None:
+                template = self._compile(scope_type, context)
+                self._templates[key] = template
+            self._recent[key] = template
+            self._recent.move_to_end(key)
+            if len(self._recent) > MAX_RECENT_TEMPLATES:
+                self._recent.popitem(last=False)
+
+        return template
+
+    def _compile(self, scope_type: ScopeType, context: ScopeContext) -> ScopeTemplate:
+        composers = tuple(
+            composer
+            for composer in self._by_scope_type.get(scope_type, self._unscoped)
+            if _belongs_to(composer, scope_type, context)
+        )
+        return ScopeTemplate(
+            scope_type=scope_type,
+            context=context,
+            composers=composers,
+            index=CandidateIndex(composers),
+            pools={composer.id: _pool(composer) for composer in composers if composer.pooled},
+            generation=self._generation
+        )
+
+    def add(self, composers: list[Composer], generation: int) -> None:
+        with self._lock:
+            for composer in composers:
+                if composer.supports_storing():
+                    bucket = self._by_scope_type.get(composer.scope_type)
+                    if bucket is None:
+                        bucket = self._by_scope_type[composer.scope_type] = list(self._unscoped)
+                    bucket.append(composer)
+                else:
+                    self._unscoped.append(composer)
+                    for bucket in self._by_scope_type.values():
+                        bucket.append(composer)
+            self._generation = generation
+            for template in list(self._templates.values()):
+                template.add(composers, generation)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._templates = weakref.WeakValueDictionary()
+            self._recent.clear()
+
+    def pool_stats(self) -> dict[str, PoolStats]:
+        stats: dict[str, PoolStats] = {}
+        for template in list(self._templates.values()):
+            for composer_id, pool in template.pools.items():
+                stats[composer_id] = stats[composer_id] + pool.stats() if composer_id in stats else pool.stats()
+
+        return stats
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import lru_cache
 
 
 class ScopeType(ABC):
@@ -7,18 +8,28 @@ class ScopeType(ABC):
     def supports_storing(self) -> bool:
         """Indicates whether scope type supports storing"""
 
+    @abstractmethod
+    def name(self) -> str:
+        """Name the scope type is declared with"""
+
 
 @dataclass(frozen=True)
 class RootType(ScopeType):
     def supports_storing(self) -> bool:
         return True
 
+    def name(self) -> str:
+        return 'root'
+
 
 @dataclass(frozen=True)
 class Transient(ScopeType):
     def supports_storing(self) -> bool:
         return False
 
+    def name(self) -> str:
+        return 'transient'
+
 
 @dataclass(frozen=True)
 class CustomScope(ScopeType):
@@ -27,7 +38,11 @@ class CustomScope(ScopeType):
     def supports_storing(self) -> bool:
         return True
 
+    def name(self) -> str:
+        return self.scope_type
+
 
+@lru_cache(maxsize=1024)
 def parse_scope_type(value: str) -> ScopeType:
     if value == 'root':
         return RootType()
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+from contextlib import AbstractContextManager, AbstractAsyncContextManager
+from typing import Union, Generator, AsyncGenerator, Any, Optional
+
+Teardown = Union[Generator[Any, None, None], AsyncGenerator[Any, None]]
+
+
+def _finish(generator: Generator) -> None:
+    try:
+        next(generator)
+    except StopIteration:
+        return
+
+    raise Exception('Generator composers must yield exactly once')
+
+
+async def _afinish(generator: AsyncGenerator) -> None:
+    try:
+        await generator.__anext__()
+    except StopAsyncIteration:
+        return
+
+    raise Exception('Generator composers must yield exactly once')
+
+
+def exiting(manager: AbstractContextManager) -> Generator[None, None, None]:
+    def teardown() -> Generator[None, None, None]:
+        yield
+        manager.__exit__(None, None, None)
+
+    generator = teardown()
+    next(generator)
+    return generator
+
+
+async def aexiting(manager: AbstractAsyncContextManager) -> AsyncGenerator[None, None]:
+    async def teardown() -> AsyncGenerator[None, None]:
+        yield
+        await manager.__aexit__(None, None, None)
+
+    generator = teardown()
+    await generator.__anext__()
+    return generator
+
+
+class Teardowns:
+    __slots__ = ('_generators',)
+
+    def __init__(self):
+        self._generators: Optional[list[Teardown]] = None
+
+    def push(self, generator: Teardown) -> None:
+        if self._generators is None:
+            self._generators = []
+        self._generators.append(generator)
+
+    def has_async(self) -> bool:
+        return self._generators is not None and any(inspect.isasyncgen(generator) for generator in self._generators)
+
+    def close(self) -> None:
+        if self._generators is None:
+            return
+        if self.has_async():
+            raise Exception('Scope has async teardowns and can only be cleared with aclear_scope')
+
+        generators, self._generators = self._generators or [], None
+        errors = []
+        for generator in reversed(generators):
+            try:
+                _finish(generator)
+            except Exception as e:
+                errors.append(e)
+
+        if len(errors) > 0:
+            raise errors[0]
+
+    async def aclose(self, offload: bool = False) -> None:
+        generators, self._generators = self._generators or [], None
+        errors = []
+        for generator in reversed(generators):
+            try:
+                if inspect.isasyncgen(generator):
+                    await _afinish(generator)
+                elif offload:
+                    await asyncio.get_running_loop().run_in_executor(None, _finish, generator)
+                else:
+                    _finish(generator)
+            except Exception as e:
+                errors.append(e)
+
+        if len(errors) > 0:
+            raise errors[0]
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import itertools
+from typing import Type
+
+from .auto_factory import AutoFactory
+from .composer import Composer
+from .lazy import lazy_type
+from .scope_context import ScopeContext
+from .scope_template import ScopeTemplates, ScopeTemplate
+from .scope_type import ScopeType, RootType, Transient
+
+
+def _declared_scope_types(composers: set[Composer]) -> list[ScopeType]:
+    scope_types: list[ScopeType] = [RootType()]
+    for composer in composers:
+        if composer.supports_storing() and composer.scope_type not in scope_types:
+            scope_types.append(composer.scope_type)
+
+    return scope_types
+
+
+def _separating_contexts(
+    composer: Composer,
+    parameter_type: Type,
+    composers: set[Composer],
+    scope_type: ScopeType
+) -> list[ScopeContext]:
+    values: dict[str, set[str]] = {}
+    for candidate in composers:
+        if candidate.scope_type != scope_type:
+            continue
+        try:
+            if not issubclass(candidate.dependency_type, parameter_type):
+                continue
+        except TypeError:
+            continue
+        for element in candidate.context_filter.elements:
+            values.setdefault(element.key, set()).update(element.one_of_values)
+
+    for element in composer.context_filter.elements:
+        if element.key in values:
+            values[element.key].update(element.one_of_values)
+
+    keys = sorted(values)
+    contexts = (
+        ScopeContext({key: value for key, value in zip(keys, combination) if value is not None})
+        for combination in itertools.product(*([None] + sorted(values[key]) for key in keys))
+    )
+    return [context for context in contexts if composer.context_filter.is_fulfilled_by(context)]
+
+
+def _reachable(composer: Composer, scope_type: ScopeType) -> bool:
+    if scope_type == Transient():
+        return True
+
+    return composer.supports_storing() and composer.scope_type not in (scope_type, RootType())
+
+
+def _check_parameter(
+    parameter_type: Type,
+    templates: list[ScopeTemplate],
+    composers: set[Composer],
+    scope_type: ScopeType
+) -> str | None:
+    for template in templates:
+        try:
+            if template.index.find(parameter_type, None) is not None:
+                return None
+        except Exception as e:
+            return str(e)
+
+    if scope_type != RootType() and any(
+        issubclass(composer.dependency_type, parameter_type) and _reachable(composer, scope_type)
+        for composer in composers
+    ):
+        return None
+
+    return f'No candidate for type {parameter_type}'
+
+
+def validate(composers: set[Composer], templates: ScopeTemplates) -> tuple[list[str], list[ScopeTemplate]]:
+    errors: dict[str, None] = {}
+    validated: dict[tuple[ScopeType, ScopeContext], ScopeTemplate] = {}
+    root_template = templates.get(RootType(), ScopeContext.empty())
+
+    for scope_type in _declared_scope_types(composers):
+        for composer in sorted(composers, key=lambda composer: composer.id):
+            if not isinstance(composer.factory, AutoFactory) or \
+                    composer.supports_storing() and composer.scope_type != scope_type:
+                continue
+            try:
+                parameter_types = composer.factory.parameter_types()
+            except TypeError as e:
+                errors[f'Composer {composer.id}: {e}'] = None
+                continue
+
+            for parameter_type in parameter_types:
+                parameter_type = lazy_type(parameter_type) or parameter_type
+                for context in _separating_contexts(composer, parameter_type, composers, scope_type):
+                    template = validated.get((scope_type, context))
+                    if template is None:
+                        template = validated[(scope_type, context)] = templates.get(scope_type, context)
+                    chain = [template] if scope_type == RootType() else [template, root_template]
+                    error = _check_parameter(parameter_type, chain, composers, composer.scope_type)
+                    if error is not None:
+                        errors[f'Composer {composer.id} in scope type {scope_type} with context {context.values()}: {error}'] = None
+
+    validated[(RootType(), ScopeContext.empty())] = root_template
+    return list(errors), list(validated.values())
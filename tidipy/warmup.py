@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor, Future, FIRST_COMPLETED, wait
+from typing import Optional
+
+from .auto_factory import AutoFactory
+from .composer import Composer
+from .lazy import lazy_type
+from .scope import Scope
+
+_background = ThreadPoolExecutor(thread_name_prefix='tidipy-warmup')
+
+
+def _dependencies(scope: Scope, composer: Composer, composer_ids: set[str]) -> set[str]:
+    if not isinstance(composer.factory, AutoFactory):
+        return set()
+
+    dependencies = set()
+    try:
+        for parameter_type in composer.factory.parameter_types():
+            if lazy_type(parameter_type) is not None:
+                continue
+            dependency = scope.template().index.find(parameter_type, None)
+            if dependency is not None and dependency.id in composer_ids:
+                dependencies.add(dependency.id)
+    except Exception:
+        pass
+
+    return dependencies
+
+
+def _build(scope: Scope, composer: Composer) -> float:
+    start = time.perf_counter()
+    scope.resolver()(composer.dependency_type, id=composer.id)
+    return time.perf_counter() - start
+
+
+def _graph(scope: Scope) -> tuple[list[Composer], dict[str, set[str]], dict[str, list[Composer]]]:
+    composers = scope.stored_composers()
+    composer_ids = {composer.id for composer in composers}
+    dependencies = {composer.id: _dependencies(scope, composer, composer_ids) for composer in composers}
+    dependents: dict[str, list[Composer]] = {composer.id: [] for composer in composers}
+    for composer in composers:
+        for dependency_id in dependencies[composer.id]:
+            dependents[dependency_id].append(composer)
+
+    return composers, dependencies, dependents
+
+
+def _ready(composer: Composer, dependencies: dict[str, set[str]], dependents: dict[str, list[Composer]]) -> list[Composer]:
+    ready = []
+    for dependent in dependents[composer.id]:
+        dependencies[dependent.id].discard(composer.id)
+        if len(dependencies[dependent.id]) == 0:
+            ready.append(dependent)
+
+    return ready
+
+
+def warmup_scope(scope: Scope, max_workers: Optional[int] = None) -> dict[str, float]:
+    composers, dependencies, dependents = _graph(scope)
+
+    timings: dict[str, float] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        running: dict[Future, Composer] = {
+            executor.submit(_build, scope, composer): composer
+            for composer in composers
+            if len(dependencies[composer.id]) == 0
+        }
+        while len(running) > 0:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                composer = running.pop(future)
+                timings[composer.id] = future.result()
+                for dependent in _ready(composer, dependencies, dependents):
+                    running[executor.submit(_build, scope, dependent)] = dependent
+
+    for composer in composers:
+        if composer.id not in timings:
+            timings[composer.id] = _build(scope, composer)
+
+    return timings
+
+
+def warmup_in_background(scope: Scope, max_workers: Optional[int] = None) -> Future:
+    return _background.submit(warmup_scope, scope, max_workers)
+
+
+def _is_sync(scope: Scope, composer: Composer, memo: dict[str, bool]) -> bool:
+    if composer.kind.is_async():
+        return False
+    if not isinstance(composer.factory, AutoFactory):
+        return True
+    if composer.id in memo:
+        return memo[composer.id]
+
+    memo[composer.id] = False
+    try:
+        for parameter_type in composer.factory.parameter_types():
+            if lazy_type(parameter_type) is not None:
+                continue
+            dependency = scope.template().index.find(parameter_type, None)
+            if dependency is not None and not _is_sync(scope, dependency, memo):
+                return False
+    except Exception:
+        return False
+
+    memo[composer.id] = True
+    return True
+
+
+async def _abuild(scope: Scope, composer: Composer, offload: bool) -> float:
+    if offload:
+        return await asyncio.get_running_loop().run_in_executor(None, _build, scope, composer)
+
+    start = time.perf_counter()
+    await scope.resolver().aresolve(composer.dependency_type, id=composer.id)
+    return time.perf_counter() - start
+
+
+async def awarmup_scope(scope: Scope) -> dict[str, float]:
+    composers, dependencies, dependents = _graph(scope)
+    sync: dict[str, bool] = {}
+
+    def start(composer: Composer) -> asyncio.Future:
+        return asyncio.ensure_future(_abuild(scope, composer, _is_sync(scope, composer, sync)))
+
+    timings: dict[str, float] = {}
+    running: dict[asyncio.Future, Composer] = {
+        start(composer): composer
+        for composer in composers
+        if len(dependencies[composer.id]) == 0
+    }
+    try:
+        while len(running) > 0:
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                composer = running.pop(task)
+                timings[composer.id] = task.result()
+                for dependent in _ready(composer, dependencies, dependents):
+                    running[start(dependent)] = dependent
+    finally:
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+
+    for composer in composers:
+        if composer.id not in timings:
+            timings[composer.id] = await _abuild(scope, composer, _is_sync(scope, composer, sync))
+
+    return timings